@@ -0,0 +1,23 @@
+from grpc.aio import Channel
+
+
+class AsyncGRPCClient:
+    """
+    Базовый асинхронный gRPC-клиент поверх grpc.aio.
+
+    Модуль намеренно не импортирует clients.grpc.client, чтобы не включать интеграцию с gevent:
+    grpc.aio работает в собственном цикле событий asyncio.
+
+    grpc.aio несовместим с gevent monkey-patching, который Locust выполняет при импорте.
+    Для asyncio-запусков (в том числе с метриками Locust через build_*_async_locust_grpc_client)
+    процесс запускается с LOCUST_SKIP_MONKEY_PATCH=1 и GATEWAY_GRPC_CLIENT.GEVENT_ENABLED=false.
+    """
+
+    def __init__(self, channel: Channel):
+        self.channel = channel
+
+    async def close(self) -> None:
+        """
+        Закрывает gRPC-канал.
+        """
+        await self.channel.close()
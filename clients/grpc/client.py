@@ -2,7 +2,11 @@ import grpc.experimental.gevent as grpc_gevent
 
 from grpc import Channel
 
-grpc_gevent.init_gevent()
+from config import settings
+
+# Интеграция с gevent нужна синхронным клиентам под Locust; для сравнения с grpc.aio её можно выключить
+if settings.gateway_grpc_client.gevent_enabled:
+    grpc_gevent.init_gevent()
 
 class GRPCClient:
     def __init__(self, channel: Channel):
@@ -0,0 +1,131 @@
+from grpc.aio import Channel
+from locust.env import Environment
+from clients.grpc.async_client import AsyncGRPCClient
+from clients.grpc.gateway.async_client import build_gateway_async_grpc_client, build_gateway_async_locust_grpc_client
+from contracts.services.gateway.accounts.accounts_gateway_service_pb2_grpc import AccountsGatewayServiceStub
+from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import GetAccountsRequest, GetAccountsResponse
+from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import (
+    OpenCreditCardAccountRequest,
+    OpenCreditCardAccountResponse
+)
+from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import (
+    OpenDebitCardAccountRequest,
+    OpenDebitCardAccountResponse
+)
+from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import (
+    OpenDepositAccountRequest,
+    OpenDepositAccountResponse
+)
+from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import (
+    OpenSavingsAccountRequest,
+    OpenSavingsAccountResponse
+)
+
+
+class AccountsGatewayAsyncGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент (grpc.aio) для взаимодействия с AccountsGatewayService.
+    Предоставляет высокоуровневые методы для работы со счетами.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: асинхронный gRPC-канал для подключения к AccountsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = AccountsGatewayServiceStub(channel)
+
+    async def get_accounts_api(self, request: GetAccountsRequest) -> GetAccountsResponse:
+        """
+        Низкоуровневый вызов метода GetAccounts через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными счетов пользователя.
+        """
+        return await self.stub.GetAccounts(request)
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequest) -> OpenDepositAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDepositAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого депозитного счета.
+        """
+        return await self.stub.OpenDepositAccount(request)
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequest) -> OpenSavingsAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenSavingsAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого сберегательного счета.
+        """
+        return await self.stub.OpenSavingsAccount(request)
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequest) -> OpenDebitCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenDebitCardAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого дебетового счета.
+        """
+        return await self.stub.OpenDebitCardAccount(request)
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequest) -> OpenCreditCardAccountResponse:
+        """
+        Низкоуровневый вызов метода OpenCreditCardAccount через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя.
+        :return: Ответ от сервиса с данными открытого кредитного счета.
+        """
+        return await self.stub.OpenCreditCardAccount(request)
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponse:
+        request = GetAccountsRequest(user_id=user_id)
+        return await self.get_accounts_api(request)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
+        request = OpenDepositAccountRequest(user_id=user_id)
+        return await self.open_deposit_account_api(request)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponse:
+        request = OpenSavingsAccountRequest(user_id=user_id)
+        return await self.open_savings_account_api(request)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
+        request = OpenDebitCardAccountRequest(user_id=user_id)
+        return await self.open_debit_card_account_api(request)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
+        request = OpenCreditCardAccountRequest(user_id=user_id)
+        return await self.open_credit_card_account_api(request)
+
+
+def build_accounts_gateway_async_grpc_client() -> AccountsGatewayAsyncGRPCClient:
+    """
+    Фабрика для создания экземпляра AccountsGatewayAsyncGRPCClient.
+
+    :return: Инициализированный асинхронный клиент для AccountsGatewayService.
+    """
+    return AccountsGatewayAsyncGRPCClient(channel=build_gateway_async_grpc_client())
+
+
+def build_accounts_gateway_async_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> AccountsGatewayAsyncGRPCClient:
+    """
+    Функция создаёт экземпляр AccountsGatewayAsyncGRPCClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через AsyncLocustInterceptor.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :param channel: готовый асинхронный Locust-канал, общий для всех клиентов виртуального пользователя
+                    (если не передан, канал создаётся через build_gateway_async_locust_grpc_client).
+    :return: экземпляр AccountsGatewayAsyncGRPCClient с хуками сбора метрик.
+    """
+    return AccountsGatewayAsyncGRPCClient(channel=channel or build_gateway_async_locust_grpc_client(environment))
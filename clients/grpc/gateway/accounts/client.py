@@ -113,7 +113,10 @@ def build_accounts_gateway_grpc_client() -> AccountsGatewayGRPCClient:
     return AccountsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
 
-def build_accounts_gateway_locust_grpc_client(environment: Environment) -> AccountsGatewayGRPCClient:
+def build_accounts_gateway_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> AccountsGatewayGRPCClient:
     """
     Функция создаёт экземпляр AccountsGatewayGRPCClient адаптированного под Locust.
 
@@ -121,6 +124,8 @@ def build_accounts_gateway_locust_grpc_client(environment: Environment) -> Accou
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param channel: готовый Locust-канал, общий для всех клиентов виртуального пользователя
+                    (если не передан, канал создаётся через build_gateway_locust_grpc_client).
     :return: экземпляр AccountsGatewayGRPCClient с хуками сбора метрик.
     """
-    return AccountsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    return AccountsGatewayGRPCClient(channel=channel or build_gateway_locust_grpc_client(environment))
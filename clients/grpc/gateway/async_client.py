@@ -0,0 +1,32 @@
+from grpc.aio import Channel, insecure_channel
+from locust.env import Environment
+
+from clients.grpc.interceptors.async_locust_interceptor import AsyncLocustInterceptor
+from config import settings
+
+
+def build_gateway_async_grpc_client() -> Channel:
+    """
+    Фабричная функция (билдер) для создания асинхронного gRPC-канала (grpc.aio) к сервису grpc-gateway.
+
+    Канал нужно создавать внутри работающего цикла событий asyncio.
+
+    :return: Асинхронный gRPC-канал (grpc.aio.Channel).
+    """
+    return insecure_channel(settings.gateway_grpc_client.client_url)
+
+
+def build_gateway_async_locust_grpc_client(environment: Environment) -> Channel:
+    """
+    Фабричная функция для создания асинхронного gRPC-канала (grpc.aio), адаптированного для Locust.
+    В канал встраивается интерцептор AsyncLocustInterceptor, который регистрирует вызовы в метриках Locust.
+
+    Канал нужно создавать внутри работающего цикла событий asyncio.
+
+    :param environment: Среда выполнения Locust (необходима для отправки событий).
+    :return: Асинхронный gRPC-канал с интерцептором.
+    """
+    return insecure_channel(
+        settings.gateway_grpc_client.client_url,
+        interceptors=[AsyncLocustInterceptor(environment=environment)]
+    )
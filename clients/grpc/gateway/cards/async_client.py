@@ -0,0 +1,97 @@
+from grpc.aio import Channel
+from locust.env import Environment
+from clients.grpc.async_client import AsyncGRPCClient
+from clients.grpc.gateway.async_client import build_gateway_async_grpc_client, build_gateway_async_locust_grpc_client
+from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import (
+    IssueVirtualCardRequest,
+    IssueVirtualCardResponse
+)
+from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import (
+    IssuePhysicalCardRequest,
+    IssuePhysicalCardResponse
+)
+from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import CardsGatewayServiceStub
+
+
+class CardsGatewayAsyncGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент (grpc.aio) для взаимодействия с CardsGatewayService.
+    Предоставляет методы для выпуска виртуальных и физических карт.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: асинхронный gRPC-канал для подключения к CardsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = CardsGatewayServiceStub(channel)  # gRPC-стаб, сгенерированный из .proto
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequest) -> IssueVirtualCardResponse:
+        """
+        Низкоуровневый вызов метода IssueVirtualCard через gRPC.
+
+        :param request: gRPC-запрос с данными для выпуска виртуальной карты.
+        :return: Ответ от сервиса с данными выпущенной виртуальной карты.
+        """
+        return await self.stub.IssueVirtualCard(request)
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequest) -> IssuePhysicalCardResponse:
+        """
+        Низкоуровневый вызов метода IssuePhysicalCard через gRPC.
+
+        :param request: gRPC-запрос с данными для выпуска физической карты.
+        :return: Ответ от сервиса с данными выпущенной физической карты.
+        """
+        return await self.stub.IssuePhysicalCard(request)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponse:
+        """
+        Выпуск виртуальной карты для указанного пользователя и счета.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_id: Идентификатор счета.
+        :return: Ответ с информацией о выпущенной виртуальной карте.
+        """
+        request = IssueVirtualCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_virtual_card_api(request)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponse:
+        """
+        Выпуск физической карты для указанного пользователя и счета.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_id: Идентификатор счета.
+        :return: Ответ с информацией о выпущенной физической карте.
+        """
+        request = IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_physical_card_api(request)
+
+
+def build_cards_gateway_async_grpc_client() -> CardsGatewayAsyncGRPCClient:
+    """
+    Фабрика для создания экземпляра CardsGatewayAsyncGRPCClient.
+
+    :return: Инициализированный асинхронный клиент для CardsGatewayService.
+    """
+    return CardsGatewayAsyncGRPCClient(channel=build_gateway_async_grpc_client())
+
+
+def build_cards_gateway_async_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> CardsGatewayAsyncGRPCClient:
+    """
+    Функция создаёт экземпляр CardsGatewayAsyncGRPCClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через AsyncLocustInterceptor.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :param channel: готовый асинхронный Locust-канал, общий для всех клиентов виртуального пользователя
+                    (если не передан, канал создаётся через build_gateway_async_locust_grpc_client).
+    :return: экземпляр CardsGatewayAsyncGRPCClient с хуками сбора метрик.
+    """
+    return CardsGatewayAsyncGRPCClient(channel=channel or build_gateway_async_locust_grpc_client(environment))
@@ -1,4 +1,4 @@
-from grpc import Channel
+from grpc import Channel, Future
 from locust.env import Environment
 from clients.grpc.client import GRPCClient
 from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_locust_grpc_client
@@ -47,6 +47,26 @@ class CardsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.IssuePhysicalCard(request)
 
+    def build_issue_virtual_card_request(self, user_id: str, account_id: str) -> IssueVirtualCardRequest:
+        """
+        Формирует запрос на выпуск виртуальной карты. Используется и блокирующим, и неблокирующим вызовом.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_id: Идентификатор счета.
+        :return: gRPC-запрос IssueVirtualCardRequest.
+        """
+        return IssueVirtualCardRequest(user_id=user_id, account_id=account_id)
+
+    def build_issue_physical_card_request(self, user_id: str, account_id: str) -> IssuePhysicalCardRequest:
+        """
+        Формирует запрос на выпуск физической карты. Используется и блокирующим, и неблокирующим вызовом.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_id: Идентификатор счета.
+        :return: gRPC-запрос IssuePhysicalCardRequest.
+        """
+        return IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
+
     def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponse:
         """
         Выпуск виртуальной карты для указанного пользователя и счета.
@@ -55,7 +75,7 @@ class CardsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета.
         :return: Ответ с информацией о выпущенной виртуальной карте.
         """
-        request = IssueVirtualCardRequest(user_id=user_id, account_id=account_id)
+        request = self.build_issue_virtual_card_request(user_id=user_id, account_id=account_id)
         return self.issue_virtual_card_api(request)
 
     def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponse:
@@ -66,9 +86,32 @@ class CardsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета.
         :return: Ответ с информацией о выпущенной физической карте.
         """
-        request = IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
+        request = self.build_issue_physical_card_request(user_id=user_id, account_id=account_id)
         return self.issue_physical_card_api(request)
 
+    def issue_virtual_card_future(self, user_id: str, account_id: str) -> Future:
+        """
+        Неблокирующий выпуск виртуальной карты: запрос отправляется сразу, ответ забирается через result().
+        Позволяет отправить несколько запросов подряд и дождаться их вместе.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_id: Идентификатор счета.
+        :return: grpc.Future с IssueVirtualCardResponse.
+        """
+        request = self.build_issue_virtual_card_request(user_id=user_id, account_id=account_id)
+        return self.stub.IssueVirtualCard.future(request)
+
+    def issue_physical_card_future(self, user_id: str, account_id: str) -> Future:
+        """
+        Неблокирующий выпуск физической карты: запрос отправляется сразу, ответ забирается через result().
+
+        :param user_id: Идентификатор пользователя.
+        :param account_id: Идентификатор счета.
+        :return: grpc.Future с IssuePhysicalCardResponse.
+        """
+        request = self.build_issue_physical_card_request(user_id=user_id, account_id=account_id)
+        return self.stub.IssuePhysicalCard.future(request)
+
 
 def build_cards_gateway_grpc_client() -> CardsGatewayGRPCClient:
     """
@@ -78,7 +121,10 @@ def build_cards_gateway_grpc_client() -> CardsGatewayGRPCClient:
     """
     return CardsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
-def build_cards_gateway_locust_grpc_client(environment: Environment) -> CardsGatewayGRPCClient:
+def build_cards_gateway_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> CardsGatewayGRPCClient:
     """
     Функция создаёт экземпляр CardsGatewayGRPCClient адаптированного под Locust.
 
@@ -86,6 +132,8 @@ def build_cards_gateway_locust_grpc_client(environment: Environment) -> CardsGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param channel: готовый Locust-канал, общий для всех клиентов виртуального пользователя
+                    (если не передан, канал создаётся через build_gateway_locust_grpc_client).
     :return: экземпляр CardsGatewayGRPCClient с хуками сбора метрик.
     """
-    return CardsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
\ No newline at end of file
+    return CardsGatewayGRPCClient(channel=channel or build_gateway_locust_grpc_client(environment))
\ No newline at end of file
@@ -2,8 +2,15 @@ from grpc import Channel, insecure_channel, intercept_channel
 from locust.env import Environment
 
 from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
+from clients.grpc.pool import GRPCChannelPool
 from config import settings
 
+# Общий на процесс пул каналов к grpc-gateway для Locust-клиентов (размер — GATEWAY_GRPC_CLIENT.CHANNEL_POOL_SIZE)
+gateway_channel_pool = GRPCChannelPool(
+    target=settings.gateway_grpc_client.client_url,
+    size=settings.gateway_grpc_client.channel_pool_size
+)
+
 def build_gateway_grpc_client() -> Channel:
     """
     Фабричная функция (билдер) для создания gRPC-канала к сервису grpc-gateway.
@@ -19,12 +26,16 @@ def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
     В канал автоматически встраивается интерцептор LocustInterceptor,
     который регистрирует вызовы в системе метрик Locust.
 
+    Базовый канал берётся из общего пула gateway_channel_pool, поэтому при включённом пуле
+    виртуальные пользователи делят между собой ограниченное число соединений.
+    Один канал рассчитан на всех клиентов одного виртуального пользователя.
+
     :param environment: Среда выполнения Locust (необходима для отправки событий).
     :return: gRPC-канал с интерцептором, пригодный для нагрузочного тестирования.
     """
     # Создаём экземпляр интерцептора, передаём в него окружение Locust
     locust_interceptor = LocustInterceptor(environment=environment)
 
-    # Создаём обычный канал
-    channel = insecure_channel(settings.gateway_grpc_client.client_url)
+    # Берём канал из пула (или открываем новый, если пул отключён)
+    channel = gateway_channel_pool.acquire()
     return intercept_channel(channel, locust_interceptor)
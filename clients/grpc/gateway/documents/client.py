@@ -65,7 +65,10 @@ def build_documents_gateway_grpc_client() -> DocumentsGatewayGRPCClient:
     return DocumentsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
 
-def build_documents_gateway_locust_grpc_client(environment: Environment) -> DocumentsGatewayGRPCClient:
+def build_documents_gateway_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> DocumentsGatewayGRPCClient:
     """
     Функция создаёт экземпляр DocumentsGatewayGRPCClient адаптированного под Locust.
 
@@ -73,6 +76,8 @@ def build_documents_gateway_locust_grpc_client(environment: Environment) -> Docu
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param channel: готовый Locust-канал, общий для всех клиентов виртуального пользователя
+                    (если не передан, канал создаётся через build_gateway_locust_grpc_client).
     :return: экземпляр DocumentsGatewayGRPCClient с хуками сбора метрик.
     """
-    return DocumentsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    return DocumentsGatewayGRPCClient(channel=channel or build_gateway_locust_grpc_client(environment))
@@ -1,4 +1,5 @@
 from locust import TaskSet, SequentialTaskSet
+from clients.grpc.gateway.client import build_gateway_locust_grpc_client
 from clients.grpc.gateway.users.client import (build_users_gateway_locust_grpc_client,
     UsersGatewayGRPCClient)
 from clients.grpc.gateway.cards.client import (build_cards_gateway_locust_grpc_client,
@@ -29,11 +30,14 @@ class GatewayGRPCTaskSet(TaskSet):
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
         """
-        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
+        # Один канал на все клиенты виртуального пользователя
+        channel = build_gateway_locust_grpc_client(self.user.environment)
+
+        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment, channel)
+        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment, channel)
+        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment, channel)
+        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment, channel)
+        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment, channel)
 
 
 
@@ -53,8 +57,11 @@ class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
         """
         Создание API клиентов для последовательного сценария.
         """
-        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
\ No newline at end of file
+        # Один канал на все клиенты виртуального пользователя
+        channel = build_gateway_locust_grpc_client(self.user.environment)
+
+        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment, channel)
+        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment, channel)
+        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment, channel)
+        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment, channel)
+        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment, channel)
\ No newline at end of file
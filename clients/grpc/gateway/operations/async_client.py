@@ -0,0 +1,344 @@
+from grpc.aio import Channel
+from locust.env import Environment
+from clients.grpc.async_client import AsyncGRPCClient
+from clients.grpc.gateway.async_client import build_gateway_async_grpc_client, build_gateway_async_locust_grpc_client
+from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import OperationsGatewayServiceStub
+from contracts.services.gateway.operations.rpc_get_operation_pb2 import GetOperationRequest, GetOperationResponse
+from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import (
+    GetOperationReceiptRequest,
+    GetOperationReceiptResponse
+)
+from contracts.services.gateway.operations.rpc_get_operations_pb2 import GetOperationsRequest, GetOperationsResponse
+from contracts.services.gateway.operations.rpc_get_operations_summary_pb2 import (
+    GetOperationsSummaryRequest,
+    GetOperationsSummaryResponse
+)
+from contracts.services.gateway.operations.rpc_make_fee_operation_pb2 import (
+    MakeFeeOperationRequest,
+    MakeFeeOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import (
+    MakeTopUpOperationRequest,
+    MakeTopUpOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_cashback_operation_pb2 import (
+    MakeCashbackOperationRequest,
+    MakeCashbackOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import (
+    MakeTransferOperationRequest,
+    MakeTransferOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import (
+    MakePurchaseOperationRequest,
+    MakePurchaseOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_bill_payment_operation_pb2 import (
+    MakeBillPaymentOperationRequest,
+    MakeBillPaymentOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
+    MakeCashWithdrawalOperationRequest,
+    MakeCashWithdrawalOperationResponse
+)
+from contracts.services.operations.operation_pb2 import OperationStatus
+from tools.fakers import fake
+
+
+class OperationsGatewayAsyncGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент (grpc.aio) для взаимодействия с OperationsGatewayService.
+    Предоставляет высокоуровневые методы для работы с операциями: получение информации об операциях,
+    создание различных типов операций, получение статистики и чеков.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: асинхронный gRPC-канал для подключения к OperationsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = OperationsGatewayServiceStub(channel)
+
+    async def get_operation_api(self, request: GetOperationRequest) -> GetOperationResponse:
+        """
+        Низкоуровневый вызов метода GetOperation через gRPC.
+
+        :param request: gRPC-запрос с ID операции.
+        :return: Ответ от сервиса с данными операции.
+        """
+        return await self.stub.GetOperation(request)
+
+    async def get_operation_receipt_api(self, request: GetOperationReceiptRequest) -> GetOperationReceiptResponse:
+        """
+        Низкоуровневый вызов метода GetOperationReceipt через gRPC.
+
+        :param request: gRPC-запрос с ID операции для получения чека.
+        :return: Ответ от сервиса с данными чека операции.
+        """
+        return await self.stub.GetOperationReceipt(request)
+
+    async def get_operations_api(self, request: GetOperationsRequest) -> GetOperationsResponse:
+        """
+        Низкоуровневый вызов метода GetOperations через gRPC.
+
+        :param request: gRPC-запрос с параметрами для получения списка операций.
+        :return: Ответ от сервиса со списком операций счета.
+        """
+        return await self.stub.GetOperations(request)
+
+    async def get_operations_summary_api(self, request: GetOperationsSummaryRequest) -> GetOperationsSummaryResponse:
+        """
+        Низкоуровневый вызов метода GetOperationsSummary через gRPC.
+
+        :param request: gRPC-запрос с параметрами для получения статистики по операциям.
+        :return: Ответ от сервиса со статистикой операций счета.
+        """
+        return await self.stub.GetOperationsSummary(request)
+
+    async def make_fee_operation_api(self, request: MakeFeeOperationRequest) -> MakeFeeOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeFeeOperation через gRPC.
+
+        :param request: gRPC-запрос с данными для создания операции комиссии.
+        :return: Ответ от сервиса с результатом создания операции.
+        """
+        return await self.stub.MakeFeeOperation(request)
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequest) -> MakeTopUpOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeTopUpOperation через gRPC.
+
+        :param request: gRPC-запрос с данными для создания операции пополнения.
+        :return: Ответ от сервиса с результатом создания операции.
+        """
+        return await self.stub.MakeTopUpOperation(request)
+
+    async def make_cashback_operation_api(self, request: MakeCashbackOperationRequest) -> MakeCashbackOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeCashbackOperation через gRPC.
+
+        :param request: gRPC-запрос с данными для создания операции кэшбэка.
+        :return: Ответ от сервиса с результатом создания операции.
+        """
+        return await self.stub.MakeCashbackOperation(request)
+
+    async def make_transfer_operation_api(self, request: MakeTransferOperationRequest) -> MakeTransferOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeTransferOperation через gRPC.
+
+        :param request: gRPC-запрос с данными для создания операции перевода.
+        :return: Ответ от сервиса с результатом создания операции.
+        """
+        return await self.stub.MakeTransferOperation(request)
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequest) -> MakePurchaseOperationResponse:
+        """
+        Низкоуровневый вызов метода MakePurchaseOperation через gRPC.
+
+        :param request: gRPC-запрос с данными для создания операции покупки.
+        :return: Ответ от сервиса с результатом создания операции.
+        """
+        return await self.stub.MakePurchaseOperation(request)
+
+    async def make_bill_payment_operation_api(self,
+                                              request: MakeBillPaymentOperationRequest) -> MakeBillPaymentOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeBillPaymentOperation через gRPC.
+
+        :param request: gRPC-запрос с данными для создания операции оплаты по счету.
+        :return: Ответ от сервиса с результатом создания операции.
+        """
+        return await self.stub.MakeBillPaymentOperation(request)
+
+    async def make_cash_withdrawal_operation_api(self,
+                                                 request: MakeCashWithdrawalOperationRequest) -> MakeCashWithdrawalOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeCashWithdrawalOperation через gRPC.
+
+        :param request: gRPC-запрос с данными для создания операции снятия наличных.
+        :return: Ответ от сервиса с результатом создания операции.
+        """
+        return await self.stub.MakeCashWithdrawalOperation(request)
+
+    async def get_operation(self, operation_id: str) -> GetOperationResponse:
+        """
+        Получить информацию об операции по её идентификатору (высокоуровневый метод).
+
+        :param operation_id: Идентификатор операции.
+        :return: Ответ с данными операции.
+        """
+        request = GetOperationRequest(id=operation_id)
+        return await self.get_operation_api(request)
+
+    async def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponse:
+        """
+        Получить чек операции по её идентификатору (высокоуровневый метод).
+
+        :param operation_id: Идентификатор операции.
+        :return: Ответ с данными чека операции.
+        """
+        request = GetOperationReceiptRequest(operation_id=operation_id)
+        return await self.get_operation_receipt_api(request)
+
+    async def get_operations(self, account_id: str) -> GetOperationsResponse:
+        """
+        Получить список операций счета (высокоуровневый метод).
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ со списком операций.
+        """
+        request = GetOperationsRequest(account_id=account_id)
+        return await self.get_operations_api(request)
+
+    async def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponse:
+        """
+        Получить статистику по операциям счета (высокоуровневый метод).
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ со статистикой операций.
+        """
+        request = GetOperationsSummaryRequest(account_id=account_id)
+        return await self.get_operations_summary_api(request)
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponse:
+        """
+        Создать операцию комиссии (высокоуровневый метод).
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: Ответ с созданной операцией.
+        """
+        request = MakeFeeOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return await self.make_fee_operation_api(request)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponse:
+        """
+        Создать операцию пополнения (высокоуровневый метод).
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: Ответ с созданной операцией.
+        """
+        request = MakeTopUpOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return await self.make_top_up_operation_api(request)
+
+    async def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponse:
+        """
+        Создать операцию кэшбэка (высокоуровневый метод).
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: Ответ с созданной операцией.
+        """
+        request = MakeCashbackOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return await self.make_cashback_operation_api(request)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponse:
+        """
+        Создать операцию перевода (высокоуровневый метод).
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: Ответ с созданной операцией.
+        """
+        request = MakeTransferOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return await self.make_transfer_operation_api(request)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponse:
+        """
+        Создать операцию покупки (высокоуровневый метод).
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: Ответ с созданной операцией.
+        """
+        request = MakePurchaseOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id,
+            category=fake.category()
+        )
+        return await self.make_purchase_operation_api(request)
+
+    async def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponse:
+        """
+        Создать операцию оплаты счета (высокоуровневый метод).
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: Ответ с созданной операцией.
+        """
+        request = MakeBillPaymentOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return await self.make_bill_payment_operation_api(request)
+
+    async def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponse:
+        """
+        Создать операцию снятия наличных (высокоуровневый метод).
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: Ответ с созданной операцией.
+        """
+        request = MakeCashWithdrawalOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return await self.make_cash_withdrawal_operation_api(request)
+
+
+def build_operations_gateway_async_grpc_client() -> OperationsGatewayAsyncGRPCClient:
+    """
+    Фабрика для создания экземпляра OperationsGatewayAsyncGRPCClient.
+
+    :return: Инициализированный асинхронный клиент для OperationsGatewayService.
+    """
+    return OperationsGatewayAsyncGRPCClient(channel=build_gateway_async_grpc_client())
+
+
+def build_operations_gateway_async_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> OperationsGatewayAsyncGRPCClient:
+    """
+    Функция создаёт экземпляр OperationsGatewayAsyncGRPCClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через AsyncLocustInterceptor.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :param channel: готовый асинхронный Locust-канал, общий для всех клиентов виртуального пользователя
+                    (если не передан, канал создаётся через build_gateway_async_locust_grpc_client).
+    :return: экземпляр OperationsGatewayAsyncGRPCClient с хуками сбора метрик.
+    """
+    return OperationsGatewayAsyncGRPCClient(channel=channel or build_gateway_async_locust_grpc_client(environment))
@@ -1,4 +1,4 @@
-from grpc import Channel
+from grpc import Channel, Future
 from locust.env import Environment
 from clients.grpc.client import GRPCClient
 from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_locust_grpc_client
@@ -163,6 +163,75 @@ class OperationsGatewayGRPCClient(GRPCClient):
         """
         return self.stub.MakeCashWithdrawalOperation(request)
 
+    def build_make_top_up_operation_request(self, card_id: str, account_id: str) -> MakeTopUpOperationRequest:
+        """
+        Формирует запрос на создание операции пополнения со случайными данными.
+        Используется и блокирующим, и неблокирующим вызовом.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: gRPC-запрос MakeTopUpOperationRequest.
+        """
+        return MakeTopUpOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+
+    def build_make_purchase_operation_request(self, card_id: str, account_id: str) -> MakePurchaseOperationRequest:
+        """
+        Формирует запрос на создание операции покупки со случайными данными.
+        Используется и блокирующим, и неблокирующим вызовом.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: gRPC-запрос MakePurchaseOperationRequest.
+        """
+        return MakePurchaseOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id,
+            category=fake.category()
+        )
+
+    def build_make_transfer_operation_request(self, card_id: str, account_id: str) -> MakeTransferOperationRequest:
+        """
+        Формирует запрос на создание операции перевода со случайными данными.
+        Используется и блокирующим, и неблокирующим вызовом.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: gRPC-запрос MakeTransferOperationRequest.
+        """
+        return MakeTransferOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+
+    def build_make_cash_withdrawal_operation_request(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> MakeCashWithdrawalOperationRequest:
+        """
+        Формирует запрос на создание операции снятия наличных со случайными данными.
+        Используется и блокирующим, и неблокирующим вызовом.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: gRPC-запрос MakeCashWithdrawalOperationRequest.
+        """
+        return MakeCashWithdrawalOperationRequest(
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            account_id=account_id
+        )
+
     def get_operation(self, operation_id: str) -> GetOperationResponse:
         """
         Получить информацию об операции по её идентификатору (высокоуровневый метод).
@@ -227,12 +296,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета.
         :return: Ответ с созданной операцией.
         """
-        request = MakeTopUpOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            account_id=account_id
-        )
+        request = self.build_make_top_up_operation_request(card_id=card_id, account_id=account_id)
         return self.make_top_up_operation_api(request)
 
     def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponse:
@@ -259,12 +323,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета.
         :return: Ответ с созданной операцией.
         """
-        request = MakeTransferOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            account_id=account_id
-        )
+        request = self.build_make_transfer_operation_request(card_id=card_id, account_id=account_id)
         return self.make_transfer_operation_api(request)
 
     def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponse:
@@ -275,13 +334,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета.
         :return: Ответ с созданной операцией.
         """
-        request = MakePurchaseOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            account_id=account_id,
-            category=fake.category()
-        )
+        request = self.build_make_purchase_operation_request(card_id=card_id, account_id=account_id)
         return self.make_purchase_operation_api(request)
 
     def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponse:
@@ -308,14 +361,54 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета.
         :return: Ответ с созданной операцией.
         """
-        request = MakeCashWithdrawalOperationRequest(
-            status=fake.proto_enum(OperationStatus),
-            amount=fake.amount(),
-            card_id=card_id,
-            account_id=account_id
-        )
+        request = self.build_make_cash_withdrawal_operation_request(card_id=card_id, account_id=account_id)
         return self.make_cash_withdrawal_operation_api(request)
 
+    def make_top_up_operation_future(self, card_id: str, account_id: str) -> Future:
+        """
+        Неблокирующее создание операции пополнения: запрос отправляется сразу, ответ забирается через result().
+        Позволяет отправить несколько запросов подряд и дождаться их вместе.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: grpc.Future с MakeTopUpOperationResponse.
+        """
+        request = self.build_make_top_up_operation_request(card_id=card_id, account_id=account_id)
+        return self.stub.MakeTopUpOperation.future(request)
+
+    def make_purchase_operation_future(self, card_id: str, account_id: str) -> Future:
+        """
+        Неблокирующее создание операции покупки: запрос отправляется сразу, ответ забирается через result().
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: grpc.Future с MakePurchaseOperationResponse.
+        """
+        request = self.build_make_purchase_operation_request(card_id=card_id, account_id=account_id)
+        return self.stub.MakePurchaseOperation.future(request)
+
+    def make_transfer_operation_future(self, card_id: str, account_id: str) -> Future:
+        """
+        Неблокирующее создание операции перевода: запрос отправляется сразу, ответ забирается через result().
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: grpc.Future с MakeTransferOperationResponse.
+        """
+        request = self.build_make_transfer_operation_request(card_id=card_id, account_id=account_id)
+        return self.stub.MakeTransferOperation.future(request)
+
+    def make_cash_withdrawal_operation_future(self, card_id: str, account_id: str) -> Future:
+        """
+        Неблокирующее создание операции снятия наличных: запрос отправляется сразу, ответ забирается через result().
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: grpc.Future с MakeCashWithdrawalOperationResponse.
+        """
+        request = self.build_make_cash_withdrawal_operation_request(card_id=card_id, account_id=account_id)
+        return self.stub.MakeCashWithdrawalOperation.future(request)
+
 
 def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
     """
@@ -325,7 +418,10 @@ def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
     """
     return OperationsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
-def build_operations_gateway_locust_grpc_client(environment: Environment) -> OperationsGatewayGRPCClient:
+def build_operations_gateway_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> OperationsGatewayGRPCClient:
     """
     Функция создаёт экземпляр OperationsGatewayGRPCClient адаптированного под Locust.
 
@@ -333,6 +429,8 @@ def build_operations_gateway_locust_grpc_client(environment: Environment) -> Ope
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param channel: готовый Locust-канал, общий для всех клиентов виртуального пользователя
+                    (если не передан, канал создаётся через build_gateway_locust_grpc_client).
     :return: экземпляр OperationsGatewayGRPCClient с хуками сбора метрик.
     """
-    return OperationsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
\ No newline at end of file
+    return OperationsGatewayGRPCClient(channel=channel or build_gateway_locust_grpc_client(environment))
\ No newline at end of file
@@ -79,7 +79,10 @@ def build_users_gateway_grpc_client() -> UsersGatewayGRPCClient:
 
 
 
-def build_users_gateway_locust_grpc_client(environment: Environment) -> UsersGatewayGRPCClient:
+def build_users_gateway_locust_grpc_client(
+        environment: Environment,
+        channel: Channel | None = None
+) -> UsersGatewayGRPCClient:
     """
     Функция создаёт экземпляр UsersGatewayGRPCClient адаптированного под Locust.
 
@@ -87,6 +90,8 @@ def build_users_gateway_locust_grpc_client(environment: Environment) -> UsersGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param channel: готовый Locust-канал, общий для всех клиентов виртуального пользователя
+                    (если не передан, канал создаётся через build_gateway_locust_grpc_client).
     :return: экземпляр UsersGatewayGRPCClient с хуками сбора метрик.
     """
-    return UsersGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    return UsersGatewayGRPCClient(channel=channel or build_gateway_locust_grpc_client(environment))
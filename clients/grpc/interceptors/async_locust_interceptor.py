@@ -0,0 +1,55 @@
+import time
+
+from grpc import RpcError
+from grpc.aio import UnaryUnaryClientInterceptor
+from locust.env import Environment
+
+
+class AsyncLocustInterceptor(UnaryUnaryClientInterceptor):
+    """
+    Асинхронный (grpc.aio) аналог LocustInterceptor.
+    Измеряет время выполнения вызовов и отправляет в Locust те же метрики, что и синхронный интерцептор.
+    """
+
+    def __init__(self, environment: Environment):
+        """
+        :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+        """
+        self.environment = environment
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-unary вызовов grpc.aio.
+
+        :param continuation: Корутина, выполняющая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: Объект вызова grpc.aio (awaitable, возвращающий ответ).
+        """
+        call = None
+        exception: RpcError | None = None
+        start_time = time.perf_counter()
+        response_length = 0
+
+        try:
+            call = await continuation(client_call_details, request)
+            # Дожидаемся ответа: только так известны время выполнения и размер ответа
+            response_length = (await call).ByteSize()
+        except RpcError as error:
+            exception = error
+
+        method = client_call_details.method
+        self.environment.events.request.fire(
+            name=method.decode() if isinstance(method, bytes) else method,
+            context=None,
+            response=call,
+            exception=exception,
+            request_type="gRPC",
+            response_time=(time.perf_counter() - start_time) * 1000,
+            response_length=response_length,
+        )
+
+        if exception is not None and call is None:
+            raise exception
+
+        return call
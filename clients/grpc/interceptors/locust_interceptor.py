@@ -3,6 +3,8 @@ import time
 from grpc import RpcError, UnaryUnaryClientInterceptor
 from locust.env import Environment
 
+from tools.locust.schedule import pop_intended_start, record_schedule_lag
+
 
 class LocustInterceptor(UnaryUnaryClientInterceptor):
     """
@@ -20,36 +22,49 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         """
         Метод-перехватчик для unary-unary gRPC вызовов.
 
+        Интерцептор не ждёт ответа: метрика отправляется из колбэка завершения вызова.
+        Поэтому вызовы через stub.Method.future() остаются неблокирующими, и несколько
+        одновременных запросов одного виртуального пользователя измеряются независимо.
+        Для обычных блокирующих вызовов колбэк срабатывает сразу, так как ответ уже получен.
+
         :param continuation: Функция, вызывающая фактический gRPC метод.
         :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
         :param request: Объект запроса, отправляемый на сервер.
         :return: gRPC response (future объект).
         """
-        response = None
-        exception: RpcError | None = None
         start_time = time.perf_counter()  # Засекаем время начала запроса
-        response_length = 0
-
-        try:
-            # Выполняем gRPC вызов и получаем response future
-            response = continuation(client_call_details, request)
-
-            # Получаем размер ответа, если он уже доступен (для метрик)
-            response_length = response.result().ByteSize()
-        except RpcError as error:
-            # В случае ошибки сохраняем исключение для метрик
-            exception = error
-
-        # Регистрируем вызов в системе метрик Locust
-        self.environment.events.request.fire(
-            name=client_call_details.method,  # Имя метода (например, "/users.UsersService/CreateUser")
-            context=None,  # Можно использовать для передачи кастомных данных
-            response=response,  # Объект ответа (если нужен для контекста)
-            exception=exception,  # Если произошла ошибка — передаём её сюда
-            request_type="gRPC",  # Тип запроса (например, "HTTP", "gRPC")
-            response_time=(time.perf_counter() - start_time) * 1000,  # Время выполнения в миллисекундах
-            response_length=response_length,  # Размер ответа в байтах
-        )
+        # В open-модели первый вызов задачи измеряется от запланированного старта задачи
+        intended_start = pop_intended_start()
+
+        def on_done(future) -> None:
+            exception: RpcError | None = None
+            response_length = 0
+
+            if future.cancelled():
+                exception = RpcError("gRPC call cancelled")
+            else:
+                exception = future.exception()
+                if exception is None:
+                    # Размер ответа (для метрик); ответ уже получен, result() не блокирует
+                    response_length = future.result().ByteSize()
+
+            # Регистрируем вызов в системе метрик Locust
+            self.environment.events.request.fire(
+                name=client_call_details.method,  # Имя метода (например, "/users.UsersService/CreateUser")
+                context=None,  # Можно использовать для передачи кастомных данных
+                response=future,  # Объект ответа (если нужен для контекста)
+                exception=exception,  # Если произошла ошибка — передаём её сюда
+                request_type="gRPC",  # Тип запроса (например, "HTTP", "gRPC")
+                response_time=(time.perf_counter() - (intended_start or start_time)) * 1000,  # Время в мс
+                response_length=response_length,  # Размер ответа в байтах
+            )
+
+            if intended_start is not None:
+                record_schedule_lag(self.environment, max(0.0, (start_time - intended_start) * 1000))
+
+        # Выполняем gRPC вызов и получаем response future
+        response = continuation(client_call_details, request)
+        response.add_done_callback(on_done)
 
         # Возвращаем результат вызова (future-объект)
         return response
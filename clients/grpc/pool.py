@@ -0,0 +1,59 @@
+from itertools import count
+
+from grpc import Channel, insecure_channel
+
+
+class GRPCChannelPool:
+    """
+    Общий на процесс пул gRPC-каналов с раздачей по кругу (round-robin).
+
+    Каналы открываются лениво при первой выдаче и живут до конца процесса.
+    Каждый канал пула получает собственный пул подканалов (grpc.use_local_subchannel_pool),
+    иначе gRPC объединил бы одинаково настроенные каналы в одно TCP-соединение.
+    При отключённом пуле каналы открываются как раньше и делят глобальный пул подканалов gRPC.
+    """
+
+    def __init__(self, target: str, size: int):
+        """
+        :param target: Адрес сервиса (host:port).
+        :param size: Количество каналов в пуле; 0 — пул отключён, каждый вызов acquire() открывает новый канал.
+        """
+        self.target = target
+        self.size = size
+        self.channels: list[Channel] = []
+        self.counter = count()
+
+    def open_channel(self) -> Channel:
+        """
+        Открывает новый канал: для пула — с собственным пулом подканалов, без пула — обычный.
+
+        :return: gRPC-канал.
+        """
+        if self.size <= 0:
+            return insecure_channel(self.target)
+
+        return insecure_channel(self.target, options=[("grpc.use_local_subchannel_pool", 1)])
+
+    def acquire(self) -> Channel:
+        """
+        Возвращает следующий канал пула по кругу.
+
+        :return: gRPC-канал (общий для нескольких вызывающих, если пул включён).
+        """
+        if self.size <= 0:
+            return self.open_channel()
+
+        index = next(self.counter) % self.size
+        # Под Locust код выполняется в гринлетах одного потока, поэтому дозаполнение списка без блокировки безопасно
+        while len(self.channels) <= index:
+            self.channels.append(self.open_channel())
+
+        return self.channels[index]
+
+    def close(self) -> None:
+        """
+        Закрывает все открытые каналы пула.
+        """
+        for channel in self.channels:
+            channel.close()
+        self.channels.clear()
@@ -1,6 +1,18 @@
-from typing import Any, TypedDict
+import itertools
+from typing import Any, Generic, TypedDict, TypeVar, Union
 
-from httpx import Client, Response, QueryParams, URL
+from httpx import AsyncClient, Client, Response, QueryParams, URL
+from pydantic import BaseModel
+
+from tools.config.http import HTTPResponseParsePolicy
+from tools.logger import get_logger
+
+T = TypeVar("T", bound=BaseModel)
+
+logger = get_logger("HTTP_RESPONSE_PARSER")
+
+# Заголовки запроса с телом, сериализованным в JSON заранее (см. serialize_model)
+JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 # Тип расширений, которые можно передать в запрос
@@ -9,15 +21,125 @@ class HTTPClientExtensions(TypedDict, total=False):
     route: str
 
 
+def serialize_model(model: BaseModel) -> bytes:
+    """
+    Сериализует pydantic-модель запроса сразу в JSON-байты (с alias-ами полей).
+
+    Сериализатор модели скомпилирован pydantic-core при создании класса (включая отображение полей на alias-ы),
+    поэтому промежуточный dict (model_dump) и повторная сериализация через stdlib json в httpx не нужны.
+
+    :param model: Pydantic-модель тела запроса.
+    :return: Тело запроса в JSON.
+    """
+    return model.__pydantic_serializer__.to_json(model, by_alias=True)
+
+
+class LazyResponseSchema(Generic[T]):
+    """
+    Ответ, который хранит тело в байтах и валидирует его схемой только при первом обращении к полям.
+    Если сценарий ответ не читает, на разбор не тратится процессорное время.
+    """
+    __slots__ = ("schema", "content", "parsed")
+
+    def __init__(self, schema: type[T], content: bytes):
+        """
+        :param schema: Pydantic-схема ответа.
+        :param content: Тело ответа.
+        """
+        self.schema = schema
+        self.content = content
+        self.parsed: T | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self.parsed is None:
+            self.parsed = self.schema.model_validate_json(self.content)
+        return getattr(self.parsed, name)
+
+
+class RawResponseSchema(LazyResponseSchema[T]):
+    """
+    Ответ политики raw: тело доступно в байтах через content и не разбирается, пока сценарий его не читает.
+    Если сценарий всё же обращается к полям ответа (например, create_user_response.user.id), ответ
+    разбирается лениво, как в политике lazy, а в лог один раз на схему пишется предупреждение,
+    что для такого сценария raw не даёт выигрыша.
+    """
+    __slots__ = ()
+
+    # Схемы, для которых уже предупредили о чтении полей при политике raw
+    warned_schemas: set[type[BaseModel]] = set()
+
+    def __getattr__(self, name: str) -> Any:
+        if self.parsed is None and self.schema not in self.warned_schemas:
+            self.warned_schemas.add(self.schema)
+            logger.warning(
+                f"Response {self.schema.__name__} is read by the scenario under the raw parse policy, "
+                f"falling back to lazy parsing"
+            )
+        return super().__getattr__(name)
+
+
+# Результат высокоуровневого метода клиента: модель ответа или ленивая обёртка над его телом (lazy, sampled, raw).
+# Обёртка отдаёт те же поля, что и модель, но не является её экземпляром
+ParsedResponse = Union[T, LazyResponseSchema[T]]
+
+
+class HTTPResponseParser:
+    """
+    Разбор ответов высокоуровневых методов клиента по политике HTTPResponseParsePolicy.
+
+    Ответ валидируется из байтов (response.content), без декодирования в строку через response.text.
+    model_construct не используется: рекурсивная сборка вложенных моделей в Python медленнее,
+    чем валидация pydantic-core, поэтому "без валидации" реализовано как ленивый разбор (lazy).
+    """
+
+    def __init__(self, policy: HTTPResponseParsePolicy = HTTPResponseParsePolicy.FULL, sample_rate: int = 100):
+        """
+        :param policy: Политика разбора ответов.
+        :param sample_rate: Для sampled — валидировать каждый N-й ответ.
+        """
+        self.policy = policy
+        self.sample_rate = max(sample_rate, 1)
+        self.counter = itertools.count()
+
+    def parse(self, response: Response, schema: type[T]) -> ParsedResponse[T]:
+        """
+        :param response: Ответ httpx (тело уже прочитано).
+        :param schema: Pydantic-схема ответа.
+        :return: Модель ответа; для lazy и пропущенных sampled — LazyResponseSchema, для raw — RawResponseSchema.
+        """
+        if self.policy == HTTPResponseParsePolicy.FULL:
+            return schema.model_validate_json(response.content)
+
+        if self.policy == HTTPResponseParsePolicy.RAW:
+            return RawResponseSchema(schema, response.content)
+
+        if self.policy == HTTPResponseParsePolicy.SAMPLED and next(self.counter) % self.sample_rate == 0:
+            return schema.model_validate_json(response.content)
+
+        return LazyResponseSchema(schema, response.content)
+
+
 class HTTPClient:
     """
     Базовый HTTP API клиент, принимающий объект httpx.Client.
 
     :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param parser: разбор ответов высокоуровневых методов (по умолчанию полная валидация)
     """
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: Client, parser: HTTPResponseParser | None = None) -> None:
         self.client = client
+        self.parser = parser or HTTPResponseParser()
+
+    def parse_response(self, response: Response, schema: type[T]) -> ParsedResponse[T]:
+        """
+        Разбирает ответ схемой по политике клиента (см. HTTPResponseParser).
+
+        :param response: Ответ httpx.
+        :param schema: Pydantic-схема ответа.
+        :return: Модель ответа или ленивая обёртка над ним (см. ParsedResponse).
+        """
+        return self.parser.parse(response, schema)
 
     def get(
             self,
@@ -39,6 +161,7 @@ class HTTPClient:
             self,
             url: str | URL,
             json: Any | None = None,
+            model: BaseModel | None = None,
             extensions: HTTPClientExtensions | None = None  # Поддержка extensions для POST-запросов
     ) -> Response:
         """
@@ -46,7 +169,89 @@ class HTTPClient:
 
         :param url: URL-адрес эндпоинта.
         :param json: Данные в формате JSON.
+        :param model: Pydantic-модель тела запроса, сериализуется сразу в байты (вместо json).
         :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
         :return: Объект Response с данными ответа.
         """
+        if model is not None:
+            return self.client.post(
+                url=url,
+                content=serialize_model(model),
+                headers=JSON_HEADERS,
+                extensions=extensions
+            )
+
         return self.client.post(url=url, json=json, extensions=extensions)  # extensions передаётся в httpx.Client
+
+
+class AsyncHTTPClient:
+    """
+    Асинхронный аналог HTTPClient, принимающий объект httpx.AsyncClient.
+
+    Позволяет держать сотни запросов "в полёте" в одном процессе без отдельного потока на каждый запрос.
+
+    :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+    :param parser: разбор ответов высокоуровневых методов (по умолчанию полная валидация)
+    """
+
+    def __init__(self, client: AsyncClient, parser: HTTPResponseParser | None = None) -> None:
+        self.client = client
+        self.parser = parser or HTTPResponseParser()
+
+    def parse_response(self, response: Response, schema: type[T]) -> ParsedResponse[T]:
+        """
+        Разбирает ответ схемой по политике клиента (см. HTTPResponseParser).
+
+        :param response: Ответ httpx (асинхронный клиент возвращает его с уже прочитанным телом).
+        :param schema: Pydantic-схема ответа.
+        :return: Модель ответа или ленивая обёртка над ним (см. ParsedResponse).
+        """
+        return self.parser.parse(response, schema)
+
+    async def get(
+            self,
+            url: str | URL,
+            params: QueryParams | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.get(url=url, params=params, extensions=extensions)
+
+    async def post(
+            self,
+            url: str | URL,
+            json: Any | None = None,
+            model: BaseModel | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON.
+        :param model: Pydantic-модель тела запроса, сериализуется сразу в байты (вместо json).
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        if model is not None:
+            return await self.client.post(
+                url=url,
+                content=serialize_model(model),
+                headers=JSON_HEADERS,
+                extensions=extensions
+            )
+
+        return await self.client.post(url=url, json=json, extensions=extensions)
+
+    async def close(self) -> None:
+        """
+        Закрывает пул соединений httpx.AsyncClient.
+        """
+        await self.client.aclose()
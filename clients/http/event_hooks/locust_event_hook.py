@@ -1,55 +1,183 @@
 import time
+from typing import AsyncIterator, Callable, Iterator
 
-from httpx import Request, Response, HTTPStatusError, HTTPError
+from httpx import Request, Response, HTTPStatusError, HTTPError, SyncByteStream, AsyncByteStream
 from locust.env import Environment
 
+from tools.config.http import HTTPResponseLengthMode
+from tools.locust.schedule import pop_intended_start, record_schedule_lag
+from tools.locust.service_stats import record_service_metric, HTTP_PHASE_REQUEST_TYPE
 
-def locust_request_event_hook(request: Request) -> None:
+# Шаги трассировки httpcore (extensions["trace"]) и фазы запроса, в которые они складываются.
+# DNS-резолвинг httpcore отдельно не трассирует, он входит в connect.
+HTTP_TRACE_PHASES = {
+    "connect_tcp": "connect",
+    "start_tls": "tls",
+    "send_request_headers": "send",
+    "send_request_body": "send",
+    "receive_response_headers": "wait",  # Ожидание ответа сервера (TTFB)
+    "receive_response_body": "receive",
+}
+
+
+class LocustRequestTrace:
     """
-    HTTPX event hook, вызываемый перед отправкой запроса.
+    Обработчик httpx-расширения "trace": по событиям транспорта httpcore
+    считает длительность фаз запроса (connect, tls, send, wait, receive) в миллисекундах.
+    """
+
+    def __init__(self):
+        self.started: dict[str, float] = {}
+        self.phases: dict[str, float] = {}
 
-    Сохраняет текущее время в `request.extensions["start_time"]`,
-    чтобы потом использовать его для расчёта времени ответа.
+    def record(self, event: str, info: dict) -> None:
+        """
+        :param event: Имя события вида "http11.send_request_headers.started".
+        :param info: Данные события (не используются).
+        """
+        step, _, state = event.split(".", 1)[-1].rpartition(".")
+        phase = HTTP_TRACE_PHASES.get(step)
+        if phase is None:
+            return
+
+        now = time.perf_counter()
+        if state == "started":
+            self.started[step] = now
+        elif step in self.started:
+            self.phases[phase] = self.phases.get(phase, 0.0) + (now - self.started.pop(step)) * 1000
+
+    def __call__(self, event: str, info: dict) -> None:
+        self.record(event, info)
+
+
+class AsyncLocustRequestTrace(LocustRequestTrace):
+    """
+    Вариант LocustRequestTrace для httpx.AsyncClient: httpcore ожидает асинхронный обработчик trace.
     """
-    request.extensions["start_time"] = time.time()
+
+    async def __call__(self, event: str, info: dict) -> None:
+        self.record(event, info)
 
 
-def locust_response_event_hook(environment: Environment):
+class LocustCountingByteStream(SyncByteStream):
+    """
+    Обёртка над потоком тела ответа, которая считает байты по мере чтения вызывающим кодом
+    и сообщает итоговую длину при закрытии потока. Тело при этом не буферизуется повторно.
     """
-    Возвращает HTTPX event hook, вызываемый после получения ответа.
 
-    Использует `request.extensions["start_time"]` для вычисления времени отклика.
-    Извлекает route из `request.extensions["route"]`, если задан.
-    Отправляет собранные метрики в `environment.events.request`, чтобы Locust мог агрегировать статистику.
+    def __init__(self, stream: SyncByteStream, on_close: Callable[[int], None]):
+        """
+        :param stream: Исходный поток тела ответа.
+        :param on_close: Функция, получающая количество прочитанных байтов при закрытии потока.
+        """
+        self.stream = stream
+        self.on_close = on_close
+        self.length = 0
 
-    :param environment: Объект окружения Locust, через который отправляются метрики.
-    :return: Функция-хук для HTTPX response event hook.
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.stream:
+            self.length += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self.stream.close()
+        finally:
+            self.on_close(self.length)
+
+
+class AsyncLocustCountingByteStream(AsyncByteStream):
+    """
+    Асинхронный аналог LocustCountingByteStream для httpx.AsyncClient.
     """
 
-    def inner(response: Response) -> None:
-        exception: HTTPError | HTTPStatusError | None = None
+    def __init__(self, stream: AsyncByteStream, on_close: Callable[[int], None]):
+        """
+        :param stream: Исходный асинхронный поток тела ответа.
+        :param on_close: Функция, получающая количество прочитанных байтов при закрытии потока.
+        """
+        self.stream = stream
+        self.on_close = on_close
+        self.length = 0
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self.stream:
+            self.length += len(chunk)
+            yield chunk
 
+    async def aclose(self) -> None:
         try:
-            # Проверка на статус ошибки (например, 500, 404 и т.д.)
-            response = response.raise_for_status()
-        except (HTTPError, HTTPStatusError) as error:
-            exception = error
-
-        request = response.request
-
-        # Получаем route, если он был передан через extensions, иначе используем raw path
-        route = request.extensions.get("route", request.url.path)
-        # Время начала запроса, установленное в request event hook
-        start_time = request.extensions.get("start_time", time.time())
-        # Вычисляем длительность запроса в миллисекундах
-        response_time = (time.time() - start_time) * 1000
-        # Определяем размер тела ответа (можно заменить на 0, если не нужно)
-        response_length = len(response.read())
+            await self.stream.aclose()
+        finally:
+            self.on_close(self.length)
+
+
+def get_content_length(response: Response) -> int | None:
+    """
+    Возвращает размер тела из заголовка Content-Length, если он есть и корректен.
+
+    :param response: Ответ httpx.
+    :return: Размер тела в байтах или None.
+    """
+    try:
+        return int(response.headers["Content-Length"])
+    except (KeyError, ValueError):
+        return None
+
+
+def build_locust_request_event(
+        environment: Environment,
+        response: Response,
+        phase_metrics: bool = False
+) -> Callable[[int], None]:
+    """
+    Собирает метрики ответа (имя, время, ошибку) и возвращает функцию, отправляющую событие в Locust
+    с указанным размером ответа. Время фиксируется в момент получения заголовков ответа.
+
+    Длительности фаз из LocustRequestTrace передаются в context события ({"phases": {...}}),
+    а при phase_metrics=True дополнительно пишутся метриками "<имя> [<фаза>]" в служебную статистику
+    (tools.locust.service_stats), чтобы не искажать статистику эндпоинтов.
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param response: Ответ httpx.
+    :param phase_metrics: Записывать ли фазы запроса в служебную статистику.
+    :return: Функция fire(response_length).
+    """
+    exception: HTTPError | HTTPStatusError | None = None
+
+    try:
+        # Проверка на статус ошибки (например, 500, 404 и т.д.)
+        response = response.raise_for_status()
+    except (HTTPError, HTTPStatusError) as error:
+        exception = error
+
+    request = response.request
+
+    # Получаем route, если он был передан через extensions, иначе используем raw path
+    route = request.extensions.get("route", request.url.path)
+    # Время начала запроса (по монотонным часам perf_counter), установленное в request event hook
+    start_time = request.extensions.get("start_time", time.perf_counter())
+    # Вычисляем длительность запроса в миллисекундах
+    response_time = (time.perf_counter() - start_time) * 1000
+    name = f"{request.method} {route}"
+
+    # В open-модели первый запрос задачи измеряется от запланированного старта задачи (без coordinated omission),
+    # а отставание от расписания пишется в служебную статистику
+    intended_start = request.extensions.get("intended_start")
+    schedule_lag: float | None = None
+    if intended_start is not None:
+        response_time = (time.perf_counter() - intended_start) * 1000
+        schedule_lag = max(0.0, (start_time - intended_start) * 1000)
+    trace = request.extensions.get("trace")
+
+    def fire(response_length: int) -> None:
+        # Фазы читаются в момент отправки события, чтобы учесть и чтение тела ответа
+        phases = dict(trace.phases) if isinstance(trace, LocustRequestTrace) else {}
 
         # Отправляем событие в Locust
         environment.events.request.fire(
-            name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
-            context=None,  # Контекст (опционально, можно использовать для расширений)
+            name=name,  # Имя запроса (метод + логическое имя маршрута)
+            context={"phases": phases},  # Длительности фаз запроса в мс (connect, tls, send, wait, receive)
             response=response,  # Объект ответа (опционально)
             exception=exception,  # Исключение, если оно произошло
             request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
@@ -57,4 +185,113 @@ def locust_response_event_hook(environment: Environment):
             response_length=response_length,  # Размер тела ответа
         )
 
+        if schedule_lag is not None:
+            record_schedule_lag(environment, schedule_lag)
+
+        if phase_metrics:
+            for phase, phase_time in phases.items():
+                record_service_metric(environment, HTTP_PHASE_REQUEST_TYPE, f"{name} [{phase}]", phase_time)
+
+    return fire
+
+
+def locust_request_event_hook(request: Request) -> None:
+    """
+    HTTPX event hook, вызываемый перед отправкой запроса.
+
+    Сохраняет текущее время по монотонным часам perf_counter в `request.extensions["start_time"]`,
+    чтобы потом использовать его для расчёта времени ответа, и подключает трассировку фаз
+    запроса через `request.extensions["trace"]` (если вызывающий код не передал свою).
+    В open-модели также сохраняет запланированный старт задачи в `request.extensions["intended_start"]`.
+    """
+    request.extensions["start_time"] = time.perf_counter()
+    request.extensions.setdefault("trace", LocustRequestTrace())
+
+    # Запланированный старт задачи (только open-модель, см. tools.locust.schedule)
+    intended_start = pop_intended_start()
+    if intended_start is not None:
+        request.extensions["intended_start"] = intended_start
+
+
+def locust_response_event_hook(
+        environment: Environment,
+        length_mode: HTTPResponseLengthMode = HTTPResponseLengthMode.READ,
+        phase_metrics: bool = False
+):
+    """
+    Возвращает HTTPX event hook, вызываемый после получения ответа.
+
+    Использует `request.extensions["start_time"]` для вычисления времени отклика.
+    Извлекает route из `request.extensions["route"]`, если задан.
+    Отправляет собранные метрики в `environment.events.request`, чтобы Locust мог агрегировать статистику.
+
+    Размер ответа считается в зависимости от length_mode:
+    - read: тело дочитывается в хуке (len(response.read()));
+    - stream: берётся Content-Length, а если его нет — байты считаются по мере того, как вызывающий код
+      читает тело, и событие отправляется при закрытии потока. Тело в хуке не буферизуется.
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param length_mode: Способ подсчёта размера ответа.
+    :param phase_metrics: Записывать ли фазы запроса (connect, tls, send, wait, receive) в служебную статистику.
+    :return: Функция-хук для HTTPX response event hook.
+    """
+
+    def inner(response: Response) -> None:
+        fire = build_locust_request_event(environment, response, phase_metrics=phase_metrics)
+
+        if length_mode == HTTPResponseLengthMode.READ:
+            fire(len(response.read()))
+            return
+
+        content_length = get_content_length(response)
+        if content_length is not None:
+            fire(content_length)
+            return
+
+        response.stream = LocustCountingByteStream(response.stream, on_close=fire)
+
+    return inner
+
+
+async def async_locust_request_event_hook(request: Request) -> None:
+    """
+    Асинхронный аналог locust_request_event_hook для httpx.AsyncClient.
+
+    Сохраняет текущее время в `request.extensions["start_time"]` и подключает асинхронную трассировку фаз.
+    """
+    request.extensions["start_time"] = time.perf_counter()
+    request.extensions.setdefault("trace", AsyncLocustRequestTrace())
+
+
+def async_locust_response_event_hook(
+        environment: Environment,
+        length_mode: HTTPResponseLengthMode = HTTPResponseLengthMode.READ,
+        phase_metrics: bool = False
+):
+    """
+    Асинхронный аналог locust_response_event_hook для httpx.AsyncClient.
+
+    Метрики и режимы подсчёта размера те же, но в режиме read тело дочитывается через
+    `await response.aread()`, так как синхронное чтение асинхронного потока невозможно.
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param length_mode: Способ подсчёта размера ответа.
+    :param phase_metrics: Записывать ли фазы запроса (connect, tls, send, wait, receive) в служебную статистику.
+    :return: Асинхронная функция-хук для HTTPX response event hook.
+    """
+
+    async def inner(response: Response) -> None:
+        fire = build_locust_request_event(environment, response, phase_metrics=phase_metrics)
+
+        if length_mode == HTTPResponseLengthMode.READ:
+            fire(len(await response.aread()))
+            return
+
+        content_length = get_content_length(response)
+        if content_length is not None:
+            fire(content_length)
+            return
+
+        response.stream = AsyncLocustCountingByteStream(response.stream, on_close=fire)
+
     return inner
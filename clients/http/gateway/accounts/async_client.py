@@ -0,0 +1,144 @@
+from httpx import Response, AsyncClient, QueryParams
+from locust.env import Environment
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions, ParsedResponse
+from clients.http.gateway.client import (
+    build_gateway_async_http_client,
+    build_gateway_async_locust_http_client,
+    build_gateway_locust_response_parser
+)
+from clients.http.gateway.accounts.schema import (
+    GetAccountsQuerySchema,
+    GetAccountsResponseSchema,
+    OpenDepositAccountRequestSchema,
+    OpenDepositAccountResponseSchema,
+    OpenSavingsAccountRequestSchema,
+    OpenSavingsAccountResponseSchema,
+    OpenDebitCardAccountRequestSchema,
+    OpenDebitCardAccountResponseSchema,
+    OpenCreditCardAccountRequestSchema,
+    OpenCreditCardAccountResponseSchema
+)
+from tools.routes import APIRoutes
+
+
+class AccountsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+    """
+
+    async def get_accounts_api(self, query: GetAccountsQuerySchema) -> Response:
+        """
+        Выполняет GET-запрос на получение списка счетов пользователя.
+
+        :param query: Pydantic-модель с параметрами запроса, например: {'userId': '123'}.
+        :return: Объект httpx.Response с данными о счетах.
+        """
+        return await self.get(
+            APIRoutes.ACCOUNTS,
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route=APIRoutes.ACCOUNTS)
+        )
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия депозитного счёта.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-deposit-account",
+            model=request
+        )
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия сберегательного счёта.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-savings-account",
+            model=request
+        )
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия дебетовой карты.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-debit-card-account",
+            model=request
+        )
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия кредитной карты.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-credit-card-account",
+            model=request
+        )
+
+    async def get_accounts(self, user_id: str) -> ParsedResponse[GetAccountsResponseSchema]:
+        query = GetAccountsQuerySchema(user_id=user_id)
+        response = await self.get_accounts_api(query)
+        return self.parse_response(response, GetAccountsResponseSchema)
+
+    async def open_deposit_account(self, user_id: str) -> ParsedResponse[OpenDepositAccountResponseSchema]:
+        request = OpenDepositAccountRequestSchema(user_id=user_id)
+        response = await self.open_deposit_account_api(request)
+        return self.parse_response(response, OpenDepositAccountResponseSchema)
+
+    async def open_savings_account(self, user_id: str) -> ParsedResponse[OpenSavingsAccountResponseSchema]:
+        request = OpenSavingsAccountRequestSchema(user_id=user_id)
+        response = await self.open_savings_account_api(request)
+        return self.parse_response(response, OpenSavingsAccountResponseSchema)
+
+    async def open_debit_card_account(self, user_id: str) -> ParsedResponse[OpenDebitCardAccountResponseSchema]:
+        request = OpenDebitCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_debit_card_account_api(request)
+        return self.parse_response(response, OpenDebitCardAccountResponseSchema)
+
+    async def open_credit_card_account(self, user_id: str) -> ParsedResponse[OpenCreditCardAccountResponseSchema]:
+        request = OpenCreditCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_credit_card_account_api(request)
+        return self.parse_response(response, OpenCreditCardAccountResponseSchema)
+
+
+def build_accounts_gateway_async_http_client() -> AccountsGatewayAsyncHTTPClient:
+    """
+    Фабрика для создания асинхронного клиента AccountsGatewayAsyncHTTPClient.
+
+    :return: Экземпляр AccountsGatewayAsyncHTTPClient.
+    """
+    return AccountsGatewayAsyncHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_accounts_gateway_async_locust_http_client(
+        environment: Environment,
+        client: AsyncClient | None = None
+) -> AccountsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр AccountsGatewayAsyncHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через асинхронные хуки.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :param client: готовый Locust httpx.AsyncClient, общий для всех клиентов виртуального пользователя
+                   (если не передан, клиент создаётся через build_gateway_async_locust_http_client).
+    :return: экземпляр AccountsGatewayAsyncHTTPClient с хуками сбора метрик.
+    """
+    return AccountsGatewayAsyncHTTPClient(
+        client=client or build_gateway_async_locust_http_client(environment),
+        parser=build_gateway_locust_response_parser()
+    )
@@ -1,7 +1,11 @@
 from locust.env import Environment
-from httpx import Response, QueryParams, request
-from clients.http.client import HTTPClient, HTTPClientExtensions
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from httpx import Response, Client, QueryParams, request
+from clients.http.client import HTTPClient, HTTPClientExtensions, ParsedResponse
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_locust_http_client,
+    build_gateway_locust_response_parser
+)
 from clients.http.gateway.accounts.schema import (
     GetAccountsQuerySchema,
     GetAccountsResponseSchema,
@@ -43,7 +47,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             f"{APIRoutes.ACCOUNTS}/open-deposit-account",
-            json=request.model_dump(by_alias=True)
+            model=request
         )
 
     def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
@@ -55,7 +59,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             f"{APIRoutes.ACCOUNTS}/open-savings-account",
-            json=request.model_dump(by_alias=True)
+            model=request
         )
 
     def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
@@ -67,7 +71,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             f"{APIRoutes.ACCOUNTS}/open-debit-card-account",
-            json=request.model_dump(by_alias=True)
+            model=request
         )
 
     def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
@@ -79,38 +83,41 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             f"{APIRoutes.ACCOUNTS}/open-credit-card-account",
-            json=request.model_dump(by_alias=True)
+            model=request
         )
 
-    def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
+    def get_accounts(self, user_id: str) -> ParsedResponse[GetAccountsResponseSchema]:
         query = GetAccountsQuerySchema(user_id=user_id)
         response = self.get_accounts_api(query)
-        return GetAccountsResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetAccountsResponseSchema)
 
-    def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
+    def open_deposit_account(self, user_id: str) -> ParsedResponse[OpenDepositAccountResponseSchema]:
         request = OpenDepositAccountRequestSchema(user_id=user_id)
         response = self.open_deposit_account_api(request)
-        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenDepositAccountResponseSchema)
 
-    def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
+    def open_savings_account(self, user_id: str) -> ParsedResponse[OpenSavingsAccountResponseSchema]:
         request = OpenSavingsAccountRequestSchema(user_id=user_id)
         response = self.open_savings_account_api(request)
-        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenSavingsAccountResponseSchema)
 
-    def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
+    def open_debit_card_account(self, user_id: str) -> ParsedResponse[OpenDebitCardAccountResponseSchema]:
         request = OpenDebitCardAccountRequestSchema(user_id=user_id)
         response = self.open_debit_card_account_api(request)
-        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenDebitCardAccountResponseSchema)
 
-    def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
+    def open_credit_card_account(self, user_id: str) -> ParsedResponse[OpenCreditCardAccountResponseSchema]:
         request = OpenCreditCardAccountRequestSchema(user_id=user_id)
         response = self.open_credit_card_account_api(request)
-        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenCreditCardAccountResponseSchema)
 
 def build_accounts_gateway_http_client()->AccountsGatewayHTTPClient:
     return AccountsGatewayHTTPClient(client=build_gateway_http_client())
 
-def build_accounts_gateway_locust_http_client(environment: Environment) -> AccountsGatewayHTTPClient:
+def build_accounts_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient адаптированного под Locust.
 
@@ -118,6 +125,11 @@ def build_accounts_gateway_locust_http_client(environment: Environment) -> Accou
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: готовый Locust httpx.Client, общий для всех клиентов виртуального пользователя
+                   (если не передан, клиент создаётся через build_gateway_locust_http_client).
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return AccountsGatewayHTTPClient(
+        client=client or build_gateway_locust_http_client(environment),
+        parser=build_gateway_locust_response_parser()
+    )
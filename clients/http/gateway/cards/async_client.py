@@ -0,0 +1,90 @@
+from httpx import Response, AsyncClient
+from locust.env import Environment
+
+from clients.http.client import AsyncHTTPClient, ParsedResponse
+from clients.http.gateway.client import (
+    build_gateway_async_http_client,
+    build_gateway_async_locust_http_client,
+    build_gateway_locust_response_parser
+)
+from clients.http.gateway.cards.schema import (
+    IssuePhysicalCardRequestSchema,
+    IssuePhysicalCardResponseSchema,
+    IssueVirtualCardRequestSchema,
+    IssueVirtualCardResponseSchema
+)
+from tools.routes import APIRoutes
+
+
+class CardsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+    """
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequestSchema) -> Response:
+        """
+        Выпуск виртуальной карты.
+
+        :param request: Pydantic-модель с данными для выпуска виртуальной карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            f"{APIRoutes.CARDS}/issue-virtual-card",
+            model=request
+        )
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema) -> Response:
+        """
+        Выпуск физической карты.
+
+        :param request: Pydantic-модель с данными для выпуска физической карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            f"{APIRoutes.CARDS}/issue-physical-card",
+            model=request
+        )
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> ParsedResponse[IssueVirtualCardResponseSchema]:
+        request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.issue_virtual_card_api(request)
+        return self.parse_response(response, IssueVirtualCardResponseSchema)
+
+    async def issue_physical_card(
+            self,
+            user_id: str,
+            account_id: str
+    ) -> ParsedResponse[IssuePhysicalCardResponseSchema]:
+        request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.issue_physical_card_api(request)
+        return self.parse_response(response, IssuePhysicalCardResponseSchema)
+
+
+def build_cards_gateway_async_http_client() -> CardsGatewayAsyncHTTPClient:
+    """
+    Фабрика для создания асинхронного клиента CardsGatewayAsyncHTTPClient.
+
+    :return: Экземпляр CardsGatewayAsyncHTTPClient.
+    """
+    return CardsGatewayAsyncHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_cards_gateway_async_locust_http_client(
+        environment: Environment,
+        client: AsyncClient | None = None
+) -> CardsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр CardsGatewayAsyncHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через асинхронные хуки.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :param client: готовый Locust httpx.AsyncClient, общий для всех клиентов виртуального пользователя
+                   (если не передан, клиент создаётся через build_gateway_async_locust_http_client).
+    :return: экземпляр CardsGatewayAsyncHTTPClient с хуками сбора метрик.
+    """
+    return CardsGatewayAsyncHTTPClient(
+        client=client or build_gateway_async_locust_http_client(environment),
+        parser=build_gateway_locust_response_parser()
+    )
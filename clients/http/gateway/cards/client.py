@@ -1,8 +1,12 @@
-from clients.http.client import HTTPClient
+from clients.http.client import HTTPClient, ParsedResponse
 from locust.env import Environment
 from typing import TypedDict
-from httpx import Response, request
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from httpx import Response, Client, request
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_locust_http_client,
+    build_gateway_locust_response_parser
+)
 from clients.http.gateway.cards.schema import (
     IssuePhysicalCardRequestSchema,
     IssuePhysicalCardResponseSchema,
@@ -25,7 +29,7 @@ class CardsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             f"{APIRoutes.CARDS}/issue-virtual-card",
-            json=request.model_dump(by_alias=True)
+            model=request
         )
 
     def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema) -> Response:
@@ -37,24 +41,27 @@ class CardsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             f"{APIRoutes.CARDS}/issue-physical-card",
-            json=request.model_dump(by_alias=True)
+            model=request
         )
 
-    def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
+    def issue_virtual_card(self, user_id: str, account_id: str) -> ParsedResponse[IssueVirtualCardResponseSchema]:
         request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, IssueVirtualCardResponseSchema)
 
-    def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
+    def issue_physical_card(self, user_id: str, account_id: str) -> ParsedResponse[IssuePhysicalCardResponseSchema]:
         request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, IssuePhysicalCardResponseSchema)
 
 def build_cards_gateway_http_client()->CardsGatewayHTTPClient:
     return CardsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGatewayHTTPClient:
+def build_cards_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient адаптированного под Locust.
 
@@ -62,6 +69,11 @@ def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: готовый Locust httpx.Client, общий для всех клиентов виртуального пользователя
+                   (если не передан, клиент создаётся через build_gateway_locust_http_client).
     :return: экземпляр CardsGatewayHTTPClient с хуками сбора метрик.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return CardsGatewayHTTPClient(
+        client=client or build_gateway_locust_http_client(environment),
+        parser=build_gateway_locust_response_parser()
+    )
\ No newline at end of file
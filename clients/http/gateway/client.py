@@ -1,15 +1,23 @@
 import logging
-from httpx import Client
+from httpx import AsyncClient, Client
 from locust.env import Environment
 
 # Импортируем settings из config.py
 from config import settings
 
+from clients.http.client import HTTPResponseParser
+
 # Импортируем существующие хуки
 from clients.http.event_hooks.locust_event_hook import (
     locust_request_event_hook,
-    locust_response_event_hook
+    locust_response_event_hook,
+    async_locust_request_event_hook,
+    async_locust_response_event_hook
 )
+from tools.config.http import HTTPClientShareScope
+
+# Общие на процесс Locust-клиенты (GATEWAY_HTTP_CLIENT.SHARE_SCOPE=process), по одному на окружение
+gateway_locust_http_clients: dict[Environment, Client] = {}
 
 
 def build_gateway_http_client() -> Client:
@@ -21,7 +29,23 @@ def build_gateway_http_client() -> Client:
     return Client(
         # Используем client_url и timeout из настроек вместо захардкоженных значений
         timeout=settings.gateway_http_client.timeout,
-        base_url=settings.gateway_http_client.client_url
+        base_url=settings.gateway_http_client.client_url,
+        limits=settings.gateway_http_client.limits,
+        http2=settings.gateway_http_client.http2
+    )
+
+
+def build_gateway_async_http_client() -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками для сервиса http-gateway.
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        timeout=settings.gateway_http_client.timeout,
+        base_url=settings.gateway_http_client.client_url,
+        limits=settings.gateway_http_client.limits,
+        http2=settings.gateway_http_client.http2
     )
 
 
@@ -37,6 +61,25 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     Таким образом, данный клиент автоматически репортит статистику в Locust
     при каждом выполненном HTTP-запросе.
 
+    Лимиты пула, keep-alive и HTTP/2 берутся из GATEWAY_HTTP_CLIENT.*. При
+    GATEWAY_HTTP_CLIENT.SHARE_SCOPE=process возвращается один и тот же клиент на весь процесс,
+    при user — новый клиент, который виртуальный пользователь делит между своими API-клиентами.
+
+    :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
+    """
+    if settings.gateway_http_client.share_scope == HTTPClientShareScope.PROCESS:
+        if environment not in gateway_locust_http_clients:
+            gateway_locust_http_clients[environment] = open_gateway_locust_http_client(environment)
+        return gateway_locust_http_clients[environment]
+
+    return open_gateway_locust_http_client(environment)
+
+
+def open_gateway_locust_http_client(environment: Environment) -> Client:
+    """
+    Открывает новый httpx.Client с Locust-хуками (см. build_gateway_locust_http_client).
+
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
     :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
     """
@@ -48,8 +91,56 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
         # Используем client_url и timeout из настроек вместо захардкоженных значений
         timeout=settings.gateway_http_client.timeout,
         base_url=settings.gateway_http_client.client_url,
+        limits=settings.gateway_http_client.limits,
+        http2=settings.gateway_http_client.http2,
         event_hooks={
             "request": [locust_request_event_hook],  # Отмечаем время начала запроса
-            "response": [locust_response_event_hook(environment)]  # Собираем метрики и передаём их в Locust
+            "response": [locust_response_event_hook(
+                environment,
+                length_mode=settings.gateway_http_client.response_length_mode,
+                phase_metrics=settings.gateway_http_client.phase_metrics
+            )]  # Собираем метрики и передаём их в Locust
         }
-    )
\ No newline at end of file
+    )
+
+
+def build_gateway_async_locust_http_client(environment: Environment) -> AsyncClient:
+    """
+    Асинхронный аналог build_gateway_locust_http_client на httpx.AsyncClient.
+
+    Подключает асинхронные хуки async_locust_request_event_hook / async_locust_response_event_hook,
+    которые отправляют в Locust те же метрики, что и синхронный клиент.
+    Клиент нужно создавать и использовать внутри работающего цикла событий asyncio.
+
+    :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :return: httpx.AsyncClient с подключёнными хуками под нагрузочное тестирование.
+    """
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    return AsyncClient(
+        timeout=settings.gateway_http_client.timeout,
+        base_url=settings.gateway_http_client.client_url,
+        limits=settings.gateway_http_client.limits,
+        http2=settings.gateway_http_client.http2,
+        event_hooks={
+            "request": [async_locust_request_event_hook],
+            "response": [async_locust_response_event_hook(
+                environment,
+                length_mode=settings.gateway_http_client.response_length_mode,
+                phase_metrics=settings.gateway_http_client.phase_metrics
+            )]
+        }
+    )
+
+
+def build_gateway_locust_response_parser() -> HTTPResponseParser:
+    """
+    Разбор ответов для Locust-клиентов шлюза по GATEWAY_HTTP_CLIENT.RESPONSE_PARSE_POLICY.
+    Создаётся на каждый API-клиент, поэтому выборка sampled считается отдельно по каждому клиенту.
+
+    :return: HTTPResponseParser с политикой из настроек.
+    """
+    return HTTPResponseParser(
+        policy=settings.gateway_http_client.response_parse_policy,
+        sample_rate=settings.gateway_http_client.response_parse_sample_rate
+    )
@@ -0,0 +1,94 @@
+from httpx import Response, AsyncClient
+from locust.env import Environment
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions, ParsedResponse
+from clients.http.gateway.client import (
+    build_gateway_async_http_client,
+    build_gateway_async_locust_http_client,
+    build_gateway_locust_response_parser
+)
+from clients.http.gateway.documents.schema import (
+    GetTariffDocumentResponseSchema,
+    GetContractDocumentResponseSchema
+)
+from tools.routes import APIRoutes
+
+
+class DocumentsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    """
+
+    async def get_tariff_document_api(self, account_id: str) -> Response:
+        """
+        Получить тарифа по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"{APIRoutes.DOCUMENTS}/tariff-document/{account_id}",
+            extensions=HTTPClientExtensions(route=f"{APIRoutes.DOCUMENTS}/tariff-document/{{account_id}}")
+        )
+
+    async def get_contract_document_api(self, account_id: str) -> Response:
+        """
+        Получить контракта по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"{APIRoutes.DOCUMENTS}/contract-document/{account_id}",
+            extensions=HTTPClientExtensions(route=f"{APIRoutes.DOCUMENTS}/contract-document/{{account_id}}")
+        )
+
+    async def get_tariff_document(self, account_id: str) -> ParsedResponse[GetTariffDocumentResponseSchema]:
+        """
+        Получить документ тарифа по счету (высокоуровневый метод).
+
+        :param account_id: Идентификатор счета.
+        :return: Pydantic-модель с данными документа тарифа.
+        """
+        response = await self.get_tariff_document_api(account_id)
+        return self.parse_response(response, GetTariffDocumentResponseSchema)
+
+    async def get_contract_document(self, account_id: str) -> ParsedResponse[GetContractDocumentResponseSchema]:
+        """
+        Получить документ контракта по счету (высокоуровневый метод).
+
+        :param account_id: Идентификатор счета.
+        :return: Pydantic-модель с данными документа контракта.
+        """
+        response = await self.get_contract_document_api(account_id)
+        return self.parse_response(response, GetContractDocumentResponseSchema)
+
+
+def build_documents_gateway_async_http_client() -> DocumentsGatewayAsyncHTTPClient:
+    """
+    Фабрика для создания асинхронного клиента DocumentsGatewayAsyncHTTPClient.
+
+    :return: Экземпляр DocumentsGatewayAsyncHTTPClient.
+    """
+    return DocumentsGatewayAsyncHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_documents_gateway_async_locust_http_client(
+        environment: Environment,
+        client: AsyncClient | None = None
+) -> DocumentsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр DocumentsGatewayAsyncHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через асинхронные хуки.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :param client: готовый Locust httpx.AsyncClient, общий для всех клиентов виртуального пользователя
+                   (если не передан, клиент создаётся через build_gateway_async_locust_http_client).
+    :return: экземпляр DocumentsGatewayAsyncHTTPClient с хуками сбора метрик.
+    """
+    return DocumentsGatewayAsyncHTTPClient(
+        client=client or build_gateway_async_locust_http_client(environment),
+        parser=build_gateway_locust_response_parser()
+    )
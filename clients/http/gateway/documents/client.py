@@ -1,7 +1,11 @@
-from httpx import Response
+from httpx import Response, Client
 from locust.env import Environment
-from clients.http.client import HTTPClient, HTTPClientExtensions
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.client import HTTPClient, HTTPClientExtensions, ParsedResponse
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_locust_http_client,
+    build_gateway_locust_response_parser
+)
 from clients.http.gateway.documents.schema import (
     GetTariffDocumentResponseSchema,
     GetContractDocumentResponseSchema
@@ -38,7 +42,7 @@ class DocumentsGatewayHTTPClient(HTTPClient):
             extensions=HTTPClientExtensions(route=f"{APIRoutes.DOCUMENTS}/contract-document/{{account_id}}")
         )
 
-    def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
+    def get_tariff_document(self, account_id: str) -> ParsedResponse[GetTariffDocumentResponseSchema]:
         """
         Получить документ тарифа по счету (высокоуровневый метод).
 
@@ -46,9 +50,9 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :return: Pydantic-модель с данными документа тарифа.
         """
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetTariffDocumentResponseSchema)
 
-    def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
+    def get_contract_document(self, account_id: str) -> ParsedResponse[GetContractDocumentResponseSchema]:
         """
         Получить документ контракта по счету (высокоуровневый метод).
 
@@ -56,7 +60,7 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :return: Pydantic-модель с данными документа контракта.
         """
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetContractDocumentResponseSchema)
 
 
 def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
@@ -67,7 +71,10 @@ def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
     return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_documents_gateway_locust_http_client(environment: Environment) -> DocumentsGatewayHTTPClient:
+def build_documents_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient адаптированного под Locust.
 
@@ -75,6 +82,11 @@ def build_documents_gateway_locust_http_client(environment: Environment) -> Docu
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: готовый Locust httpx.Client, общий для всех клиентов виртуального пользователя
+                   (если не передан, клиент создаётся через build_gateway_locust_http_client).
     :return: экземпляр DocumentsGatewayHTTPClient с хуками сбора метрик.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return DocumentsGatewayHTTPClient(
+        client=client or build_gateway_locust_http_client(environment),
+        parser=build_gateway_locust_response_parser()
+    )
\ No newline at end of file
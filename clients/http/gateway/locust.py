@@ -1,4 +1,5 @@
 from locust import TaskSet, SequentialTaskSet
+from clients.http.gateway.client import build_gateway_locust_http_client
 from clients.http.gateway.users.client import (build_users_gateway_locust_http_client,
     UsersGatewayHTTPClient)
 from clients.http.gateway.cards.client import (build_cards_gateway_locust_http_client,
@@ -19,11 +20,14 @@ class GatewayHTTPTaskSet(TaskSet):
     documents_gateway_client: DocumentsGatewayHTTPClient
     operations_gateway_client: OperationsGatewayHTTPClient
     def on_start(self) -> None:
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        # Один httpx.Client (и один пул соединений) на все клиенты виртуального пользователя
+        client = build_gateway_locust_http_client(self.user.environment)
+
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment, client)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment, client)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment, client)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment, client)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment, client)
 
 
 
@@ -34,8 +38,11 @@ class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
     documents_gateway_client: DocumentsGatewayHTTPClient
     operations_gateway_client: OperationsGatewayHTTPClient
     def on_start(self) -> None:
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
\ No newline at end of file
+        # Один httpx.Client (и один пул соединений) на все клиенты виртуального пользователя
+        client = build_gateway_locust_http_client(self.user.environment)
+
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment, client)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment, client)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment, client)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment, client)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment, client)
\ No newline at end of file
@@ -0,0 +1,355 @@
+from httpx import Response, AsyncClient, QueryParams
+from locust.env import Environment
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions, ParsedResponse
+from clients.http.gateway.client import (
+    build_gateway_async_http_client,
+    build_gateway_async_locust_http_client,
+    build_gateway_locust_response_parser
+)
+from clients.http.gateway.operations.schema import (
+    GetOperationsQuerySchema,
+    GetOperationsSummaryQuerySchema,
+    GetOperationResponseSchema,
+    GetOperationReceiptResponseSchema,
+    GetOperationsResponseSchema,
+    GetOperationsSummaryResponseSchema,
+    MakeFeeOperationRequestSchema,
+    MakeFeeOperationResponseSchema,
+    MakeTopUpOperationRequestSchema,
+    MakeTopUpOperationResponseSchema,
+    MakeCashbackOperationRequestSchema,
+    MakeCashbackOperationResponseSchema,
+    MakeTransferOperationRequestSchema,
+    MakeTransferOperationResponseSchema,
+    MakePurchaseOperationRequestSchema,
+    MakePurchaseOperationResponseSchema,
+    MakeBillPaymentOperationRequestSchema,
+    MakeBillPaymentOperationResponseSchema,
+    MakeCashWithdrawalOperationRequestSchema,
+    MakeCashWithdrawalOperationResponseSchema
+)
+from tools.routes import APIRoutes
+
+
+class OperationsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/operations сервиса http-gateway.
+
+    Предоставляет методы для работы с операциями: получение информации об операциях,
+    создание различных типов операций, получение статистики и чеков.
+    """
+
+    async def get_operation_api(self, operation_id: str) -> Response:
+        """
+        Выполняет GET-запрос для получения информации об операции по её идентификатору.
+
+        :param operation_id: Идентификатор операции.
+        :return: Объект httpx.Response с данными об операции.
+        """
+        return await self.get(
+            f"{APIRoutes.OPERATIONS}/{operation_id}",
+            extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/{{operation_id}}")
+        )
+
+    async def get_operation_receipt_api(self, operation_id: str) -> Response:
+        """
+        Выполняет GET-запрос для получения чека операции по её идентификатору.
+
+        :param operation_id: Идентификатор операции.
+        :return: Объект httpx.Response с данными чека операции.
+        """
+        return await self.get(
+            f"{APIRoutes.OPERATIONS}/operation-receipt/{operation_id}",
+            extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/operation-receipt/{{operation_id}}")
+        )
+
+    async def get_operations_api(self, query: GetOperationsQuerySchema) -> Response:
+        """
+        Выполняет GET-запрос для получения списка операций определенного счета.
+
+        :param query: Pydantic-модель с параметрами запроса.
+        :return: Объект httpx.Response со списком операций счета.
+        """
+        return await self.get(
+            APIRoutes.OPERATIONS, 
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route=APIRoutes.OPERATIONS)
+        )
+
+    async def get_operations_summary_api(self, query: GetOperationsSummaryQuerySchema) -> Response:
+        """
+        Выполняет GET-запрос для получения статистики по операциям определенного счета.
+
+        :param query: Pydantic-модель с параметрами запроса.
+        :return: Объект httpx.Response со статистикой операций счета.
+        """
+        return await self.get(
+            f"{APIRoutes.OPERATIONS}/operations-summary", 
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/operations-summary")
+        )
+
+    async def make_fee_operation_api(self, request: MakeFeeOperationRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для создания операции комиссии.
+
+        :param request: Pydantic-модель с данными для создания операции комиссии.
+        :return: Объект httpx.Response с результатом создания операции.
+        """
+        return await self.post(f"{APIRoutes.OPERATIONS}/make-fee-operation", model=request)
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для создания операции пополнения.
+
+        :param request: Pydantic-модель с данными для создания операции пополнения.
+        :return: Объект httpx.Response с результатом создания операции.
+        """
+        return await self.post(f"{APIRoutes.OPERATIONS}/make-top-up-operation", model=request)
+
+    async def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для создания операции кэшбэка.
+
+        :param request: Pydantic-модель с данными для создания операции кэшбэка.
+        :return: Объект httpx.Response с результатом создания операции.
+        """
+        return await self.post(f"{APIRoutes.OPERATIONS}/make-cashback-operation", model=request)
+
+    async def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для создания операции перевода между счетами.
+
+        :param request: Pydantic-модель с данными для создания операции перевода.
+        :return: Объект httpx.Response с результатом создания операции.
+        """
+        return await self.post(f"{APIRoutes.OPERATIONS}/make-transfer-operation", model=request)
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для создания операции покупки.
+
+        :param request: Pydantic-модель с данными для создания операции покупки.
+        :return: Объект httpx.Response с результатом создания операции.
+        """
+        return await self.post(f"{APIRoutes.OPERATIONS}/make-purchase-operation", model=request)
+
+    async def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для создания операции оплаты по счету.
+
+        :param request: Pydantic-модель с данными для создания операции оплаты по счету.
+        :return: Объект httpx.Response с результатом создания операции.
+        """
+        return await self.post(f"{APIRoutes.OPERATIONS}/make-bill-payment-operation", model=request)
+
+    async def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для создания операции снятия наличных денег.
+
+        :param request: Pydantic-модель с данными для создания операции снятия наличных.
+        :return: Объект httpx.Response с результатом создания операции.
+        """
+        return await self.post(f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation", model=request)
+
+    # High-level methods
+    async def get_operation(self, operation_id: str) -> ParsedResponse[GetOperationResponseSchema]:
+        """
+        Получить информацию об операции по её идентификатору (высокоуровневый метод).
+
+        :param operation_id: Идентификатор операции.
+        :return: Pydantic-модель с данными операции.
+        """
+        response = await self.get_operation_api(operation_id)
+        return self.parse_response(response, GetOperationResponseSchema)
+
+    async def get_operation_receipt(self, operation_id: str) -> ParsedResponse[GetOperationReceiptResponseSchema]:
+        """
+        Получить чек операции по её идентификатору (высокоуровневый метод).
+
+        :param operation_id: Идентификатор операции.
+        :return: Pydantic-модель с данными чека операции.
+        """
+        response = await self.get_operation_receipt_api(operation_id)
+        return self.parse_response(response, GetOperationReceiptResponseSchema)
+
+    async def get_operations(self, account_id: str) -> ParsedResponse[GetOperationsResponseSchema]:
+        """
+        Получить список операций счета (высокоуровневый метод).
+
+        :param account_id: Идентификатор счета.
+        :return: Pydantic-модель со списком операций.
+        """
+        query = GetOperationsQuerySchema(account_id=account_id)
+        response = await self.get_operations_api(query)
+        return self.parse_response(response, GetOperationsResponseSchema)
+
+    async def get_operations_summary(self, account_id: str) -> ParsedResponse[GetOperationsSummaryResponseSchema]:
+        """
+        Получить статистику по операциям счета (высокоуровневый метод).
+
+        :param account_id: Идентификатор счета.
+        :return: Pydantic-модель со статистикой операций.
+        """
+        query = GetOperationsSummaryQuerySchema(account_id=account_id)
+        response = await self.get_operations_summary_api(query)
+        return self.parse_response(response, GetOperationsSummaryResponseSchema)
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> ParsedResponse[MakeFeeOperationResponseSchema]:
+        """
+        Создать операцию комиссии (высокоуровневый метод).
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: Pydantic-модель с созданной операцией.
+        """
+        request = MakeFeeOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_fee_operation_api(request)
+        return self.parse_response(response, MakeFeeOperationResponseSchema)
+
+    async def make_top_up_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> ParsedResponse[MakeTopUpOperationResponseSchema]:
+        """
+        Создать операцию пополнения (высокоуровневый метод).
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: Pydantic-модель с созданной операцией.
+        """
+        request = MakeTopUpOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_top_up_operation_api(request)
+        return self.parse_response(response, MakeTopUpOperationResponseSchema)
+
+    async def make_cashback_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> ParsedResponse[MakeCashbackOperationResponseSchema]:
+        """
+        Создать операцию кэшбэка (высокоуровневый метод).
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: Pydantic-модель с созданной операцией.
+        """
+        request = MakeCashbackOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_cashback_operation_api(request)
+        return self.parse_response(response, MakeCashbackOperationResponseSchema)
+
+    async def make_transfer_operation(
+            self,
+            from_account_id: str,
+            to_account_id: str
+    ) -> ParsedResponse[MakeTransferOperationResponseSchema]:
+        """
+        Создать операцию перевода (высокоуровневый метод).
+
+        :param from_account_id: Идентификатор счета отправителя.
+        :param to_account_id: Идентификатор счета получателя.
+        :return: Pydantic-модель с созданной операцией.
+        """
+        request = MakeTransferOperationRequestSchema(
+            from_account_id=from_account_id,
+            to_account_id=to_account_id
+        )
+        response = await self.make_transfer_operation_api(request)
+        return self.parse_response(response, MakeTransferOperationResponseSchema)
+
+    async def make_purchase_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> ParsedResponse[MakePurchaseOperationResponseSchema]:
+        """
+        Создать операцию покупки (высокоуровневый метод).
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: Pydantic-модель с созданной операцией.
+        """
+        request = MakePurchaseOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_purchase_operation_api(request)
+        return self.parse_response(response, MakePurchaseOperationResponseSchema)
+
+    async def make_bill_payment_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> ParsedResponse[MakeBillPaymentOperationResponseSchema]:
+        """
+        Создать операцию оплаты счета (высокоуровневый метод).
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: Pydantic-модель с созданной операцией.
+        """
+        request = MakeBillPaymentOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_bill_payment_operation_api(request)
+        return self.parse_response(response, MakeBillPaymentOperationResponseSchema)
+
+    async def make_cash_withdrawal_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> ParsedResponse[MakeCashWithdrawalOperationResponseSchema]:
+        """
+        Создать операцию снятия наличных (высокоуровневый метод).
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счета.
+        :return: Pydantic-модель с созданной операцией.
+        """
+        request = MakeCashWithdrawalOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_cash_withdrawal_operation_api(request)
+        return self.parse_response(response, MakeCashWithdrawalOperationResponseSchema)
+
+
+def build_operations_gateway_async_http_client() -> OperationsGatewayAsyncHTTPClient:
+    """
+    Фабрика для создания асинхронного клиента OperationsGatewayAsyncHTTPClient.
+
+    :return: Экземпляр OperationsGatewayAsyncHTTPClient.
+    """
+    return OperationsGatewayAsyncHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_operations_gateway_async_locust_http_client(
+        environment: Environment,
+        client: AsyncClient | None = None
+) -> OperationsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр OperationsGatewayAsyncHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через асинхронные хуки.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :param client: готовый Locust httpx.AsyncClient, общий для всех клиентов виртуального пользователя
+                   (если не передан, клиент создаётся через build_gateway_async_locust_http_client).
+    :return: экземпляр OperationsGatewayAsyncHTTPClient с хуками сбора метрик.
+    """
+    return OperationsGatewayAsyncHTTPClient(
+        client=client or build_gateway_async_locust_http_client(environment),
+        parser=build_gateway_locust_response_parser()
+    )
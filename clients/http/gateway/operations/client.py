@@ -1,7 +1,11 @@
-from httpx import Response, QueryParams
+from httpx import Response, Client, QueryParams
 from locust.env import Environment
-from clients.http.client import HTTPClient, HTTPClientExtensions
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.client import HTTPClient, HTTPClientExtensions, ParsedResponse
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_locust_http_client,
+    build_gateway_locust_response_parser
+)
 from clients.http.gateway.operations.schema import (
     GetOperationsQuerySchema,
     GetOperationsSummaryQuerySchema,
@@ -92,7 +96,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с данными для создания операции комиссии.
         :return: Объект httpx.Response с результатом создания операции.
         """
-        return self.post(f"{APIRoutes.OPERATIONS}/make-fee-operation", json=request.model_dump(by_alias=True))
+        return self.post(f"{APIRoutes.OPERATIONS}/make-fee-operation", model=request)
 
     def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema) -> Response:
         """
@@ -101,7 +105,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с данными для создания операции пополнения.
         :return: Объект httpx.Response с результатом создания операции.
         """
-        return self.post(f"{APIRoutes.OPERATIONS}/make-top-up-operation", json=request.model_dump(by_alias=True))
+        return self.post(f"{APIRoutes.OPERATIONS}/make-top-up-operation", model=request)
 
     def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema) -> Response:
         """
@@ -110,7 +114,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с данными для создания операции кэшбэка.
         :return: Объект httpx.Response с результатом создания операции.
         """
-        return self.post(f"{APIRoutes.OPERATIONS}/make-cashback-operation", json=request.model_dump(by_alias=True))
+        return self.post(f"{APIRoutes.OPERATIONS}/make-cashback-operation", model=request)
 
     def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema) -> Response:
         """
@@ -119,7 +123,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с данными для создания операции перевода.
         :return: Объект httpx.Response с результатом создания операции.
         """
-        return self.post(f"{APIRoutes.OPERATIONS}/make-transfer-operation", json=request.model_dump(by_alias=True))
+        return self.post(f"{APIRoutes.OPERATIONS}/make-transfer-operation", model=request)
 
     def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
         """
@@ -128,7 +132,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с данными для создания операции покупки.
         :return: Объект httpx.Response с результатом создания операции.
         """
-        return self.post(f"{APIRoutes.OPERATIONS}/make-purchase-operation", json=request.model_dump(by_alias=True))
+        return self.post(f"{APIRoutes.OPERATIONS}/make-purchase-operation", model=request)
 
     def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema) -> Response:
         """
@@ -137,7 +141,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с данными для создания операции оплаты по счету.
         :return: Объект httpx.Response с результатом создания операции.
         """
-        return self.post(f"{APIRoutes.OPERATIONS}/make-bill-payment-operation", json=request.model_dump(by_alias=True))
+        return self.post(f"{APIRoutes.OPERATIONS}/make-bill-payment-operation", model=request)
 
     def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema) -> Response:
         """
@@ -146,10 +150,10 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param request: Pydantic-модель с данными для создания операции снятия наличных.
         :return: Объект httpx.Response с результатом создания операции.
         """
-        return self.post(f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation", json=request.model_dump(by_alias=True))
+        return self.post(f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation", model=request)
 
     # High-level methods
-    def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
+    def get_operation(self, operation_id: str) -> ParsedResponse[GetOperationResponseSchema]:
         """
         Получить информацию об операции по её идентификатору (высокоуровневый метод).
 
@@ -157,9 +161,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Pydantic-модель с данными операции.
         """
         response = self.get_operation_api(operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationResponseSchema)
 
-    def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
+    def get_operation_receipt(self, operation_id: str) -> ParsedResponse[GetOperationReceiptResponseSchema]:
         """
         Получить чек операции по её идентификатору (высокоуровневый метод).
 
@@ -167,9 +171,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Pydantic-модель с данными чека операции.
         """
         response = self.get_operation_receipt_api(operation_id)
-        return GetOperationReceiptResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationReceiptResponseSchema)
 
-    def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
+    def get_operations(self, account_id: str) -> ParsedResponse[GetOperationsResponseSchema]:
         """
         Получить список операций счета (высокоуровневый метод).
 
@@ -178,9 +182,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         query = GetOperationsQuerySchema(account_id=account_id)
         response = self.get_operations_api(query)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationsResponseSchema)
 
-    def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
+    def get_operations_summary(self, account_id: str) -> ParsedResponse[GetOperationsSummaryResponseSchema]:
         """
         Получить статистику по операциям счета (высокоуровневый метод).
 
@@ -189,9 +193,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         query = GetOperationsSummaryQuerySchema(account_id=account_id)
         response = self.get_operations_summary_api(query)
-        return GetOperationsSummaryResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationsSummaryResponseSchema)
 
-    def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
+    def make_fee_operation(self, card_id: str, account_id: str) -> ParsedResponse[MakeFeeOperationResponseSchema]:
         """
         Создать операцию комиссии (высокоуровневый метод).
 
@@ -204,9 +208,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_fee_operation_api(request)
-        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeFeeOperationResponseSchema)
 
-    def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
+    def make_top_up_operation(self, card_id: str, account_id: str) -> ParsedResponse[MakeTopUpOperationResponseSchema]:
         """
         Создать операцию пополнения (высокоуровневый метод).
 
@@ -219,9 +223,13 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_top_up_operation_api(request)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeTopUpOperationResponseSchema)
 
-    def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
+    def make_cashback_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> ParsedResponse[MakeCashbackOperationResponseSchema]:
         """
         Создать операцию кэшбэка (высокоуровневый метод).
 
@@ -234,9 +242,13 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_cashback_operation_api(request)
-        return MakeCashbackOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeCashbackOperationResponseSchema)
 
-    def make_transfer_operation(self, from_account_id: str, to_account_id: str) -> MakeTransferOperationResponseSchema:
+    def make_transfer_operation(
+            self,
+            from_account_id: str,
+            to_account_id: str
+    ) -> ParsedResponse[MakeTransferOperationResponseSchema]:
         """
         Создать операцию перевода (высокоуровневый метод).
 
@@ -249,9 +261,13 @@ class OperationsGatewayHTTPClient(HTTPClient):
             to_account_id=to_account_id
         )
         response = self.make_transfer_operation_api(request)
-        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeTransferOperationResponseSchema)
 
-    def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
+    def make_purchase_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> ParsedResponse[MakePurchaseOperationResponseSchema]:
         """
         Создать операцию покупки (высокоуровневый метод).
 
@@ -264,9 +280,13 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_purchase_operation_api(request)
-        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakePurchaseOperationResponseSchema)
 
-    def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
+    def make_bill_payment_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> ParsedResponse[MakeBillPaymentOperationResponseSchema]:
         """
         Создать операцию оплаты счета (высокоуровневый метод).
 
@@ -279,9 +299,13 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_bill_payment_operation_api(request)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeBillPaymentOperationResponseSchema)
 
-    def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
+    def make_cash_withdrawal_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> ParsedResponse[MakeCashWithdrawalOperationResponseSchema]:
         """
         Создать операцию снятия наличных (высокоуровневый метод).
 
@@ -294,7 +318,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_cash_withdrawal_operation_api(request)
-        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeCashWithdrawalOperationResponseSchema)
 
 
 def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
@@ -305,7 +329,10 @@ def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
     """
     return OperationsGatewayHTTPClient(client=build_gateway_http_client())
 
-def build_operations_gateway_locust_http_client(environment: Environment) -> OperationsGatewayHTTPClient:
+def build_operations_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> OperationsGatewayHTTPClient:
     """
     Функция создаёт экземпляр OperationsGatewayHTTPClient адаптированного под Locust.
 
@@ -313,6 +340,11 @@ def build_operations_gateway_locust_http_client(environment: Environment) -> Ope
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: готовый Locust httpx.Client, общий для всех клиентов виртуального пользователя
+                   (если не передан, клиент создаётся через build_gateway_locust_http_client).
     :return: экземпляр OperationsGatewayHTTPClient с хуками сбора метрик.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return OperationsGatewayHTTPClient(
+        client=client or build_gateway_locust_http_client(environment),
+        parser=build_gateway_locust_response_parser()
+    )
\ No newline at end of file
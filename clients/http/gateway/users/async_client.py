@@ -0,0 +1,79 @@
+from httpx import Response, AsyncClient
+from locust.env import Environment
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions, ParsedResponse
+from clients.http.gateway.client import (
+    build_gateway_async_http_client,
+    build_gateway_async_locust_http_client,
+    build_gateway_locust_response_parser
+)
+from clients.http.gateway.users.schema import (
+    GetUserResponseSchema,
+    CreateUserRequestSchema,
+    CreateUserResponseSchema
+)
+from tools.routes import APIRoutes
+
+
+class UsersGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент взаимодействия с api/v1/users/ сервиса http-gateway
+    """
+
+    async def get_user_api(self, user_id: str) -> Response:
+        """
+        Получить данные пользователя по user_id
+        :param user_id: идентификатор пользователя
+        :return: Ответ от сервера (объект httpx.Response)
+        """
+        return await self.get(
+            f"{APIRoutes.USERS}/{user_id}",
+            extensions=HTTPClientExtensions(route=f"{APIRoutes.USERS}/{{user_id}}")
+        )
+
+    async def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+        """
+        Создание нового пользователя.
+        :param request: Pydantic-модель с данными нового пользователя
+        :return: Ответ от сервера (объект httpx.Response)
+        """
+        return await self.post(APIRoutes.USERS, model=request)
+
+    async def get_user(self, user_id: str) -> ParsedResponse[GetUserResponseSchema]:
+        response = await self.get_user_api(user_id)
+        return self.parse_response(response, GetUserResponseSchema)
+
+    async def create_user(self) -> ParsedResponse[CreateUserResponseSchema]:
+        request = CreateUserRequestSchema()
+        response = await self.create_user_api(request)
+        return self.parse_response(response, CreateUserResponseSchema)
+
+
+def build_users_gateway_async_http_client() -> UsersGatewayAsyncHTTPClient:
+    """
+    Фабрика для создания асинхронного клиента UsersGatewayAsyncHTTPClient.
+
+    :return: Экземпляр UsersGatewayAsyncHTTPClient.
+    """
+    return UsersGatewayAsyncHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_users_gateway_async_locust_http_client(
+        environment: Environment,
+        client: AsyncClient | None = None
+) -> UsersGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр UsersGatewayAsyncHTTPClient адаптированного под Locust.
+
+    Клиент автоматически собирает метрики и передаёт их в Locust через асинхронные хуки.
+    Используется исключительно в нагрузочных тестах.
+
+    :param environment: объект окружения Locust.
+    :param client: готовый Locust httpx.AsyncClient, общий для всех клиентов виртуального пользователя
+                   (если не передан, клиент создаётся через build_gateway_async_locust_http_client).
+    :return: экземпляр UsersGatewayAsyncHTTPClient с хуками сбора метрик.
+    """
+    return UsersGatewayAsyncHTTPClient(
+        client=client or build_gateway_async_locust_http_client(environment),
+        parser=build_gateway_locust_response_parser()
+    )
@@ -1,8 +1,12 @@
 import time
 from locust.env import Environment
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.client import HTTPClient, HTTPClientExtensions, ParsedResponse
 from httpx import Response, Client
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_locust_http_client,
+    build_gateway_locust_response_parser
+)
 from clients.http.gateway.users.schema import (
     GetUserResponseSchema,
     CreateUserRequestSchema,
@@ -37,24 +41,27 @@ class UsersGatewayHTTPClient(HTTPClient):
         :param request:Словарь данных нового пользователя
         :return: Ответ от сервера (объект httpx.Response)
         """
-        return self.post(APIRoutes.USERS, json = request.model_dump(by_alias=True))
+        return self.post(APIRoutes.USERS, model=request)
 
-    def get_user(self, user_id: str) -> GetUserResponseSchema:
+    def get_user(self, user_id: str) -> ParsedResponse[GetUserResponseSchema]:
         response = self.get_user_api(user_id)
         #return GetUserResponseSchema(**response.json())
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetUserResponseSchema)
 
-    def create_user(self) -> CreateUserResponseSchema:
+    def create_user(self) -> ParsedResponse[CreateUserResponseSchema]:
         request = CreateUserRequestSchema()
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, CreateUserResponseSchema)
 
 
 def build_user_gateway_http_client()->UsersGatewayHTTPClient:
     return UsersGatewayHTTPClient(client=build_gateway_http_client())
 
 # Новый билдер для нагрузочного тестирования
-def build_users_gateway_locust_http_client(environment: Environment) -> UsersGatewayHTTPClient:
+def build_users_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient адаптированного под Locust.
 
@@ -62,6 +69,11 @@ def build_users_gateway_locust_http_client(environment: Environment) -> UsersGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: готовый Locust httpx.Client, общий для всех клиентов виртуального пользователя
+                   (если не передан, клиент создаётся через build_gateway_locust_http_client).
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return UsersGatewayHTTPClient(
+        client=client or build_gateway_locust_http_client(environment),
+        parser=build_gateway_locust_response_parser()
+    )
\ No newline at end of file
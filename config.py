@@ -1,9 +1,14 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Импортируем вложенные модели
+from tools.config.fakers import FakerConfig
 from tools.config.grpс import GRPCClientConfig
+from tools.config.histogram import HistogramConfig
 from tools.config.http import HTTPClientConfig
 from tools.config.locust import LocustUserConfig
+from tools.config.seeds import SeedsConfig
+from tools.config.shape import LoadShapeConfig
 
 
 class Settings(BaseSettings):
@@ -19,6 +24,10 @@ class Settings(BaseSettings):
     locust_user: LocustUserConfig  # Настройки виртуального пользователя
     gateway_http_client: HTTPClientConfig  # Настройки HTTP-клиента
     gateway_grpc_client: GRPCClientConfig  # Настройки gRPC-клиента
+    seeds: SeedsConfig = Field(default_factory=SeedsConfig)  # Настройки сидинга (например: SEEDS.MAX_WORKERS)
+    histogram: HistogramConfig = Field(default_factory=HistogramConfig)  # HDR-гистограммы задержек (HISTOGRAM.ENABLED)
+    fakers: FakerConfig = Field(default_factory=FakerConfig)  # Пулы тестовых данных (FAKERS.POOL_ENABLED)
+    load_shape: LoadShapeConfig = Field(default_factory=LoadShapeConfig)  # Форма нагрузки (LOAD_SHAPE.KIND)
 
 
 # Глобальный объект настроек — его можно импортировать в любом месте проекта
@@ -4,6 +4,8 @@ from locust.env import Environment
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
 from seeds.scenarios.existing_user_get_documents import ExistingUserGetDocumentsSeedsScenario
 from seeds.schema.result import SeedUserResult
+from tools.locust.seeds import init_seeds
+from tools.locust.shapes import ConfiguredLoadShape  # noqa: F401 — форма нагрузки из .conf (load-shape) или LOAD_SHAPE.KIND
 from tools.locust.user import LocustBaseUser
 
 
@@ -14,11 +16,8 @@ def init(environment: Environment, **kwargs):
     # Создаем экземпляр сидинг-сценария
     seeds_scenario = ExistingUserGetDocumentsSeedsScenario()
 
-    # Выполняем генерацию данных, если они ещё не созданы
-    seeds_scenario.build()
-
-    # Загружаем сгенерированных пользователей в окружение Locust
-    environment.seeds = seeds_scenario.load()
+    # Сидинг выполняется один раз: локально или на мастере, воркеры получают свой шард
+    init_seeds(environment, seeds_scenario)
 
 
 # Набор задач (TaskSet), который будет выполняться виртуальными пользователями.
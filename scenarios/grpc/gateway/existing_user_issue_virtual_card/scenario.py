@@ -4,6 +4,8 @@ from locust.env import Environment
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
 from seeds.scenarios.existing_user_issue_virtual_card import ExistingUserIssueVirtualCardSeedsScenario
 from seeds.schema.result import SeedUserResult
+from tools.locust.seeds import init_seeds
+from tools.locust.shapes import ConfiguredLoadShape  # noqa: F401 — форма нагрузки из .conf (load-shape) или LOAD_SHAPE.KIND
 from tools.locust.user import LocustBaseUser
 
 
@@ -14,12 +16,11 @@ def init(environment: Environment, **kwargs):
     
     Этот хук выполняется один раз при старте теста и подготавливает тестовые данные:
     1. Создает экземпляр сидинг-сценария ExistingUserIssueVirtualCardSeedsScenario
-    2. Выполняет построение тестовых данных методом build()
-    3. Загружает данные в окружение Locust методом load()
+    2. Выполняет сидинг и загружает данные в окружение Locust через init_seeds():
+       в распределённом запуске сидинг выполняет мастер, а каждый воркер получает свой шард пользователей
     """
     seeds_scenario = ExistingUserIssueVirtualCardSeedsScenario()
-    seeds_scenario.build()
-    environment.seeds = seeds_scenario.load()
+    init_seeds(environment, seeds_scenario)
 
 
 class IssueVirtualCardTaskSet(GatewayGRPCTaskSet):
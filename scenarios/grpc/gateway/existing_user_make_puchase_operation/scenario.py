@@ -4,13 +4,14 @@ from locust.env import Environment
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
 from seeds.scenarios.existing_user_make_purchase_operation import ExistingUserMakePurchaseOperationSeedsScenario
 from seeds.schema.result import SeedUserResult
+from tools.locust.seeds import init_seeds
+from tools.locust.shapes import ConfiguredLoadShape  # noqa: F401 — форма нагрузки из .conf (load-shape) или LOAD_SHAPE.KIND
 from tools.locust.user import LocustBaseUser
 
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
     seeds_scenario = ExistingUserMakePurchaseOperationSeedsScenario()
-    seeds_scenario.build()
-    environment.seeds = seeds_scenario.load()
+    init_seeds(environment, seeds_scenario)
 
 class ExistingMakePurchaseOperationTaskSet(GatewayGRPCTaskSet):
     seed_user: SeedUserResult
@@ -2,6 +2,7 @@ from locust import task
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
 from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import OpenDepositAccountResponse
 from contracts.services.users.rpc_create_user_pb2 import CreateUserResponse
+from tools.locust.shapes import ConfiguredLoadShape  # noqa: F401 — форма нагрузки из .conf (load-shape) или LOAD_SHAPE.KIND
 from tools.locust.user import LocustBaseUser
 
 
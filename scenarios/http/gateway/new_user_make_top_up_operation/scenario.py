@@ -4,6 +4,7 @@ from clients.http.gateway.accounts.schema import OpenDebitCardAccountResponseSch
 from clients.http.gateway.locust import GatewayHTTPSequentialTaskSet
 from clients.http.gateway.operations.schema import MakeTopUpOperationResponseSchema
 from clients.http.gateway.users.schema import CreateUserResponseSchema
+from tools.locust.shapes import ConfiguredLoadShape  # noqa: F401 — форма нагрузки из .conf (load-shape) или LOAD_SHAPE.KIND
 from tools.locust.user import LocustBaseUser
 
 
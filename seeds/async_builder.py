@@ -0,0 +1,450 @@
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+from clients.grpc.gateway.accounts.async_client import (
+    build_accounts_gateway_async_grpc_client,
+    AccountsGatewayAsyncGRPCClient
+)
+from clients.grpc.gateway.cards.async_client import build_cards_gateway_async_grpc_client, CardsGatewayAsyncGRPCClient
+from clients.grpc.gateway.operations.async_client import (
+    build_operations_gateway_async_grpc_client,
+    OperationsGatewayAsyncGRPCClient
+)
+from clients.grpc.gateway.users.async_client import build_users_gateway_async_grpc_client, UsersGatewayAsyncGRPCClient
+from clients.http.gateway.accounts.async_client import (
+    build_accounts_gateway_async_http_client,
+    AccountsGatewayAsyncHTTPClient
+)
+from clients.http.gateway.cards.async_client import build_cards_gateway_async_http_client, CardsGatewayAsyncHTTPClient
+from clients.http.gateway.operations.async_client import (
+    build_operations_gateway_async_http_client,
+    OperationsGatewayAsyncHTTPClient
+)
+from clients.http.gateway.users.async_client import build_users_gateway_async_http_client, UsersGatewayAsyncHTTPClient
+from config import settings
+from seeds.checkpoint import SeedsCheckpoint
+from seeds.schema.plan import (
+    SeedsPlan,
+    SeedUsersPlan,
+    SeedAccountsPlan,
+)
+from seeds.schema.result import (
+    SeedsResult,
+    SeedUserResult,
+    SeedCardResult,
+    SeedAccountResult,
+    SeedOperationResult
+)
+
+T = TypeVar("T")
+
+
+class AsyncSeedsBuilder:
+    """
+    AsyncSeedsBuilder — асинхронный аналог SeedsBuilder на grpc.aio / httpx.AsyncClient.
+
+    Пользователей создают max_users_concurrency воркеров, счета, карты и операции каждого пользователя
+    запускаются конкурентно, а количество одновременно выполняющихся запросов ограничивается семафором.
+    Семафор охватывает только сами запросы к шлюзу, поэтому вложенные сущности не могут
+    заблокировать родительские задачи.
+
+    Attributes:
+        users_gateway_client: Асинхронный клиент для работы с пользователями (HTTP или gRPC)
+        cards_gateway_client: Асинхронный клиент для выпуска карт
+        accounts_gateway_client: Асинхронный клиент для открытия счетов
+        operations_gateway_client: Асинхронный клиент для операций (топ-ап, покупки и т.д.)
+        max_concurrency: Максимальное количество одновременных запросов
+        max_users_concurrency: Максимальное количество пользователей, создаваемых одновременно
+    """
+
+    def __init__(
+            self,
+            users_gateway_client: UsersGatewayAsyncGRPCClient | UsersGatewayAsyncHTTPClient,
+            cards_gateway_client: CardsGatewayAsyncGRPCClient | CardsGatewayAsyncHTTPClient,
+            accounts_gateway_client: AccountsGatewayAsyncGRPCClient | AccountsGatewayAsyncHTTPClient,
+            operations_gateway_client: OperationsGatewayAsyncGRPCClient | OperationsGatewayAsyncHTTPClient,
+            max_concurrency: int = 100,
+            max_users_concurrency: int = 10
+    ):
+        self.users_gateway_client = users_gateway_client
+        self.cards_gateway_client = cards_gateway_client
+        self.accounts_gateway_client = accounts_gateway_client
+        self.operations_gateway_client = operations_gateway_client
+        self.max_concurrency = max_concurrency
+        self.max_users_concurrency = max_users_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def request(self, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Выполняет один запрос к шлюзу, соблюдая лимит одновременных запросов.
+
+        Args:
+            call: Функция, возвращающая корутину запроса
+
+        Returns:
+            T: Ответ шлюза
+        """
+        async with self.semaphore:
+            return await call()
+
+    async def build_entities(self, factory: Callable[[], Awaitable[T]], count: int) -> list[T]:
+        """
+        Конкурентно создаёт count независимых сущностей. Порядок результатов совпадает с порядком вызовов.
+
+        Args:
+            factory: Функция, возвращающая корутину создания одной сущности
+            count: Количество сущностей
+
+        Returns:
+            list[T]: Созданные сущности
+        """
+        return list(await asyncio.gather(*(factory() for _ in range(count))))
+
+    async def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        """
+        Выпускает физическую карту для заданного пользователя и счёта.
+
+        Args:
+            user_id: Идентификатор пользователя
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedCardResult: Результат с ID выпущенной карты
+        """
+        response = await self.request(
+            lambda: self.cards_gateway_client.issue_physical_card(user_id=user_id, account_id=account_id)
+        )
+        return SeedCardResult(card_id=response.card.id)
+
+    async def build_virtual_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        """
+        Выпускает виртуальную карту для заданного пользователя и счёта.
+
+        Args:
+            user_id: Идентификатор пользователя
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedCardResult: Результат с ID выпущенной виртуальной карты
+        """
+        response = await self.request(
+            lambda: self.cards_gateway_client.issue_virtual_card(user_id=user_id, account_id=account_id)
+        )
+        return SeedCardResult(card_id=response.card.id)
+
+    async def build_top_up_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Выполняет операцию пополнения на карту.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedOperationResult: Результат с ID выполненной операции
+        """
+        response = await self.request(
+            lambda: self.operations_gateway_client.make_top_up_operation(card_id=card_id, account_id=account_id)
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_purchase_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Выполняет операцию покупки по карте.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedOperationResult: Результат с ID выполненной операции
+        """
+        response = await self.request(
+            lambda: self.operations_gateway_client.make_purchase_operation(card_id=card_id, account_id=account_id)
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_transfer_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Выполняет операцию перевода средств.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedOperationResult: Результат с ID выполненной операции
+        """
+        response = await self.request(
+            lambda: self.operations_gateway_client.make_transfer_operation(card_id=card_id, account_id=account_id)
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_cash_withdrawal_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Выполняет операцию снятия наличных.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedOperationResult: Результат с ID выполненной операции
+        """
+        response = await self.request(
+            lambda: self.operations_gateway_client.make_cash_withdrawal_operation(
+                card_id=card_id,
+                account_id=account_id
+            )
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_savings_account_result(self, user_id: str) -> SeedAccountResult:
+        """
+        Открывает сберегательный счёт для пользователя.
+
+        Args:
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID созданного счёта
+        """
+        response = await self.request(lambda: self.accounts_gateway_client.open_savings_account(user_id=user_id))
+        return SeedAccountResult(account_id=response.account.id)
+
+    async def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
+        """
+        Открывает депозитный счёт для пользователя.
+
+        Args:
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID созданного счёта
+        """
+        response = await self.request(lambda: self.accounts_gateway_client.open_deposit_account(user_id=user_id))
+        return SeedAccountResult(account_id=response.account.id)
+
+    async def build_card_account_entities(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            account_id: str,
+            card_id: str
+    ) -> SeedAccountResult:
+        """
+        Конкурентно создаёт карты и операции для уже открытого карточного счёта.
+
+        Args:
+            plan: План карточного счёта (кол-во карт, операций и т.п.)
+            user_id: Идентификатор пользователя
+            account_id: Идентификатор счёта
+            card_id: Идентификатор карты, выпущенной вместе со счётом
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта, картами и операциями
+        """
+        (
+            physical_cards,
+            virtual_cards,
+            top_up_operations,
+            purchase_operations,
+            transfer_operations,
+            cash_withdrawal_operations
+        ) = await asyncio.gather(
+            self.build_entities(
+                lambda: self.build_physical_card_result(user_id=user_id, account_id=account_id),
+                count=plan.physical_cards.count
+            ),
+            self.build_entities(
+                lambda: self.build_virtual_card_result(user_id=user_id, account_id=account_id),
+                count=plan.virtual_cards.count
+            ),
+            self.build_entities(
+                lambda: self.build_top_up_operation_result(card_id=card_id, account_id=account_id),
+                count=plan.top_up_operations.count
+            ),
+            self.build_entities(
+                lambda: self.build_purchase_operation_result(card_id=card_id, account_id=account_id),
+                count=plan.purchase_operations.count
+            ),
+            self.build_entities(
+                lambda: self.build_transfer_operation_result(card_id=card_id, account_id=account_id),
+                count=plan.transfer_operations.count
+            ),
+            self.build_entities(
+                lambda: self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id),
+                count=plan.cash_withdrawal_operations.count
+            )
+        )
+
+        return SeedAccountResult(
+            account_id=account_id,
+            physical_cards=physical_cards,
+            virtual_cards=virtual_cards,
+            top_up_operations=top_up_operations,
+            purchase_operations=purchase_operations,
+            transfer_operations=transfer_operations,
+            cash_withdrawal_operations=cash_withdrawal_operations
+        )
+
+    async def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        """
+        Открывает дебетовый счёт для пользователя и создаёт на нём карты и операции согласно плану.
+
+        Args:
+            plan: План создания дебетового счёта (кол-во карт, операций и т.п.)
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
+        """
+        response = await self.request(lambda: self.accounts_gateway_client.open_debit_card_account(user_id=user_id))
+        return await self.build_card_account_entities(
+            plan=plan,
+            user_id=user_id,
+            account_id=response.account.id,
+            card_id=response.account.cards[0].id
+        )
+
+    async def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        """
+        Открывает кредитный счёт для пользователя и создаёт на нём карты и операции согласно плану.
+
+        Args:
+            plan: План создания кредитного счёта
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта и деталями операций
+        """
+        response = await self.request(lambda: self.accounts_gateway_client.open_credit_card_account(user_id=user_id))
+        return await self.build_card_account_entities(
+            plan=plan,
+            user_id=user_id,
+            account_id=response.account.id,
+            card_id=response.account.cards[0].id
+        )
+
+    async def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
+        """
+        Создаёт пользователя и конкурентно открывает все его счета согласно плану.
+
+        Args:
+            plan: План генерации пользователя
+
+        Returns:
+            SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
+        """
+        response = await self.request(self.users_gateway_client.create_user)
+        user_id = response.user.id
+
+        savings_accounts, deposit_accounts, debit_card_accounts, credit_card_accounts = await asyncio.gather(
+            self.build_entities(
+                lambda: self.build_savings_account_result(user_id=user_id),
+                count=plan.savings_accounts.count
+            ),
+            self.build_entities(
+                lambda: self.build_deposit_account_result(user_id=user_id),
+                count=plan.deposit_accounts.count
+            ),
+            self.build_entities(
+                lambda: self.build_debit_card_account_result(plan=plan.debit_card_accounts, user_id=user_id),
+                count=plan.debit_card_accounts.count
+            ),
+            self.build_entities(
+                lambda: self.build_credit_card_account_result(plan=plan.credit_card_accounts, user_id=user_id),
+                count=plan.credit_card_accounts.count
+            )
+        )
+
+        return SeedUserResult(
+            user_id=user_id,
+            savings_accounts=savings_accounts,
+            deposit_accounts=deposit_accounts,
+            debit_card_accounts=debit_card_accounts,
+            credit_card_accounts=credit_card_accounts
+        )
+
+    async def build(self, plan: SeedsPlan, checkpoint: SeedsCheckpoint | None = None) -> SeedsResult:
+        """
+        Генерирует полную структуру данных на основе плана. Порядок пользователей в результате
+        совпадает с последовательной генерацией.
+
+        Одновременно создаётся не больше max_users_concurrency пользователей: каждый воркер доводит
+        своего пользователя до конца и только потом берёт следующего, поэтому пользователи готовы
+        (и попадают в чекпоинт) по ходу сидинга, а не все разом в конце.
+
+        Если передан чекпоинт, уже созданные пользователи восстанавливаются из него,
+        а каждый новый пользователь дописывается в него сразу после создания.
+
+        Args:
+            plan: Полный план генерации данных
+            checkpoint: Чекпоинт для возобновления прерванного сидинга
+
+        Returns:
+            SeedsResult: Результат с данными всех созданных пользователей
+        """
+        restored = checkpoint.load()[:plan.users.count] if checkpoint else []
+        remaining = plan.users.count - len(restored)
+        users: list[SeedUserResult | None] = [None] * remaining
+        # Общий итератор номеров: в одном цикле событий воркеры не получат один номер дважды
+        indexes = iter(range(remaining))
+
+        async def build_users() -> None:
+            for index in indexes:
+                user = await self.build_user(plan=plan.users)
+                if checkpoint:
+                    checkpoint.append(user)
+                users[index] = user
+
+        await asyncio.gather(*(build_users() for _ in range(min(self.max_users_concurrency, remaining))))
+        return SeedsResult(users=restored + users)
+
+    async def close(self) -> None:
+        """
+        Закрывает каналы и пулы соединений всех клиентов.
+        """
+        await asyncio.gather(
+            self.users_gateway_client.close(),
+            self.cards_gateway_client.close(),
+            self.accounts_gateway_client.close(),
+            self.operations_gateway_client.close()
+        )
+
+
+def build_grpc_async_seeds_builder() -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания асинхронного сидера с использованием grpc.aio-клиентов.
+    Вызывать нужно внутри работающего цикла событий asyncio.
+
+    Returns:
+        AsyncSeedsBuilder: Инициализированный сидер с асинхронными gRPC-клиентами
+    """
+    return AsyncSeedsBuilder(
+        users_gateway_client=build_users_gateway_async_grpc_client(),
+        cards_gateway_client=build_cards_gateway_async_grpc_client(),
+        accounts_gateway_client=build_accounts_gateway_async_grpc_client(),
+        operations_gateway_client=build_operations_gateway_async_grpc_client(),
+        max_concurrency=settings.seeds.max_concurrency,
+        max_users_concurrency=settings.seeds.async_max_users
+    )
+
+
+def build_http_async_seeds_builder() -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания асинхронного сидера с использованием httpx.AsyncClient-клиентов.
+    Вызывать нужно внутри работающего цикла событий asyncio.
+
+    Returns:
+        AsyncSeedsBuilder: Инициализированный сидер с асинхронными HTTP-клиентами
+    """
+    return AsyncSeedsBuilder(
+        users_gateway_client=build_users_gateway_async_http_client(),
+        cards_gateway_client=build_cards_gateway_async_http_client(),
+        accounts_gateway_client=build_accounts_gateway_async_http_client(),
+        operations_gateway_client=build_operations_gateway_async_http_client(),
+        max_concurrency=settings.seeds.max_concurrency,
+        max_users_concurrency=settings.seeds.async_max_users
+    )
+
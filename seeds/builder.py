@@ -1,3 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from grpc import Future
+
 from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client, AccountsGatewayGRPCClient
 from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_client, CardsGatewayGRPCClient
 from clients.grpc.gateway.operations.client import build_operations_gateway_grpc_client, OperationsGatewayGRPCClient
@@ -6,6 +11,7 @@ from clients.http.gateway.accounts.client import build_accounts_gateway_http_cli
 from clients.http.gateway.cards.client import build_cards_gateway_http_client, CardsGatewayHTTPClient
 from clients.http.gateway.operations.client import build_operations_gateway_http_client, OperationsGatewayHTTPClient
 from clients.http.gateway.users.client import build_user_gateway_http_client, UsersGatewayHTTPClient
+from seeds.checkpoint import SeedsCheckpoint
 from seeds.schema.plan import (
     SeedsPlan,
     SeedUsersPlan,
@@ -18,6 +24,10 @@ from seeds.schema.result import (
     SeedAccountResult,
     SeedOperationResult
 )
+from config import settings
+from tools.fakers import fake
+
+T = TypeVar("T")
 
 
 class SeedsBuilder:
@@ -30,6 +40,10 @@ class SeedsBuilder:
         cards_gateway_client: Клиент для выпуска карт
         accounts_gateway_client: Клиент для открытия счетов
         operations_gateway_client: Клиент для операций (топ-ап, покупки и т.д.)
+        max_workers: Сколько пользователей создаётся параллельно (1 — последовательно)
+        entities_max_workers: Сколько карт/операций одного счёта создаётся параллельно (1 — последовательно)
+        batch_size: Сколько карт/операций счёта отправляется одним пакетом через .future() (1 — без пакетов, только gRPC)
+        fake_bulk_size: Каким пакетом генерируются суммы, категории и статусы операций (0 — по одному)
     """
 
     def __init__(
@@ -37,12 +51,45 @@ class SeedsBuilder:
             users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
             cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
             accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
-            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient,
+            max_workers: int = 1,
+            entities_max_workers: int = 1,
+            batch_size: int = 1,
+            fake_bulk_size: int = 0
     ):
         self.users_gateway_client = users_gateway_client
         self.cards_gateway_client = cards_gateway_client
         self.accounts_gateway_client = accounts_gateway_client
         self.operations_gateway_client = operations_gateway_client
+        self.max_workers = max_workers
+        self.entities_max_workers = entities_max_workers
+        self.batch_size = batch_size
+        self.fake_bulk_size = fake_bulk_size
+
+        # Пул для вложенных сущностей счёта. Существует только на время build().
+        # Пул отдельный от пула пользователей: задача пользователя ждёт свои карты и операции,
+        # и если бы они стояли в той же очереди, заполненный пул мог бы заблокировать сам себя.
+        self.entities_executor: ThreadPoolExecutor | None = None
+
+    def build_entities(self, factory: Callable[[], T], count: int) -> list[T]:
+        """
+        Создаёт count независимых сущностей (карт, операций, счетов без вложений).
+
+        Если пул сущностей активен, вызовы распределяются по нему, иначе выполняются по очереди.
+        Порядок результатов всегда совпадает с порядком вызовов.
+
+        Args:
+            factory: Функция, создающая одну сущность
+            count: Количество сущностей
+
+        Returns:
+            list[T]: Созданные сущности
+        """
+        if self.entities_executor is None or count <= 1:
+            return [factory() for _ in range(count)]
+
+        futures = [self.entities_executor.submit(factory) for _ in range(count)]
+        return [future.result() for future in futures]
 
     def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
         """
@@ -172,6 +219,128 @@ class SeedsBuilder:
         response = self.accounts_gateway_client.open_deposit_account(user_id=user_id)
         return SeedAccountResult(account_id=response.account.id)
 
+    def build_batch(self, submit: Callable[[], Future], parse: Callable[[Any], T], count: int) -> list[T]:
+        """
+        Выполняет count однотипных gRPC-вызовов пакетами: в каждом пакете все запросы отправляются
+        через .future() без ожидания, а затем ответы собираются вместе. Пакет стоит примерно
+        одну сетевую задержку вместо len(пакет) последовательных.
+
+        Args:
+            submit: Отправка запроса, возвращающая grpc.Future
+            parse: Разбор ответа в результат
+            count: Количество вызовов
+
+        Returns:
+            list[T]: Результаты в порядке вызовов
+        """
+        results: list[T] = []
+        for start in range(0, count, self.batch_size):
+            futures = [submit() for _ in range(min(self.batch_size, count - start))]
+            results.extend(parse(future.result()) for future in futures)
+        return results
+
+    def build_card_account_entities(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            account_id: str,
+            card_id: str
+    ) -> SeedAccountResult:
+        """
+        Создаёт карты и операции для уже открытого карточного счёта.
+
+        При batch_size > 1 карты и операции счёта отправляются пакетами через .future()
+        (только для gRPC-клиентов): отдельно по каждому типу и в том же порядке, что и через build_entities.
+
+        Args:
+            plan: План карточного счёта (кол-во карт, операций и т.п.)
+            user_id: Идентификатор пользователя
+            account_id: Идентификатор счёта
+            card_id: Идентификатор карты, выпущенной вместе со счётом
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта, картами и операциями
+        """
+        if self.batch_size <= 1:
+            return SeedAccountResult(
+                account_id=account_id,
+                physical_cards=self.build_entities(
+                    lambda: self.build_physical_card_result(user_id=user_id, account_id=account_id),
+                    count=plan.physical_cards.count
+                ),
+                virtual_cards=self.build_entities(
+                    lambda: self.build_virtual_card_result(user_id=user_id, account_id=account_id),
+                    count=plan.virtual_cards.count
+                ),
+                top_up_operations=self.build_entities(
+                    lambda: self.build_top_up_operation_result(card_id=card_id, account_id=account_id),
+                    count=plan.top_up_operations.count
+                ),
+                purchase_operations=self.build_entities(
+                    lambda: self.build_purchase_operation_result(card_id=card_id, account_id=account_id),
+                    count=plan.purchase_operations.count
+                ),
+                transfer_operations=self.build_entities(
+                    lambda: self.build_transfer_operation_result(card_id=card_id, account_id=account_id),
+                    count=plan.transfer_operations.count
+                ),
+                cash_withdrawal_operations=self.build_entities(
+                    lambda: self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id),
+                    count=plan.cash_withdrawal_operations.count
+                )
+            )
+
+        def parse_card(response) -> SeedCardResult:
+            return SeedCardResult(card_id=response.card.id)
+
+        def parse_operation(response) -> SeedOperationResult:
+            return SeedOperationResult(operation_id=response.operation.id)
+
+        # Каждый пакет содержит вызовы одного типа, а типы идут по очереди, как без пакетов:
+        # пополнения завершаются до покупок, переводов и снятий, которые списывают средства со счёта
+        cards_client = self.cards_gateway_client
+        operations_client = self.operations_gateway_client
+        physical_cards = self.build_batch(
+            lambda: cards_client.issue_physical_card_future(user_id=user_id, account_id=account_id),
+            parse_card,
+            count=plan.physical_cards.count
+        )
+        virtual_cards = self.build_batch(
+            lambda: cards_client.issue_virtual_card_future(user_id=user_id, account_id=account_id),
+            parse_card,
+            count=plan.virtual_cards.count
+        )
+        top_up_operations = self.build_batch(
+            lambda: operations_client.make_top_up_operation_future(card_id=card_id, account_id=account_id),
+            parse_operation,
+            count=plan.top_up_operations.count
+        )
+        purchase_operations = self.build_batch(
+            lambda: operations_client.make_purchase_operation_future(card_id=card_id, account_id=account_id),
+            parse_operation,
+            count=plan.purchase_operations.count
+        )
+        transfer_operations = self.build_batch(
+            lambda: operations_client.make_transfer_operation_future(card_id=card_id, account_id=account_id),
+            parse_operation,
+            count=plan.transfer_operations.count
+        )
+        cash_withdrawal_operations = self.build_batch(
+            lambda: operations_client.make_cash_withdrawal_operation_future(card_id=card_id, account_id=account_id),
+            parse_operation,
+            count=plan.cash_withdrawal_operations.count
+        )
+
+        return SeedAccountResult(
+            account_id=account_id,
+            physical_cards=physical_cards,
+            virtual_cards=virtual_cards,
+            top_up_operations=top_up_operations,
+            purchase_operations=purchase_operations,
+            transfer_operations=transfer_operations,
+            cash_withdrawal_operations=cash_withdrawal_operations
+        )
+
     def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
         """
         Открывает дебетовый счёт для пользователя и при необходимости:
@@ -189,35 +358,11 @@ class SeedsBuilder:
             SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
         """
         response = self.accounts_gateway_client.open_debit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
+        return self.build_card_account_entities(
+            plan=plan,
+            user_id=user_id,
             account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
-            ]
+            card_id=response.account.cards[0].id
         )
 
     def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
@@ -237,35 +382,11 @@ class SeedsBuilder:
             SeedAccountResult: Результат с ID счёта и деталями операций
         """
         response = self.accounts_gateway_client.open_credit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
+        return self.build_card_account_entities(
+            plan=plan,
+            user_id=user_id,
             account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
-            ]
+            card_id=response.account.cards[0].id
         )
 
     def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
@@ -284,14 +405,14 @@ class SeedsBuilder:
 
         return SeedUserResult(
             user_id=response.user.id,
-            savings_accounts=[
-                self.build_savings_account_result(user_id=response.user.id)
-                for _ in range(plan.savings_accounts.count)
-            ],
-            deposit_accounts=[
-                self.build_deposit_account_result(user_id=response.user.id)
-                for _ in range(plan.deposit_accounts.count)
-            ],
+            savings_accounts=self.build_entities(
+                lambda: self.build_savings_account_result(user_id=response.user.id),
+                count=plan.savings_accounts.count
+            ),
+            deposit_accounts=self.build_entities(
+                lambda: self.build_deposit_account_result(user_id=response.user.id),
+                count=plan.deposit_accounts.count
+            ),
             debit_card_accounts=[
                 self.build_debit_card_account_result(plan=plan.debit_card_accounts, user_id=response.user.id)
                 for _ in range(plan.debit_card_accounts.count)
@@ -302,19 +423,57 @@ class SeedsBuilder:
             ]
         )
 
-    def build(self, plan: SeedsPlan) -> SeedsResult:
+    def build(self, plan: SeedsPlan, checkpoint: SeedsCheckpoint | None = None) -> SeedsResult:
         """
         Генерирует полную структуру данных на основе плана:
         - создаёт указанное количество пользователей
         - каждому пользователю присваиваются счета, карты и операции
 
+        Если max_workers > 1, пользователи создаются параллельно в пуле потоков
+        (под Locust потоки gevent-патчены и становятся гринлетами).
+        Порядок пользователей в результате совпадает с последовательной генерацией.
+
+        Если fake_bulk_size > 1, данные запросов генерируются пакетами (Fake.bulk) на время сидинга.
+
+        Если передан чекпоинт, уже созданные пользователи восстанавливаются из него,
+        а каждый новый пользователь дописывается в него сразу после создания.
+
         Args:
             plan: Полный план генерации данных
+            checkpoint: Чекпоинт для возобновления прерванного сидинга
 
         Returns:
             SeedsResult: Результат с данными всех созданных пользователей
         """
-        return SeedsResult(users=[self.build_user(plan=plan.users) for _ in range(plan.users.count)])
+        # Данные запросов (суммы, категории, статусы) генерируются пакетами, а не вызовом Faker на каждую операцию.
+        # Пакетный режим включается только на время сидинга и не меняет глобальный fake для остального процесса
+        with fake.bulk(self.fake_bulk_size):
+            users = checkpoint.load()[:plan.users.count] if checkpoint else []
+            remaining = plan.users.count - len(users)
+
+            def build_user() -> SeedUserResult:
+                user = self.build_user(plan=plan.users)
+                if checkpoint:
+                    checkpoint.append(user)
+                return user
+
+            if self.max_workers <= 1 and self.entities_max_workers <= 1:
+                return SeedsResult(users=users + [build_user() for _ in range(remaining)])
+
+            with (
+                ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="seeds-users") as users_executor,
+                ThreadPoolExecutor(
+                    max_workers=self.entities_max_workers,
+                    thread_name_prefix="seeds-entities"
+                ) as entities_executor
+            ):
+                self.entities_executor = entities_executor if self.entities_max_workers > 1 else None
+                try:
+                    users += users_executor.map(lambda _: build_user(), range(remaining))
+                finally:
+                    self.entities_executor = None
+
+            return SeedsResult(users=users)
 
 
 def build_grpc_seeds_builder() -> SeedsBuilder:
@@ -328,13 +487,18 @@ def build_grpc_seeds_builder() -> SeedsBuilder:
         users_gateway_client=build_users_gateway_grpc_client(),
         cards_gateway_client=build_cards_gateway_grpc_client(),
         accounts_gateway_client=build_accounts_gateway_grpc_client(),
-        operations_gateway_client=build_operations_gateway_grpc_client()
+        operations_gateway_client=build_operations_gateway_grpc_client(),
+        max_workers=settings.seeds.max_workers,
+        entities_max_workers=settings.seeds.entities_max_workers,
+        batch_size=settings.seeds.batch_size,
+        fake_bulk_size=settings.fakers.bulk_size
     )
 
 
-def build_http_seeds_builder():
+def build_http_seeds_builder() -> SeedsBuilder:
     """
     Фабрика для создания сидера с использованием HTTP-клиентов.
+    У HTTP-клиентов нет .future(), поэтому пакетная отправка не используется.
 
     Returns:
         SeedsBuilder: Инициализированный сидер с HTTP-клиентами
@@ -343,5 +507,8 @@ def build_http_seeds_builder():
         users_gateway_client=build_user_gateway_http_client(),
         cards_gateway_client=build_cards_gateway_http_client(),
         accounts_gateway_client=build_accounts_gateway_http_client(),
-        operations_gateway_client=build_operations_gateway_http_client()
+        operations_gateway_client=build_operations_gateway_http_client(),
+        max_workers=settings.seeds.max_workers,
+        entities_max_workers=settings.seeds.entities_max_workers,
+        fake_bulk_size=settings.fakers.bulk_size
     )
\ No newline at end of file
@@ -0,0 +1,116 @@
+import hashlib
+import os
+import time
+
+from pydantic import ValidationError
+
+from seeds.dumps import get_seeds_file
+from seeds.schema.cache import SeedsCacheMeta
+from seeds.schema.plan import SeedsPlan
+from tools.config.seeds import SeedsDumpFormat
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_CACHE")
+
+
+def get_seeds_meta_file(seeds_file: str) -> str:
+    """
+    Возвращает путь к файлу метаданных дампа сидинга.
+
+    Метаданные хранятся отдельно для каждого файла дампа: дампы сценария в разных форматах
+    могли быть созданы для разных планов, и отпечаток одного не должен подтверждать другой.
+
+    :param seeds_file: Путь к файлу дампа.
+    :return: Путь вида ./dumps/{scenario}_seeds.{json|ndjson|columnar}.meta.json
+    """
+    return f"{seeds_file}.meta.json"
+
+
+def build_seeds_fingerprint(plan: SeedsPlan, gateway: str) -> str:
+    """
+    Считает отпечаток плана сидинга: sha256 от JSON плана и адреса целевого шлюза.
+
+    Одинаковый план на том же шлюзе даёт тот же отпечаток, поэтому готовый дамп можно переиспользовать.
+
+    :param plan: План сидинга.
+    :param gateway: Адрес шлюза, на котором создаются данные (например, "grpc://localhost:9003").
+    :return: Шестнадцатеричная строка sha256.
+    """
+    payload = f"{gateway}\n{plan.model_dump_json()}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def save_seeds_fingerprint(seeds_file: str, fingerprint: str) -> None:
+    """
+    Сохраняет отпечаток плана рядом с дампом сидинга.
+
+    :param seeds_file: Путь к файлу дампа.
+    :param fingerprint: Отпечаток плана, для которого был создан дамп.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    meta_file = get_seeds_meta_file(seeds_file)
+    meta = SeedsCacheMeta(fingerprint=fingerprint, created_at=time.time())
+    with open(meta_file, 'w+', encoding="utf-8") as file:
+        file.write(meta.model_dump_json())
+
+    logger.debug(f"Seeding fingerprint saved to file: {meta_file}")
+
+
+def load_seeds_fingerprint(seeds_file: str) -> SeedsCacheMeta | None:
+    """
+    Загружает метаданные дампа сидинга.
+
+    :param seeds_file: Путь к файлу дампа.
+    :return: SeedsCacheMeta или None, если файла нет или он повреждён.
+    """
+    meta_file = get_seeds_meta_file(seeds_file)
+    if not os.path.exists(meta_file):
+        return None
+
+    try:
+        with open(meta_file, 'r', encoding="utf-8") as file:
+            return SeedsCacheMeta.model_validate_json(file.read())
+    except ValidationError:
+        logger.warning(f"Seeding fingerprint file is corrupted: {meta_file}")
+        return None
+
+
+def invalidate_seeds_cache(scenario: str) -> None:
+    """
+    Инвалидирует кэш сидинга: удаляет файлы метаданных дампов во всех форматах, после чего дамп будет пересоздан.
+
+    :param scenario: Название сценария нагрузки.
+    """
+    for dump_format in SeedsDumpFormat:
+        meta_file = get_seeds_meta_file(get_seeds_file(scenario, dump_format))
+        if os.path.exists(meta_file):
+            os.remove(meta_file)
+            logger.debug(f"Seeding cache invalidated: {meta_file}")
+
+
+def is_seeds_cache_valid(seeds_file: str, fingerprint: str, ttl: float | None = None) -> bool:
+    """
+    Проверяет, можно ли переиспользовать существующий дамп сидинга.
+
+    Дамп считается валидным, если он существует, отпечаток из его метаданных совпадает с текущим
+    и (если задан TTL) он создан не раньше, чем ttl секунд назад.
+
+    :param seeds_file: Путь к файлу дампа.
+    :param fingerprint: Отпечаток текущего плана сидинга.
+    :param ttl: Время жизни дампа в секундах (None — бессрочно).
+    :return: True, если дамп можно использовать без повторного сидинга.
+    """
+    if not os.path.exists(seeds_file):
+        return False
+
+    meta = load_seeds_fingerprint(seeds_file)
+    if meta is None or meta.fingerprint != fingerprint:
+        return False
+
+    if ttl is not None and time.time() - meta.created_at > ttl:
+        logger.debug(f"Seeding cache expired for dump: {seeds_file}")
+        return False
+
+    return True
@@ -0,0 +1,94 @@
+import os
+import threading
+import time
+
+from pydantic import ValidationError
+
+from seeds.dumps import write_seeds_user, iter_seeds_users_file
+from seeds.schema.cache import SeedsCacheMeta
+from seeds.schema.result import SeedUserResult
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_CHECKPOINT")
+
+
+class SeedsCheckpoint:
+    """
+    Чекпоинт сидинга: NDJSON-файл, в который каждый готовый SeedUserResult дописывается отдельной строкой
+    сразу после создания.
+
+    Если сидинг упал посередине (например, таймаут шлюза на 280-м пользователе из 300),
+    повторный запуск восстановит уже созданных пользователей из чекпоинта и создаст только недостающих.
+
+    Первая строка файла — заголовок с отпечатком плана сидинга и шлюза (SeedsCacheMeta).
+    Чекпоинт, созданный для другого плана или шлюза, не восстанавливается, а удаляется.
+    """
+
+    def __init__(self, scenario: str, fingerprint: str):
+        """
+        :param scenario: Название сценария нагрузки. Используется для генерации имени файла.
+        :param fingerprint: Отпечаток плана сидинга и шлюза (см. seeds.cache.build_seeds_fingerprint).
+        """
+        self.scenario = scenario
+        self.fingerprint = fingerprint
+        self.checkpoint_file = f"./dumps/{scenario}_seeds.checkpoint"
+        # Пользователи могут создаваться параллельно, поэтому запись в файл защищаем блокировкой
+        self.lock = threading.Lock()
+
+    def load_header(self) -> SeedsCacheMeta | None:
+        """
+        :return: Заголовок чекпоинта или None, если он отсутствует или повреждён.
+        """
+        with open(self.checkpoint_file, 'r', encoding="utf-8") as file:
+            try:
+                return SeedsCacheMeta.model_validate_json(file.readline())
+            except ValidationError:
+                return None
+
+    def load(self) -> list[SeedUserResult]:
+        """
+        Загружает пользователей, сохранённых в чекпоинте предыдущим запуском.
+
+        Битая последняя строка (процесс упал во время записи) пропускается.
+        Если отпечаток в заголовке не совпадает с текущим, чекпоинт удаляется.
+
+        :return: Список восстановленных пользователей (пустой, если чекпоинта нет или он от другого плана).
+        """
+        if not os.path.exists(self.checkpoint_file):
+            return []
+
+        header = self.load_header()
+        if header is None or header.fingerprint != self.fingerprint:
+            logger.warning(f"Discarding seeding checkpoint of another plan or gateway: {self.checkpoint_file}")
+            self.clear()
+            return []
+
+        users = list(iter_seeds_users_file(self.checkpoint_file, skip_corrupted=True, skip_header=True))
+        logger.debug(f"Restored {len(users)} users from seeding checkpoint: {self.checkpoint_file}")
+        return users
+
+    def append(self, user: SeedUserResult) -> None:
+        """
+        Дописывает готового пользователя в чекпоинт и сразу сбрасывает буфер на диск.
+
+        :param user: Полностью созданный пользователь со всеми счетами, картами и операциями.
+        """
+        if not os.path.exists("dumps"):
+            os.makedirs("dumps", exist_ok=True)
+
+        with self.lock:
+            is_new = not os.path.exists(self.checkpoint_file)
+            with open(self.checkpoint_file, 'a', encoding="utf-8") as file:
+                if is_new:
+                    header = SeedsCacheMeta(fingerprint=self.fingerprint, created_at=time.time())
+                    file.write(header.model_dump_json() + "\n")
+                write_seeds_user(file, user)
+                file.flush()
+
+    def clear(self) -> None:
+        """
+        Удаляет файл чекпоинта. Вызывается после успешного сохранения полного результата сидинга.
+        """
+        if os.path.exists(self.checkpoint_file):
+            os.remove(self.checkpoint_file)
+            logger.debug(f"Seeding checkpoint removed: {self.checkpoint_file}")
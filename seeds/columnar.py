@@ -0,0 +1,395 @@
+import itertools
+import json
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+from typing import Iterable
+
+from seeds.dispenser import SeedsDispenser
+from seeds.schema.result import SeedUserResult, SeedAccountResult, SeedCardResult, SeedOperationResult
+from tools.config.seeds import SeedsExhaustionPolicy
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_COLUMNAR")
+
+# Сигнатура файла колоночного хранилища и версия формата
+MAGIC = b"SEEDCOL1"
+HEADER_LENGTH = struct.Struct("<I")
+
+# Типы счетов, карт и операций кодируются одним байтом.
+# Порядок совпадает с порядком полей в SeedUserResult/SeedAccountResult.
+ACCOUNT_KINDS = ("deposit_accounts", "savings_accounts", "debit_card_accounts", "credit_card_accounts")
+CARD_KINDS = ("physical_cards", "virtual_cards")
+OPERATION_KINDS = (
+    "top_up_operations",
+    "purchase_operations",
+    "transfer_operations",
+    "cash_withdrawal_operations"
+)
+
+
+def build_row_structs(id_width: int) -> tuple[struct.Struct, struct.Struct, struct.Struct]:
+    """
+    Возвращает структуры строк таблиц для заданной ширины идентификатора.
+
+    - пользователь: id, индекс первого счёта, количество счетов
+    - счёт: id, тип, индекс первой карты, количество карт, индекс первой операции, количество операций
+    - карта/операция: id, тип
+
+    :param id_width: Ширина поля идентификатора в байтах.
+    :return: Структуры строк пользователей, счетов и карт/операций.
+    """
+    return (
+        struct.Struct(f"<{id_width}sII"),
+        struct.Struct(f"<{id_width}sBIIII"),
+        struct.Struct(f"<{id_width}sB")
+    )
+
+
+def write_seeds_columnar(users: Iterable[SeedUserResult], seeds_file: str) -> None:
+    """
+    Упаковывает пользователей в колоночный файл с таблицами фиксированной ширины.
+
+    Все идентификаторы хранятся в полях одинаковой ширины (по самому длинному ID),
+    поэтому строка любой таблицы находится по индексу за O(1) без разбора файла.
+
+    :param users: Пользователи (список или итератор).
+    :param seeds_file: Путь к создаваемому файлу.
+    """
+    user_rows: list[tuple[bytes, int, int]] = []
+    account_rows: list[tuple[bytes, int, int, int, int, int]] = []
+    entity_rows: dict[str, list[tuple[bytes, int]]] = {"cards": [], "operations": []}
+
+    for user in users:
+        accounts_start = len(account_rows)
+        for account_kind, account_field in enumerate(ACCOUNT_KINDS):
+            for account in getattr(user, account_field):
+                cards_start = len(entity_rows["cards"])
+                for card_kind, card_field in enumerate(CARD_KINDS):
+                    entity_rows["cards"].extend(
+                        (card.card_id.encode(), card_kind) for card in getattr(account, card_field)
+                    )
+
+                operations_start = len(entity_rows["operations"])
+                for operation_kind, operation_field in enumerate(OPERATION_KINDS):
+                    entity_rows["operations"].extend(
+                        (operation.operation_id.encode(), operation_kind)
+                        for operation in getattr(account, operation_field)
+                    )
+
+                account_rows.append((
+                    account.account_id.encode(),
+                    account_kind,
+                    cards_start,
+                    len(entity_rows["cards"]) - cards_start,
+                    operations_start,
+                    len(entity_rows["operations"]) - operations_start
+                ))
+
+        user_rows.append((user.user_id.encode(), accounts_start, len(account_rows) - accounts_start))
+
+    id_width = max(
+        (len(row[0]) for rows in (user_rows, account_rows, *entity_rows.values()) for row in rows),
+        default=1
+    )
+    user_struct, account_struct, entity_struct = build_row_structs(id_width)
+
+    header = json.dumps({
+        "id_width": id_width,
+        "users": len(user_rows),
+        "accounts": len(account_rows),
+        "cards": len(entity_rows["cards"]),
+        "operations": len(entity_rows["operations"])
+    }).encode()
+
+    temporary_file = f"{seeds_file}.tmp"
+    with open(temporary_file, 'wb') as file:
+        file.write(MAGIC)
+        file.write(HEADER_LENGTH.pack(len(header)))
+        file.write(header)
+        for row in user_rows:
+            file.write(user_struct.pack(*row))
+        for row in account_rows:
+            file.write(account_struct.pack(*row))
+        for row in itertools.chain(entity_rows["cards"], entity_rows["operations"]):
+            file.write(entity_struct.pack(*row))
+    os.replace(temporary_file, seeds_file)
+
+    logger.debug(f"Columnar seeds store written: {seeds_file} ({len(user_rows)} users, id width {id_width})")
+
+
+class SeedCardView:
+    """
+    Лёгкое представление карты из колоночного хранилища. Совместимо по атрибутам с SeedCardResult.
+    """
+    __slots__ = ("card_id",)
+
+    def __init__(self, card_id: str):
+        self.card_id = card_id
+
+
+class SeedOperationView:
+    """
+    Лёгкое представление операции из колоночного хранилища. Совместимо по атрибутам с SeedOperationResult.
+    """
+    __slots__ = ("operation_id",)
+
+    def __init__(self, operation_id: str):
+        self.operation_id = operation_id
+
+
+class SeedAccountView:
+    """
+    Лёгкое представление счёта из колоночного хранилища. Совместимо по атрибутам с SeedAccountResult.
+
+    Карты и операции читаются из mmap только при обращении к соответствующему атрибуту.
+    """
+    __slots__ = ("store", "account_id", "cards_start", "cards_count", "operations_start", "operations_count")
+
+    def __init__(
+            self,
+            store: "SeedsColumnarStore",
+            account_id: str,
+            cards_start: int,
+            cards_count: int,
+            operations_start: int,
+            operations_count: int
+    ):
+        self.store = store
+        self.account_id = account_id
+        self.cards_start = cards_start
+        self.cards_count = cards_count
+        self.operations_start = operations_start
+        self.operations_count = operations_count
+
+    def get_cards(self, kind: int) -> list[SeedCardView]:
+        return [
+            SeedCardView(card_id)
+            for card_id, card_kind in self.store.read_cards(self.cards_start, self.cards_count)
+            if card_kind == kind
+        ]
+
+    def get_operations(self, kind: int) -> list[SeedOperationView]:
+        return [
+            SeedOperationView(operation_id)
+            for operation_id, operation_kind in self.store.read_operations(self.operations_start, self.operations_count)
+            if operation_kind == kind
+        ]
+
+    @property
+    def physical_cards(self) -> list[SeedCardView]:
+        return self.get_cards(CARD_KINDS.index("physical_cards"))
+
+    @property
+    def virtual_cards(self) -> list[SeedCardView]:
+        return self.get_cards(CARD_KINDS.index("virtual_cards"))
+
+    @property
+    def top_up_operations(self) -> list[SeedOperationView]:
+        return self.get_operations(OPERATION_KINDS.index("top_up_operations"))
+
+    @property
+    def purchase_operations(self) -> list[SeedOperationView]:
+        return self.get_operations(OPERATION_KINDS.index("purchase_operations"))
+
+    @property
+    def transfer_operations(self) -> list[SeedOperationView]:
+        return self.get_operations(OPERATION_KINDS.index("transfer_operations"))
+
+    @property
+    def cash_withdrawal_operations(self) -> list[SeedOperationView]:
+        return self.get_operations(OPERATION_KINDS.index("cash_withdrawal_operations"))
+
+    def to_result(self) -> SeedAccountResult:
+        """
+        Материализует счёт в полноценную pydantic-модель.
+        """
+        return SeedAccountResult(
+            account_id=self.account_id,
+            **{
+                field: [SeedCardResult(card_id=card.card_id) for card in getattr(self, field)]
+                for field in CARD_KINDS
+            },
+            **{
+                field: [SeedOperationResult(operation_id=operation.operation_id) for operation in getattr(self, field)]
+                for field in OPERATION_KINDS
+            }
+        )
+
+
+class SeedUserView:
+    """
+    Лёгкое представление пользователя из колоночного хранилища. Совместимо по атрибутам с SeedUserResult,
+    поэтому сценарии Locust работают с ним так же, как с обычным результатом сидинга.
+    """
+    __slots__ = ("store", "user_id", "accounts_start", "accounts_count")
+
+    def __init__(self, store: "SeedsColumnarStore", user_id: str, accounts_start: int, accounts_count: int):
+        self.store = store
+        self.user_id = user_id
+        self.accounts_start = accounts_start
+        self.accounts_count = accounts_count
+
+    def get_accounts(self, kind: int) -> list[SeedAccountView]:
+        return [
+            account
+            for account_kind, account in self.store.read_accounts(self.accounts_start, self.accounts_count)
+            if account_kind == kind
+        ]
+
+    @property
+    def deposit_accounts(self) -> list[SeedAccountView]:
+        return self.get_accounts(ACCOUNT_KINDS.index("deposit_accounts"))
+
+    @property
+    def savings_accounts(self) -> list[SeedAccountView]:
+        return self.get_accounts(ACCOUNT_KINDS.index("savings_accounts"))
+
+    @property
+    def debit_card_accounts(self) -> list[SeedAccountView]:
+        return self.get_accounts(ACCOUNT_KINDS.index("debit_card_accounts"))
+
+    @property
+    def credit_card_accounts(self) -> list[SeedAccountView]:
+        return self.get_accounts(ACCOUNT_KINDS.index("credit_card_accounts"))
+
+    def to_result(self) -> SeedUserResult:
+        """
+        Материализует пользователя в полноценную pydantic-модель.
+        """
+        return SeedUserResult(
+            user_id=self.user_id,
+            **{field: [account.to_result() for account in getattr(self, field)] for field in ACCOUNT_KINDS}
+        )
+
+
+class SeedsColumnarStore(Sequence):
+    """
+    Колоночное хранилище результатов сидинга поверх memory-mapped файла.
+
+    Файл открывается только на чтение через mmap, поэтому все воркеры Locust на одном хосте
+    разделяют одни и те же страницы page cache, а на каждого пользователя в памяти процесса
+    создаётся лишь лёгкое представление при обращении к нему.
+
+    Предоставляет тот же интерфейс раздачи пользователей, что и SeedsResult.
+    """
+
+    def __init__(self, seeds_file: str):
+        """
+        :param seeds_file: Путь к файлу, созданному write_seeds_columnar.
+        """
+        self.seeds_file = seeds_file
+        self.file = open(seeds_file, 'rb')
+        self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"File is not a columnar seeds store: {seeds_file}")
+
+        (header_length,) = HEADER_LENGTH.unpack_from(self.buffer, len(MAGIC))
+        header_offset = len(MAGIC) + HEADER_LENGTH.size
+        header = json.loads(self.buffer[header_offset:header_offset + header_length])
+
+        self.id_width: int = header["id_width"]
+        self.users_count: int = header["users"]
+        self.user_struct, self.account_struct, self.entity_struct = build_row_structs(self.id_width)
+
+        # Смещения таблиц в файле
+        self.users_offset = header_offset + header_length
+        self.accounts_offset = self.users_offset + self.users_count * self.user_struct.size
+        self.cards_offset = self.accounts_offset + header["accounts"] * self.account_struct.size
+        self.operations_offset = self.cards_offset + header["cards"] * self.entity_struct.size
+
+        self.dispenser: SeedsDispenser[SeedUserView] = SeedsDispenser(self)
+
+    @property
+    def users(self) -> "SeedsColumnarStore":
+        """
+        Последовательность пользователей (само хранилище) — для совместимости с SeedsResult.users.
+        """
+        return self
+
+    def __len__(self) -> int:
+        return self.users_count
+
+    def __getitem__(self, index: int) -> SeedUserView:
+        if index < 0:
+            index += self.users_count
+        if not 0 <= index < self.users_count:
+            raise IndexError("seeds store index out of range")
+
+        user_id, accounts_start, accounts_count = self.user_struct.unpack_from(
+            self.buffer, self.users_offset + index * self.user_struct.size
+        )
+        return SeedUserView(self, user_id.rstrip(b"\0").decode(), accounts_start, accounts_count)
+
+    def read_accounts(self, start: int, count: int) -> list[tuple[int, SeedAccountView]]:
+        accounts = []
+        for index in range(start, start + count):
+            account_id, kind, *ranges = self.account_struct.unpack_from(
+                self.buffer, self.accounts_offset + index * self.account_struct.size
+            )
+            accounts.append((kind, SeedAccountView(self, account_id.rstrip(b"\0").decode(), *ranges)))
+        return accounts
+
+    def read_entities(self, offset: int, start: int, count: int) -> list[tuple[str, int]]:
+        entities = []
+        for index in range(start, start + count):
+            entity_id, kind = self.entity_struct.unpack_from(self.buffer, offset + index * self.entity_struct.size)
+            entities.append((entity_id.rstrip(b"\0").decode(), kind))
+        return entities
+
+    def read_cards(self, start: int, count: int) -> list[tuple[str, int]]:
+        return self.read_entities(self.cards_offset, start, count)
+
+    def read_operations(self, start: int, count: int) -> list[tuple[str, int]]:
+        return self.read_entities(self.operations_offset, start, count)
+
+    def configure_dispenser(
+            self,
+            policy: SeedsExhaustionPolicy = SeedsExhaustionPolicy.FAIL,
+            timeout: float | None = None,
+            partition_index: int = 0,
+            partition_count: int = 1
+    ) -> None:
+        """
+        Настраивает раздачу пользователей: политику исчерпания и партицию (см. SeedsResult.configure_dispenser).
+        """
+        self.dispenser = SeedsDispenser(
+            self,
+            policy=policy,
+            timeout=timeout,
+            partition_index=partition_index,
+            partition_count=partition_count
+        )
+
+    def get_next_user(self) -> SeedUserView:
+        """
+        Возвращает следующего пользователя по порядку за O(1).
+
+        Returns:
+            SeedUserView: Следующий пользователь из хранилища.
+        """
+        return self.dispenser.checkout()
+
+    def return_user(self, user: SeedUserView) -> None:
+        """
+        Возвращает ранее выданного пользователя в пул для повторной раздачи.
+        """
+        self.dispenser.checkin(user)
+
+    def get_random_user(self) -> SeedUserView:
+        """
+        Возвращает случайного пользователя без удаления.
+
+        Returns:
+            SeedUserView: Случайный пользователь.
+        """
+        return self.dispenser.random()
+
+    def close(self) -> None:
+        """
+        Освобождает mmap и файловый дескриптор.
+        """
+        self.buffer.close()
+        self.file.close()
@@ -0,0 +1,108 @@
+import random
+import threading
+from collections import deque
+from typing import Generic, Sequence, TypeVar
+
+from tools.config.seeds import SeedsExhaustionPolicy
+
+SeedUserT = TypeVar("SeedUserT")
+
+
+class SeedsExhaustedError(IndexError):
+    """
+    Исключение, которое бросается, когда в пуле не осталось пользователей для раздачи.
+    Наследуется от IndexError, как и прежний list.pop(0) на пустом списке.
+    """
+
+
+class SeedsDispenser(Generic[SeedUserT]):
+    """
+    Раздатчик сидинговых пользователей виртуальным пользователям Locust.
+
+    - выдача следующего пользователя за O(1): список не изменяется, сдвигается только курсор;
+    - пользователя можно вернуть в пул, и он будет выдан повторно раньше ещё не выданных;
+    - при исчерпании пула действует политика: wrap (по кругу), block (ждать возврата), fail (ошибка);
+    - партиционирование: раздатчик видит только каждого partition_count-го пользователя, начиная с
+      partition_index, поэтому воркеры с разными индексами получают непересекающиеся срезы.
+
+    Под Locust threading патчится gevent, поэтому блокировка и ожидание работают на гринлетах.
+    """
+
+    def __init__(
+            self,
+            users: Sequence[SeedUserT],
+            policy: SeedsExhaustionPolicy = SeedsExhaustionPolicy.FAIL,
+            timeout: float | None = None,
+            partition_index: int = 0,
+            partition_count: int = 1
+    ):
+        """
+        :param users: Все пользователи сидинга (список или колоночное хранилище).
+        :param policy: Политика поведения при исчерпании пула.
+        :param timeout: Время ожидания возврата пользователя при политике block (None — без ограничения).
+        :param partition_index: Индекс партиции (например, индекс воркера Locust).
+        :param partition_count: Общее количество партиций (например, количество воркеров).
+        """
+        if not 0 <= partition_index < partition_count:
+            raise ValueError(f"Partition index {partition_index} is out of range for {partition_count} partitions")
+
+        self.users = users
+        self.policy = policy
+        self.timeout = timeout
+        # range хранит только границы и шаг, поэтому срез партиции не копирует пользователей
+        self.indexes = range(partition_index, len(users), partition_count)
+        self.cursor = 0
+        self.returned: deque[SeedUserT] = deque()
+        self.condition = threading.Condition()
+
+    def __len__(self) -> int:
+        """
+        Количество пользователей в партиции раздатчика.
+        """
+        return len(self.indexes)
+
+    def checkout(self) -> SeedUserT:
+        """
+        Выдаёт следующего пользователя за O(1).
+
+        :return: Пользователь сидинга.
+        :raises SeedsExhaustedError: Если пул исчерпан (политика fail или истёк таймаут политики block).
+        """
+        with self.condition:
+            if self.returned:
+                return self.returned.popleft()
+
+            if self.cursor >= len(self.indexes) and self.policy == SeedsExhaustionPolicy.WRAP and self.indexes:
+                self.cursor = 0
+
+            if self.cursor < len(self.indexes):
+                user = self.users[self.indexes[self.cursor]]
+                self.cursor += 1
+                return user
+
+            if self.policy == SeedsExhaustionPolicy.BLOCK:
+                if self.condition.wait_for(lambda: self.returned, timeout=self.timeout):
+                    return self.returned.popleft()
+
+            raise SeedsExhaustedError(f"All {len(self.indexes)} seed users have been dispensed")
+
+    def checkin(self, user: SeedUserT) -> None:
+        """
+        Возвращает пользователя в пул и будит одного ожидающего (для политики block).
+
+        :param user: Ранее выданный пользователь.
+        """
+        with self.condition:
+            self.returned.append(user)
+            self.condition.notify()
+
+    def random(self) -> SeedUserT:
+        """
+        Возвращает случайного пользователя своей партиции без изменения состояния раздачи.
+
+        :return: Случайный пользователь.
+        """
+        if not self.indexes:
+            raise SeedsExhaustedError("There are no seed users to choose from")
+
+        return self.users[self.indexes[random.randrange(len(self.indexes))]]
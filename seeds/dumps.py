@@ -1,26 +1,94 @@
 import os
+from typing import Iterable, Iterator, TextIO
 
-from seeds.schema.result import SeedsResult
+from pydantic import ValidationError
+
+from seeds.columnar import SeedsColumnarStore, write_seeds_columnar
+from seeds.schema.result import SeedsResult, SeedUserResult
+from tools.config.seeds import SeedsDumpFormat
 from tools.logger import get_logger
 
 
 logger = get_logger("SEEDS_DUMPS")
 
 
-def save_seeds_result(result: SeedsResult, scenario: str):
+def get_seeds_file(scenario: str, dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON) -> str:
+    """
+    Возвращает путь к файлу дампа сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :param dump_format: Формат дампа (json или ndjson).
+    :return: Путь вида ./dumps/{scenario}_seeds.{json|ndjson|columnar}
+    """
+    return f"./dumps/{scenario}_seeds.{dump_format}"
+
+
+def write_seeds_user(file: TextIO, user: SeedUserResult) -> None:
+    """
+    Записывает одного пользователя в NDJSON-файл отдельной строкой.
+
+    :param file: Открытый на запись текстовый файл.
+    :param user: Пользователь со всеми созданными сущностями.
+    """
+    file.write(user.model_dump_json() + "\n")
+
+
+def iter_seeds_users_file(
+        seeds_file: str,
+        skip_corrupted: bool = False,
+        skip_header: bool = False
+) -> Iterator[SeedUserResult]:
     """
-    Сохраняет результат сидинга (SeedsResult) в JSON-файл.
+    Лениво читает пользователей из NDJSON-файла: в памяти одновременно находится только одна строка.
+
+    :param seeds_file: Путь к NDJSON-файлу.
+    :param skip_corrupted: Пропускать битые строки вместо ошибки (нужно для чекпоинтов,
+                           где последняя строка могла не дописаться).
+    :param skip_header: Пропустить первую строку-заголовок (у чекпоинтов).
+    :return: Итератор SeedUserResult.
+    """
+    with open(seeds_file, 'r', encoding="utf-8") as file:
+        if skip_header:
+            file.readline()
+
+        for line in file:
+            if not line.strip():
+                continue
+
+            try:
+                yield SeedUserResult.model_validate_json(line)
+            except ValidationError:
+                if not skip_corrupted:
+                    raise
+                logger.warning(f"Skipping corrupted line in seeding file: {seeds_file}")
+
+
+def save_seeds_result(result: SeedsResult, scenario: str, dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON):
+    """
+    Сохраняет результат сидинга (SeedsResult) в файл.
 
     :param result: Результат сидинга, сгенерированный билдером.
     :param scenario: Название сценария нагрузки, для которого создаются данные.
                      Используется для генерации имени файла (например, "credit_card_test").
+    :param dump_format: Формат дампа: json (один объект), ndjson (пользователь на строку)
+                        или columnar (колоночное хранилище для mmap).
     """
+    if dump_format == SeedsDumpFormat.NDJSON:
+        save_seeds_users(result.users, scenario=scenario)
+        return
+
+    if dump_format == SeedsDumpFormat.COLUMNAR:
+        if not os.path.exists("dumps"):
+            os.mkdir("dumps")
+        write_seeds_columnar(result.users, seeds_file=get_seeds_file(scenario, dump_format))
+        return
+
     # Убедимся, что папка dumps существует
     if not os.path.exists("dumps"):
         os.mkdir("dumps")
 
     # Формируем путь к файлу
-    seeds_file = f"./dumps/{scenario}_seeds.json"
+    seeds_file = get_seeds_file(scenario)
     
     # Сохраняем результат сидинга в файл с именем {scenario}_seeds.json
     with open(seeds_file, 'w+', encoding="utf-8") as file:
@@ -30,21 +98,71 @@ def save_seeds_result(result: SeedsResult, scenario: str):
     logger.debug(f"Seeding result saved to file: {seeds_file}")
 
 
-def load_seeds_result(scenario: str) -> SeedsResult:
+def save_seeds_users(users: Iterable[SeedUserResult], scenario: str) -> None:
     """
-    Загружает результат сидинга из JSON-файла.
+    Потоково сохраняет пользователей в NDJSON-дамп: каждый пользователь сериализуется и пишется отдельно,
+    поэтому источником может быть генератор, отдающий пользователей по мере сидинга.
+
+    :param users: Пользователи (список или итератор).
+    :param scenario: Название сценария нагрузки.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    seeds_file = get_seeds_file(scenario, SeedsDumpFormat.NDJSON)
+
+    # Пишем во временный файл и атомарно подменяем, чтобы читатели не увидели недописанный дамп
+    temporary_file = f"{seeds_file}.tmp"
+    with open(temporary_file, 'w', encoding="utf-8") as file:
+        for user in users:
+            write_seeds_user(file, user)
+    os.replace(temporary_file, seeds_file)
+
+    logger.debug(f"Seeding result saved to file: {seeds_file}")
+
+
+def iter_seeds_users(scenario: str) -> Iterator[SeedUserResult]:
+    """
+    Лениво читает пользователей из NDJSON-дампа сценария.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Итератор SeedUserResult.
+    """
+    return iter_seeds_users_file(get_seeds_file(scenario, SeedsDumpFormat.NDJSON))
+
+
+def load_seeds_result(
+        scenario: str,
+        dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON
+) -> SeedsResult | SeedsColumnarStore:
+    """
+    Загружает результат сидинга из файла.
+
+    Для формата columnar файл не читается в память, а отображается через mmap:
+    возвращается SeedsColumnarStore с тем же интерфейсом раздачи пользователей, что и у SeedsResult.
+
+    Дамп ndjson читается построчно (без строки со всем файлом), но раздатчику нужен список,
+    поэтому все пользователи всё равно оказываются в памяти. Обойти дамп без загрузки в память
+    можно через iter_seeds_users, раздавать пользователей без загрузки — через формат columnar.
 
     :param scenario: Название сценария нагрузки, данные которого нужно загрузить.
-    :return: Объект SeedsResult, восстановленный из файла.
+    :param dump_format: Формат дампа: json, ndjson или columnar.
+    :return: Объект SeedsResult (или SeedsColumnarStore), восстановленный из файла.
     """
     # Формируем путь к файлу
-    seeds_file = f'./dumps/{scenario}_seeds.json'
-    
-    # Открываем файл и валидируем его как объект SeedsResult
-    with open(seeds_file, 'r', encoding="utf-8") as file:
-        result = SeedsResult.model_validate_json(file.read())
+    seeds_file = get_seeds_file(scenario, dump_format)
+
+    if dump_format == SeedsDumpFormat.COLUMNAR:
+        result = SeedsColumnarStore(seeds_file)
+    elif dump_format == SeedsDumpFormat.NDJSON:
+        # Каждая строка уже провалидирована, поэтому повторно валидировать весь список не нужно
+        result = SeedsResult.model_construct(users=list(iter_seeds_users_file(seeds_file)))
+    else:
+        # Открываем файл и валидируем его как объект SeedsResult
+        with open(seeds_file, 'r', encoding="utf-8") as file:
+            result = SeedsResult.model_validate_json(file.read())
     
     # Логируем успешную загрузку на уровне DEBUG
     logger.debug(f"Seeding result loaded from file: {seeds_file}")
     
-    return result
\ No newline at end of file
+    return result
@@ -0,0 +1,36 @@
+import argparse
+import importlib
+
+from seeds.scenario import SeedsScenario, is_gevent_patched
+
+
+def load_seeds_scenario(path: str) -> SeedsScenario:
+    """
+    Создаёт сценарий сидинга по пути вида "модуль:Класс".
+
+    :param path: Например, seeds.scenarios.existing_user_get_documents:ExistingUserGetDocumentsSeedsScenario
+    :return: Экземпляр сценария сидинга.
+    """
+    module_name, class_name = path.split(":", 1)
+    scenario_class = getattr(importlib.import_module(module_name), class_name)
+    return scenario_class()
+
+
+if __name__ == '__main__':
+    """
+    Запуск сидинга в отдельном процессе без патчей gevent:
+
+        LOCUST_SKIP_MONKEY_PATCH=1 GATEWAY_GRPC_CLIENT.GEVENT_ENABLED=false python -m seeds.run \
+            seeds.scenarios.existing_user_get_documents:ExistingUserGetDocumentsSeedsScenario
+
+    Так SeedsScenario.build() выполняет асинхронный сидинг (SEEDS.ASYNC_MODE=true), когда его вызывают из Locust.
+    """
+    parser = argparse.ArgumentParser(description="Сидинг сценария в отдельном процессе")
+    parser.add_argument("scenario", help="Сценарий сидинга в виде модуль:Класс")
+    arguments = parser.parse_args()
+
+    seeds_scenario = load_seeds_scenario(arguments.scenario)
+    if is_gevent_patched():
+        raise RuntimeError("Seeding process must not be patched by gevent, set LOCUST_SKIP_MONKEY_PATCH=1")
+
+    seeds_scenario.build()
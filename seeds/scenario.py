@@ -1,15 +1,45 @@
+import asyncio
+import os
+import random
+import subprocess
+import sys
 from abc import ABC, abstractmethod
 
+from config import settings
+from seeds.async_builder import AsyncSeedsBuilder, build_grpc_async_seeds_builder, build_http_async_seeds_builder
 from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_result, load_seeds_result
+from seeds.cache import (
+    build_seeds_fingerprint,
+    save_seeds_fingerprint,
+    is_seeds_cache_valid,
+    invalidate_seeds_cache
+)
+from seeds.checkpoint import SeedsCheckpoint
+from seeds.columnar import SeedsColumnarStore
+from seeds.dumps import save_seeds_result, load_seeds_result, get_seeds_file
 from seeds.schema.plan import SeedsPlan
 from seeds.schema.result import SeedsResult
+from tools.config.seeds import SeedsAsyncTransport
 from tools.logger import get_logger
 
 # Инициализируем логгер с именем SEEDS_SCENARIO
 logger = get_logger("SEEDS_SCENARIO")
 
 
+def is_gevent_patched() -> bool:
+    """
+    Проверяет, пропатчен ли процесс gevent (так делает Locust при импорте).
+    В таком процессе клиенты grpc.aio зависают, поэтому асинхронный сидинг в нём не запускается.
+
+    :return: True, если модуль socket заменён gevent.
+    """
+    if "gevent.monkey" not in sys.modules:
+        return False
+
+    from gevent import monkey
+    return monkey.is_module_patched("socket")
+
+
 class SeedsScenario(ABC):
     """
     Абстрактный класс для работы со сценариями сидинга.
@@ -22,6 +52,8 @@ class SeedsScenario(ABC):
         Создаёт экземпляр билдера для генерации сидинговых данных через gRPC.
         """
         self.builder = build_grpc_seeds_builder()
+        # Дамп, уже загруженный для проверки живости кэша (см. is_cached): его отдаёт следующий вызов load()
+        self.probed_result: SeedsResult | SeedsColumnarStore | None = None
 
     @property
     @abstractmethod
@@ -41,6 +73,82 @@ class SeedsScenario(ABC):
         """
         ...
 
+    @property
+    def gateway(self) -> str:
+        """
+        Адрес шлюза, на котором создаются данные. Входит в отпечаток кэша сидинга.
+        """
+        if settings.seeds.async_mode and settings.seeds.async_transport == SeedsAsyncTransport.HTTP:
+            return str(settings.gateway_http_client.url)
+
+        return f"grpc://{settings.gateway_grpc_client.client_url}"
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Отпечаток плана сидинга и целевого шлюза.
+        """
+        return build_seeds_fingerprint(plan=self.plan, gateway=self.gateway)
+
+    @property
+    def seeds_file(self) -> str:
+        """
+        Файл дампа сценария в формате SEEDS.DUMP_FORMAT.
+        """
+        return get_seeds_file(self.scenario, settings.seeds.dump_format)
+
+    def probe(self, result: SeedsResult | SeedsColumnarStore) -> bool:
+        """
+        Дешёвая проверка живости дампа: запрашивает у шлюза несколько случайных пользователей из него.
+
+        Количество проверяемых пользователей задаётся SEEDS.CACHE_PROBE_SIZE (0 — проверка отключена).
+        :param result: Загруженный результат сидинга.
+        :return: True, если все проверенные пользователи существуют на шлюзе.
+        """
+        probe_size = min(settings.seeds.cache_probe_size, len(result.users))
+        for user in random.sample(result.users, probe_size):
+            try:
+                self.builder.users_gateway_client.get_user(user.user_id)
+            except Exception as error:
+                logger.warning(f"[{self.scenario}] Seeding cache probe failed for user {user.user_id}: {error}")
+                return False
+
+        return True
+
+    def is_cached(self) -> bool:
+        """
+        Проверяет, можно ли переиспользовать существующий дамп вместо повторного сидинга.
+        Для проверки живости дамп загружается целиком, поэтому прошедший проверку результат сохраняется
+        и отдаётся следующим вызовом load() без повторного чтения файла.
+        :return: True, если дамп совпадает с планом, не устарел и прошёл проверку живости.
+        """
+        self.probed_result = None
+
+        if not settings.seeds.cache_enabled:
+            return False
+
+        if not is_seeds_cache_valid(
+                seeds_file=self.seeds_file,
+                fingerprint=self.fingerprint,
+                ttl=settings.seeds.cache_ttl
+        ):
+            return False
+
+        if settings.seeds.cache_probe_size > 0:
+            result = self.load()
+            if not self.probe(result):
+                return False
+            self.probed_result = result
+
+        return True
+
+    def invalidate(self) -> None:
+        """
+        Инвалидирует кэш сидинга: следующий вызов build() гарантированно пересоздаст данные.
+        """
+        self.probed_result = None
+        invalidate_seeds_cache(scenario=self.scenario)
+
     def save(self, result: SeedsResult) -> None:
         """
         Сохраняет результат сидинга в файл.
@@ -48,33 +156,120 @@ class SeedsScenario(ABC):
         """
         # Логируем начало сохранения
         logger.info(f"[{self.scenario}] Saving seeding result to file.")
-        save_seeds_result(result=result, scenario=self.scenario)
+        save_seeds_result(result=result, scenario=self.scenario, dump_format=settings.seeds.dump_format)
         # Логируем успешное завершение
         logger.info(f"[{self.scenario}] Seeding result saved successfully.")
 
-    def load(self) -> SeedsResult:
+    def load(self) -> SeedsResult | SeedsColumnarStore:
         """
         Загружает результаты сидинга из файла.
-        :return: Объект SeedsResult, содержащий данные, загруженные из файла.
+        :return: Объект SeedsResult (или SeedsColumnarStore для SEEDS.DUMP_FORMAT=columnar),
+                 содержащий данные, загруженные из файла.
         """
+        if self.probed_result is not None:
+            # Дамп уже загружен при проверке кэша в build(): отдаём его, не читая файл повторно
+            result, self.probed_result = self.probed_result, None
+            logger.info(f"[{self.scenario}] Seeding result reused from the cache probe.")
+            return result
+
         # Логируем начало загрузки
         logger.info(f"[{self.scenario}] Loading seeding result from file.")
-        result = load_seeds_result(scenario=self.scenario)
+        result = load_seeds_result(scenario=self.scenario, dump_format=settings.seeds.dump_format)
+        result.configure_dispenser(
+            policy=settings.seeds.exhaustion_policy,
+            timeout=settings.seeds.exhaustion_timeout
+        )
         # Логируем успешную загрузку
         logger.info(f"[{self.scenario}] Seeding result loaded successfully.")
         return result
 
+    def build_async_builder(self) -> AsyncSeedsBuilder:
+        """
+        Создаёт асинхронный билдер по SEEDS.ASYNC_TRANSPORT (grpc.aio или httpx.AsyncClient).
+        Вызывать нужно внутри работающего цикла событий asyncio.
+        :return: Асинхронный сидер.
+        """
+        if settings.seeds.async_transport == SeedsAsyncTransport.HTTP:
+            return build_http_async_seeds_builder()
+
+        return build_grpc_async_seeds_builder()
+
+    async def build_async_result(self, checkpoint: SeedsCheckpoint) -> SeedsResult:
+        """
+        Генерирует данные асинхронным билдером (см. build_async_builder).
+        Билдер создаётся внутри цикла событий, так как к нему привязываются его каналы и пулы соединений.
+        :param checkpoint: Чекпоинт, в который дописывается каждый готовый пользователь.
+        :return: Объект SeedsResult, содержащий сгенерированные данные.
+        :raises RuntimeError: Процесс пропатчен gevent — асинхронные клиенты в нём зависнут.
+        """
+        if is_gevent_patched():
+            raise RuntimeError(
+                "Async seeding cannot run in a gevent-patched process (async clients hang there), "
+                "use build(), which runs it in a separate process"
+            )
+
+        builder = self.build_async_builder()
+        try:
+            return await builder.build(self.plan, checkpoint=checkpoint)
+        finally:
+            await builder.close()
+
+    def build_in_subprocess(self) -> None:
+        """
+        Запускает сидинг в отдельном процессе без патчей gevent (python -m seeds.run).
+        Дочерний процесс сохраняет дамп и его отпечаток, после чего дамп читается обычным load().
+
+        :raises RuntimeError: Сидинг в дочернем процессе завершился с ошибкой.
+        """
+        command = [sys.executable, "-m", "seeds.run", f"{type(self).__module__}:{type(self).__name__}"]
+        logger.info(f"[{self.scenario}] Running async seeding in a separate process: {' '.join(command)}")
+
+        # Клиенты импортируют locust, поэтому в дочернем процессе отключаем его monkey.patch_all()
+        # и интеграцию gRPC с gevent: grpc.aio работает только в обычном процессе
+        environment = {
+            **os.environ,
+            "LOCUST_SKIP_MONKEY_PATCH": "1",
+            "GATEWAY_GRPC_CLIENT.GEVENT_ENABLED": "false"
+        }
+        process = subprocess.run(command, env=environment, check=False)
+        if process.returncode != 0:
+            raise RuntimeError(f"[{self.scenario}] Async seeding process failed with exit code {process.returncode}")
+
     def build(self) -> None:
         """
         Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+        При SEEDS.ASYNC_MODE=true используется асинхронный билдер. Если процесс пропатчен gevent
+        (сидинг из хука init Locust), асинхронный сидинг выполняется в отдельном процессе (см. build_in_subprocess).
+
+        Каждый готовый пользователь сразу дописывается в чекпоинт, поэтому после сбоя
+        повторный запуск продолжит сидинг с места остановки. После сохранения результата чекпоинт удаляется.
+
+        Если для того же плана и шлюза уже есть валидный дамп (см. is_cached), сидинг пропускается.
         """
+        if self.is_cached():
+            logger.info(f"[{self.scenario}] Reusing cached seeding result, generation skipped.")
+            return
+
+        if settings.seeds.async_mode and is_gevent_patched():
+            self.build_in_subprocess()
+            return
+
+        # Старые метаданные удаляем заранее: если сидинг упадёт, устаревший дамп не будет принят за валидный
+        self.invalidate()
+
         # Преобразуем план сидинга в JSON для логов (без значений по умолчанию)
         plan_json = self.plan.model_dump_json(indent=2, exclude_defaults=True)
         # Логируем начало генерации
         logger.info(f"[{self.scenario}] Starting seeding data generation for plan: {plan_json}")
-        # Запускаем генерацию
-        result = self.builder.build(self.plan)
+        # Запускаем генерацию с чекпоинтом, чтобы не потерять уже созданных пользователей при сбое
+        checkpoint = SeedsCheckpoint(scenario=self.scenario, fingerprint=self.fingerprint)
+        if settings.seeds.async_mode:
+            result = asyncio.run(self.build_async_result(checkpoint))
+        else:
+            result = self.builder.build(self.plan, checkpoint=checkpoint)
         # Логируем завершение генерации
         logger.info(f"[{self.scenario}] Seeding data generation completed.")
-        # Сохраняем результат
+        # Сохраняем результат и удаляем ставший ненужным чекпоинт
         self.save(result)
+        save_seeds_fingerprint(seeds_file=self.seeds_file, fingerprint=self.fingerprint)
+        checkpoint.clear()
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class SeedsCacheMeta(BaseModel):
+    """
+    Метаданные дампа сидинга, сохраняемые рядом с ним.
+
+    Attributes:
+        fingerprint (str): Хэш плана сидинга и целевого шлюза, для которых был создан дамп.
+        created_at (float): Время создания дампа (unix timestamp).
+    """
+    fingerprint: str
+    created_at: float
@@ -1,6 +1,7 @@
-import random
+from pydantic import BaseModel, Field, PrivateAttr
 
-from pydantic import BaseModel, Field
+from seeds.dispenser import SeedsDispenser
+from tools.config.seeds import SeedsExhaustionPolicy
 
 
 class SeedCardResult(BaseModel):
@@ -73,17 +74,63 @@ class SeedsResult(BaseModel):
 
     users: list[SeedUserResult] = Field(default_factory=list)
 
+    _dispenser: SeedsDispenser[SeedUserResult] | None = PrivateAttr(default=None)
+
+    @property
+    def dispenser(self) -> SeedsDispenser[SeedUserResult]:
+        """
+        Раздатчик пользователей. Создаётся при первом обращении с политикой fail и без партиционирования,
+        если не был настроен через configure_dispenser.
+        """
+        if self._dispenser is None:
+            self._dispenser = SeedsDispenser(self.users)
+        return self._dispenser
+
+    def configure_dispenser(
+            self,
+            policy: SeedsExhaustionPolicy = SeedsExhaustionPolicy.FAIL,
+            timeout: float | None = None,
+            partition_index: int = 0,
+            partition_count: int = 1
+    ) -> None:
+        """
+        Настраивает раздачу пользователей: политику исчерпания и партицию.
+
+        Args:
+            policy: Политика поведения при исчерпании пула (wrap, block, fail).
+            timeout: Время ожидания возврата пользователя при политике block.
+            partition_index: Индекс партиции (например, индекс воркера Locust).
+            partition_count: Общее количество партиций.
+        """
+        self._dispenser = SeedsDispenser(
+            self.users,
+            policy=policy,
+            timeout=timeout,
+            partition_index=partition_index,
+            partition_count=partition_count
+        )
+
     def get_next_user(self) -> SeedUserResult:
         """
-        Возвращает и удаляет первого пользователя из списка.
+        Возвращает следующего пользователя из списка за O(1).
 
         Используется в случае, когда на каждый виртуальный юзер нужен новый тестовый пользователь.
         Удобно при строго последовательной раздаче пользователей в тестовых сценариях.
+        Сам список users не изменяется — раздатчик только сдвигает курсор.
 
         Returns:
             SeedUserResult: Следующий пользователь из списка.
         """
-        return self.users.pop(0)
+        return self.dispenser.checkout()
+
+    def return_user(self, user: SeedUserResult) -> None:
+        """
+        Возвращает ранее выданного пользователя в пул для повторной раздачи.
+
+        Args:
+            user: Пользователь, полученный через get_next_user.
+        """
+        self.dispenser.checkin(user)
 
     def get_random_user(self) -> SeedUserResult:
         """
@@ -94,4 +141,4 @@ class SeedsResult(BaseModel):
         Returns:
             SeedUserResult: Случайный пользователь.
         """
-        return random.choice(self.users)
\ No newline at end of file
+        return self.dispenser.random()
@@ -0,0 +1,97 @@
+import json
+import time
+from typing import Callable
+
+from httpx import Client
+from pydantic import BaseModel
+
+from clients.http.client import JSON_HEADERS, serialize_model
+from clients.http.gateway.operations.schema import MakePurchaseOperationRequestSchema
+from clients.http.gateway.users.schema import CreateUserRequestSchema
+
+# URL не запрашивается: запросы только собираются через build_request
+BENCHMARK_URL = "http://localhost/api/v1/benchmark"
+
+
+def dump_body(model: BaseModel) -> bytes:
+    """
+    Прежний путь: model_dump(by_alias=True) в dict, затем stdlib json с параметрами, которые использует httpx.
+    """
+    return json.dumps(
+        model.model_dump(by_alias=True),
+        ensure_ascii=False,
+        separators=(",", ":"),
+        allow_nan=False
+    ).encode("utf-8")
+
+
+def measure(call: Callable[[], object], iterations: int) -> float:
+    """
+    :param call: Измеряемое действие.
+    :param iterations: Количество повторов.
+    :return: Процессорное время на один вызов в микросекундах.
+    """
+    for _ in range(min(iterations, 1000)):  # Прогрев
+        call()
+
+    started = time.process_time()
+    for _ in range(iterations):
+        call()
+    return (time.process_time() - started) / iterations * 1_000_000
+
+
+def run_benchmark(iterations: int = 50_000) -> dict[str, dict[str, tuple[float, float]]]:
+    """
+    Сравнивает прежнюю (model_dump + json=) и быструю (serialize_model + content=) сериализацию
+    тела для типичных запросов записи: отдельно тело и сборку httpx.Request целиком.
+
+    :param iterations: Количество повторов.
+    :return: Время (мкс) прежнего и быстрого пути: {модель: {"body" | "request": (прежний, быстрый)}}.
+    """
+    models = [
+        CreateUserRequestSchema(),
+        MakePurchaseOperationRequestSchema(card_id="card-id", account_id="account-id"),
+    ]
+
+    results = {}
+    with Client() as client:
+        for model in models:
+            # Тела должны совпадать байт в байт, иначе сравнение не имеет смысла
+            assert dump_body(model) == client.build_request(
+                "POST", BENCHMARK_URL, json=model.model_dump(by_alias=True)
+            ).content == serialize_model(model)
+
+            results[type(model).__name__] = {
+                "body": (
+                    measure(lambda: dump_body(model), iterations),
+                    measure(lambda: serialize_model(model), iterations)
+                ),
+                "request": (
+                    measure(
+                        lambda: client.build_request("POST", BENCHMARK_URL, json=model.model_dump(by_alias=True)),
+                        iterations
+                    ),
+                    measure(
+                        lambda: client.build_request(
+                            "POST", BENCHMARK_URL, content=serialize_model(model), headers=JSON_HEADERS
+                        ),
+                        iterations
+                    )
+                )
+            }
+
+    return results
+
+
+if __name__ == '__main__':
+    """
+    Микробенчмарк процессорного времени Locust-воркера на сериализацию тела запроса:
+
+        python -m tools.benchmarks.request_serialization
+    """
+    for name, stages in run_benchmark().items():
+        for stage, (dump_time, serialized_time) in stages.items():
+            print(
+                f"{name} [{stage}]: {dump_time:.2f}us -> {serialized_time:.2f}us "
+                f"(saved {dump_time - serialized_time:.2f}us per request)"
+            )
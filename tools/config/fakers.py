@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+
+
+class FakerConfig(BaseModel):
+    # Брать имена, email, телефоны, категории и суммы из заранее сгенерированных кольцевых буферов
+    pool_enabled: bool = False
+
+    # Размер каждого буфера
+    pool_size: int = 10000
+
+    # Заполнять буферы в фоновом гринлете, не задерживая старт теста
+    pool_background: bool = False
+
+    # Seed детерминированной генерации: одинаковые тела запросов во всех запусках (None — случайные данные).
+    # Каждый воркер и виртуальный пользователь получает свой поток, выведенный из seed, номера воркера и пользователя
+    seed: int | None = None
+
+    # Соль уникальных полей (email) при заданном seed, своя на каждый прогон (например, номер сборки).
+    # Без соли повтор с тем же seed отправляет те же email и требует чистого окружения
+    seed_salt: str | None = None
+
+    # Размер пакета, которым генерируются суммы, категории и статусы; 0 — по одному
+    bulk_size: int = 0
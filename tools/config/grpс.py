@@ -4,6 +4,14 @@ class GRPCClientConfig(BaseModel):
     port: int
     host: str
 
+    # Размер общего на процесс пула gRPC-каналов для Locust-клиентов.
+    # Виртуальные пользователи получают каналы по кругу; 0 — отдельный канал на каждого пользователя
+    channel_pool_size: int = 0
+
+    # Включать интеграцию gRPC с gevent (нужна для синхронных клиентов под Locust).
+    # false — для запусков на grpc.aio, где gevent-интеграция не нужна
+    gevent_enabled: bool = True
+
     @property
     def client_url(self) -> str:
         return f"{self.host}: {self.port}"
\ No newline at end of file
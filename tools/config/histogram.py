@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class HistogramConfig(BaseModel):
+    # Вести HDR-гистограммы задержек по каждому эндпоинту параллельно со статистикой Locust
+    enabled: bool = False
+
+    # Количество значащих цифр: относительная погрешность значения не больше 10^-N (3 — 0,1%)
+    significant_figures: int = 3
+
+    # Файл, в который при завершении теста выгружаются перцентили и полное распределение
+    report_file: str = "./dumps/latency_histogram.json"
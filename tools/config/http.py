@@ -1,6 +1,26 @@
+from enum import StrEnum
+
+from httpx import Limits
 from pydantic import BaseModel, HttpUrl
 
 
+class HTTPClientShareScope(StrEnum):
+    USER = "user"  # Один httpx.Client на виртуального пользователя, общий для всех его API-клиентов
+    PROCESS = "process"  # Один httpx.Client на процесс Locust, общий для всех виртуальных пользователей
+
+
+class HTTPResponseLengthMode(StrEnum):
+    READ = "read"  # Тело ответа дочитывается в хуке Locust, длина — len(response.read())
+    STREAM = "stream"  # Content-Length, а без него — подсчёт байтов по мере чтения, метрика отправляется при закрытии
+
+
+class HTTPResponseParsePolicy(StrEnum):
+    FULL = "full"  # Каждый ответ валидируется pydantic-схемой
+    SAMPLED = "sampled"  # Валидируется каждый N-й ответ, остальные — лениво (lazy)
+    LAZY = "lazy"  # Тело хранится в байтах и валидируется только при первом обращении к полям ответа
+    RAW = "raw"  # Тело не разбирается; при чтении полей ответа — ленивый разбор, как в lazy, с предупреждением
+
+
 class HTTPClientConfig(BaseModel):
     # URL сервиса, к которому будем подключаться через httpx
     url: HttpUrl
@@ -8,6 +28,43 @@ class HTTPClientConfig(BaseModel):
     # Таймаут для запросов в секундах (по умолчанию 100)
     timeout: float = 100.0
 
+    # Лимиты пула соединений httpx (None — без ограничения), по умолчанию как в httpx
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+
+    # Сколько секунд держать простаивающее keep-alive соединение открытым
+    keepalive_expiry: float | None = 5.0
+
+    # Использовать HTTP/2 (нужен пакет h2: pip install "httpx[http2]")
+    http2: bool = False
+
+    # Кто делит один httpx.Client в нагрузочных тестах: виртуальный пользователь или весь процесс
+    share_scope: HTTPClientShareScope = HTTPClientShareScope.USER
+
+    # Как Locust-хуки считают размер ответа: read — дочитывают тело, stream — без буферизации тела в хуке
+    response_length_mode: HTTPResponseLengthMode = HTTPResponseLengthMode.READ
+
+    # Записывать фазы запроса (connect, tls, send, wait, receive) в служебную статистику (./dumps/service_stats.json).
+    # Независимо от флага фазы всегда передаются в context события request
+    phase_metrics: bool = False
+
+    # Как Locust-клиенты разбирают ответы высокоуровневых методов (клиенты сидинга всегда используют full)
+    response_parse_policy: HTTPResponseParsePolicy = HTTPResponseParsePolicy.FULL
+
+    # Для sampled: валидировать каждый N-й ответ клиента
+    response_parse_sample_rate: int = 100
+
+    @property
+    def limits(self) -> Limits:
+        """
+        Возвращает лимиты пула соединений в виде httpx.Limits.
+        """
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+
     @property
     def client_url(self) -> str:
         """
@@ -1,5 +1,19 @@
+from enum import StrEnum
+
 from pydantic import BaseModel
 
+
+class LocustLoadModel(StrEnum):
+    CLOSED = "closed"  # Следующая задача начинается через between(min, max) после окончания предыдущей
+    OPEN = "open"  # Задачи начинаются по фиксированному расписанию с частотой arrival_rate, независимо от задержек
+
+
 class LocustUserConfig(BaseModel):
     wait_time_min: float = 1
-    wait_time_max: float = 3
\ No newline at end of file
+    wait_time_max: float = 3
+
+    # Модель нагрузки виртуального пользователя
+    load_model: LocustLoadModel = LocustLoadModel.CLOSED
+
+    # Для open-модели: сколько задач в секунду запускает один виртуальный пользователь
+    arrival_rate: float = 1.0
\ No newline at end of file
@@ -0,0 +1,69 @@
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class SeedsDumpFormat(StrEnum):
+    JSON = "json"  # Весь SeedsResult одним JSON-объектом
+    NDJSON = "ndjson"  # Один SeedUserResult на строку, пишется потоково; при загрузке все пользователи в памяти
+    COLUMNAR = "columnar"  # Таблицы ID фиксированной ширины, читаются через mmap без загрузки в память
+
+
+class SeedsAsyncTransport(StrEnum):
+    GRPC = "grpc"  # Асинхронный сидинг через grpc.aio
+    HTTP = "http"  # Асинхронный сидинг через httpx.AsyncClient
+
+
+class SeedsExhaustionPolicy(StrEnum):
+    WRAP = "wrap"  # Начать раздачу пользователей сначала
+    BLOCK = "block"  # Ждать, пока кто-то вернёт пользователя в пул
+    FAIL = "fail"  # Бросить SeedsExhaustedError
+
+
+class SeedsShardTransport(StrEnum):
+    MESSAGE = "message"  # Пользователи шарда передаются воркеру через канал сообщений Locust
+    FILE = "file"  # Мастер пишет шард в NDJSON-файл и передаёт воркеру только путь (нужна общая ФС)
+
+
+class SeedsConfig(BaseModel):
+    # Максимальное количество пользователей, создаваемых параллельно (1 — строго последовательно)
+    max_workers: int = 1
+
+    # Максимальное количество карт/операций счёта, создаваемых параллельно (1 — строго последовательно)
+    entities_max_workers: int = 1
+
+    # Сколько карт/операций счёта отправлять одним пакетом через gRPC .future() (1 — без пакетов)
+    batch_size: int = 1
+
+    # Сидинг через асинхронные клиенты (grpc.aio / httpx.AsyncClient) вместо пула потоков
+    async_mode: bool = False
+
+    # Через какие клиенты идёт асинхронный сидинг (синхронный сидинг всегда использует gRPC)
+    async_transport: SeedsAsyncTransport = SeedsAsyncTransport.GRPC
+
+    # Максимальное количество одновременных запросов асинхронного сидинга
+    max_concurrency: int = 100
+
+    # Максимальное количество пользователей, создаваемых одновременно при асинхронном сидинге
+    async_max_users: int = 10
+
+    # Переиспользовать существующий дамп, если план сидинга и шлюз не изменились
+    cache_enabled: bool = True
+
+    # Время жизни закэшированного дампа в секундах (None — бессрочно)
+    cache_ttl: float | None = None
+
+    # Сколько случайных пользователей дампа проверить запросом к шлюзу перед переиспользованием (0 — не проверять)
+    cache_probe_size: int = 0
+
+    # Формат файла дампа сидинга
+    dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON
+
+    # Что делать, когда get_next_user раздал всех пользователей
+    exhaustion_policy: SeedsExhaustionPolicy = SeedsExhaustionPolicy.FAIL
+
+    # Сколько секунд ждать возврата пользователя при политике block (None — без ограничения)
+    exhaustion_timeout: float | None = None
+
+    # Как мастер передаёт воркерам их шарды пользователей в распределённом запуске
+    shard_transport: SeedsShardTransport = SeedsShardTransport.MESSAGE
@@ -0,0 +1,53 @@
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class LoadShapeKind(StrEnum):
+    FLAT = "flat"  # Разгон до users со скоростью spawn-rate и удержание до run-time
+    STEP = "step"  # Ступени по step_users пользователей каждые step_duration секунд до users
+    SPIKE = "spike"  # Базовая нагрузка users и кратковременный всплеск до users * spike_multiplier
+    SOAK = "soak"  # Плавный разгон за ramp_duration секунд и длительное удержание users
+    RAMP = "ramp"  # Ступенчатый рост до точки отказа: остановка при превышении max_fail_ratio или max_p95
+    DIURNAL = "diurnal"  # Воспроизведение суточного профиля diurnal_profile с периодом diurnal_period
+    KNEE = "knee"  # Ступенчатый рост с поиском точки насыщения и отчётом о максимальном устойчивом RPS
+
+
+class LoadShapeConfig(BaseModel):
+    # Форма нагрузки; переопределяется параметром --load-shape в .conf сценария.
+    # Если не задана, ConfiguredLoadShape отключается и Locust работает как без формы нагрузки
+    kind: LoadShapeKind | None = None
+
+    # Пиковое количество пользователей, скорость их запуска и длительность теста в секундах.
+    # Если в .conf, командной строке или веб-интерфейсе заданы users, spawn-rate и run-time, берутся они.
+    # Без run-time форма нагрузки работает, пока не остановится сама или тест не прервут
+    users: int | None = None
+    spawn_rate: float | None = None
+    run_time: int | None = None
+
+    # step, ramp и knee: размер и длительность ступени
+    step_users: int = 10
+    step_duration: int = 60
+
+    # spike: во сколько раз растёт нагрузка, когда начинается всплеск и сколько он длится (в секундах)
+    spike_multiplier: float = 3.0
+    spike_start: int = 60
+    spike_duration: int = 30
+
+    # soak: время плавного разгона до users
+    ramp_duration: int = 300
+
+    # ramp и knee: границы, при превышении которых тест останавливается (доля ошибок и p95 в мс:
+    # для ramp — за последние 10 секунд, для knee — за вторую половину ступени)
+    max_fail_ratio: float = 0.01
+    max_p95: float = 1000
+
+    # diurnal: доли от users по равным интервалам периода (линейная интерполяция между точками)
+    diurnal_profile: list[float] = [0.2, 0.1, 0.1, 0.3, 0.7, 1.0, 0.9, 0.8, 1.0, 0.7, 0.4, 0.3]
+    diurnal_period: int = 3600
+
+    # knee: точка насыщения — прирост RPS меньше knee_efficiency от прироста пользователей,
+    # p95 вырос больше чем в knee_latency_factor раз относительно первой ступени или превышены max_fail_ratio / max_p95
+    knee_efficiency: float = 0.5
+    knee_latency_factor: float = 3.0
+    knee_report_file: str = "./dumps/knee_report.json"
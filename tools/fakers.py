@@ -1,20 +1,342 @@
+import hashlib
+import itertools
+import threading
 import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Sequence, TypeVar
 
 from faker import Faker
 from faker.providers.python import TEnum
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
 
+T = TypeVar("T")
+
+
+# Категории покупок, из которых выбирает Fake.category
+PURCHASE_CATEGORIES = [
+    "gas",
+    "taxi",
+    "tolls",
+    "water",
+    "beauty",
+    "mobile",
+    "travel",
+    "parking",
+    "catalog",
+    "internet",
+    "satellite",
+    "education",
+    "government",
+    "healthcare",
+    "restaurants",
+    "electricity",
+    "supermarkets",
+]
+
+
+class FakePool:
+    """
+    Кольцевой буфер заранее сгенерированных значений: get() отдаёт значение по позиции курсора за O(1), по кругу.
+
+    Пока буфер заполняется (в фоне), get() берёт значения из уже готовой части, а пока она пуста —
+    генерирует значение напрямую.
+    """
+
+    def __init__(self, factory: Callable[[], Any], size: int):
+        """
+        :param factory: Функция, генерирующая одно значение.
+        :param size: Размер буфера.
+        """
+        self.factory = factory
+        self.size = size
+        self.values: list[Any] = []
+
+    def fill(self, chunk_size: int = 1000) -> None:
+        """
+        Заполняет буфер. Между порциями по chunk_size значений отдаёт управление (time.sleep(0)),
+        чтобы фоновое заполнение под gevent не блокировало гринлеты виртуальных пользователей.
+
+        :param chunk_size: Размер порции.
+        """
+        while len(self.values) < self.size:
+            for _ in range(min(chunk_size, self.size - len(self.values))):
+                self.values.append(self.factory())
+            time.sleep(0)
+
+    def get(self, cursor: int) -> Any:
+        """
+        :param cursor: Позиция курсора потока данных.
+        :return: Значение буфера по позиции курсора.
+        """
+        if not self.values:
+            return self.factory()
+        return self.values[cursor % len(self.values)]
+
+
+class FakeStream:
+    """
+    Поток тестовых данных: свой экземпляр Faker, курсор по пулам и счётчик для уникальности email.
+    """
+
+    def __init__(self, faker: Faker, email_prefix: str, pool_offset: int = 0):
+        """
+        :param faker: Экземпляр Faker потока.
+        :param email_prefix: Префикс email потока.
+        :param pool_offset: Начальная позиция курсора по пулам.
+        """
+        self.faker = faker
+        self.email_prefix = email_prefix
+        self.email_counter = itertools.count()
+        self.pool_cursor = itertools.count(pool_offset)
+        # Заранее сгенерированные пакетом значения (режим enable_bulk), по ключу поля
+        self.buffers: dict[Any, deque] = {}
+
+
+def get_stream_seed(seed: int, *keys: int) -> int:
+    """
+    Выводит seed отдельного потока данных (например, по номеру воркера и виртуального пользователя).
+    Не зависит от PYTHONHASHSEED, поэтому одинаков во всех процессах и запусках.
+
+    :param seed: Базовый seed (FAKERS.SEED).
+    :param keys: Ключи потока.
+    :return: Seed потока.
+    """
+    digest = hashlib.blake2b(":".join(map(str, (seed, *keys))).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def get_email_prefix(seed: int, salt: str | None = None) -> str:
+    """
+    :param seed: Seed потока данных.
+    :param salt: Соль прогона или None.
+    :return: Префикс email потока: seed или "соль.seed".
+    """
+    return f"{seed}" if salt is None else f"{salt}.{seed}"
+
 
 class Fake:
     """
     Класс для генерации случайных тестовых данных с использованием библиотеки Faker.
+
+    В режиме пулов (enable_pools) имена, email, телефоны, категории и суммы берутся из заранее
+    сгенерированных кольцевых буферов, а не из Faker на каждый вызов.
+
+    Пакетный режим: amounts(), categories(), enums(), proto_enums() и другие генерируют N значений за раз
+    одним random.choices, минуя Faker. После enable_bulk() (или внутри bulk()) одиночные amount(), category(),
+    enum() и proto_enum() тоже берут значения из пакетов, которые пополняются по bulk_size штук.
+
+    Детерминированный режим: seed() делает основной поток воспроизводимым, а use_stream() переключает
+    текущий поток (под Locust — гринлет виртуального пользователя) на собственный seeded-поток.
+    Повтор с тем же seed отправляет те же email, поэтому на шлюзе с данными прошлого прогона
+    создание пользователей упрётся в дубликаты: нужно либо чистое окружение, либо соль (salt),
+    своя на каждый прогон. Соль меняет только префикс email, остальные данные остаются воспроизводимыми.
     """
 
     def __init__(self, faker: Faker):
         """
         :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
         """
-        self.faker = faker
+        # Email уникален за счёт префикса (время старта процесса) и счётчика
+        self.default_stream = FakeStream(faker, email_prefix=f"{time.time()}")
+        self.pools: dict[str, FakePool] = {}
+        self.bulk_size = 0
+        # Создаётся при первом use_stream(): к этому моменту threading уже пропатчен gevent и local — гринлетный
+        self.local: threading.local | None = None
+
+    @property
+    def stream(self) -> FakeStream:
+        """
+        :return: Поток данных текущего потока/гринлета или основной поток.
+        """
+        stream = getattr(self.local, "stream", None) if self.local is not None else None
+        return stream or self.default_stream
+
+    @property
+    def faker(self) -> Faker:
+        return self.stream.faker
+
+    def seed(self, seed: int, salt: str | None = None) -> None:
+        """
+        Делает основной поток данных детерминированным.
+
+        :param seed: Базовый seed (FAKERS.SEED).
+        :param salt: Соль уникальных полей (FAKERS.SEED_SALT): без неё повтор даёт те же email.
+        """
+        faker = Faker()
+        faker.seed_instance(seed)
+        self.default_stream = FakeStream(faker, email_prefix=get_email_prefix(seed, salt))
+
+    def use_stream(self, seed: int, salt: str | None = None) -> None:
+        """
+        Переключает текущий поток/гринлет на собственный детерминированный поток данных.
+
+        :param seed: Seed потока (см. get_stream_seed).
+        :param salt: Соль уникальных полей (FAKERS.SEED_SALT): без неё повтор даёт те же email.
+        """
+        faker = Faker()
+        faker.seed_instance(seed)
+        if self.local is None:
+            self.local = threading.local()
+        self.local.stream = FakeStream(
+            faker,
+            email_prefix=get_email_prefix(seed, salt),
+            pool_offset=faker.random.randrange(1 << 30)
+        )
+
+    def enable_pools(self, size: int, background: bool = False) -> None:
+        """
+        Включает режим пулов: заранее генерирует по size значений для каждого поля.
+
+        :param size: Размер каждого кольцевого буфера.
+        :param background: Заполнять буферы в фоне (в отдельном потоке, под Locust — гринлете),
+            не задерживая старт. До заполнения значения генерируются напрямую.
+        """
+        faker = self.faker
+        self.pools = {
+            "email": FakePool(faker.email, size),
+            "last_name": FakePool(faker.last_name, size),
+            "first_name": FakePool(faker.first_name, size),
+            "phone_number": FakePool(faker.phone_number, size),
+            "category": FakePool(lambda: faker.random_element(PURCHASE_CATEGORIES), size),
+            "amount": FakePool(lambda: faker.pyfloat(min_value=1, max_value=1000, right_digits=2), size),
+        }
+
+        def fill_pools() -> None:
+            for pool in self.pools.values():
+                pool.fill()
+
+        if background:
+            threading.Thread(target=fill_pools, daemon=True).start()
+        else:
+            fill_pools()
+
+    def enable_bulk(self, size: int) -> None:
+        """
+        Включает пакетный режим: одиночные amount(), category(), enum() и proto_enum() берут значения
+        из пакетов по size штук, сгенерированных одним вызовом amounts() / categories() / enums() / proto_enums().
+
+        :param size: Размер пакета (0 или 1 — пакетный режим выключен).
+        """
+        self.bulk_size = size
+
+    @contextmanager
+    def bulk(self, size: int) -> Iterator[None]:
+        """
+        Включает пакетный режим только внутри блока with, затем восстанавливает прежний размер пакета.
+
+        :param size: Размер пакета (0 или 1 — режим не меняется).
+        """
+        previous_size = self.bulk_size
+        if size > 1:
+            self.bulk_size = size
+        try:
+            yield
+        finally:
+            self.bulk_size = previous_size
+
+    def get_buffered(self, key: Any, draw: Callable[[int], list], factory: Callable[[], Any]) -> Any:
+        """
+        :param key: Ключ пакета в потоке данных.
+        :param draw: Пакетная генерация N значений.
+        :param factory: Генерация одного значения, если пакетный режим выключен.
+        :return: Следующее значение из пакета текущего потока данных.
+        """
+        if self.bulk_size <= 1:
+            return factory()
+
+        buffer = self.stream.buffers.setdefault(key, deque())
+        try:
+            return buffer.popleft()
+        except IndexError:
+            buffer.extend(draw(self.bulk_size))
+            return buffer.popleft()
+
+    def choices(self, values: Sequence[T], count: int) -> list[T]:
+        """
+        Выбирает count случайных значений (с повторами) за один вызов.
+
+        :param values: Значения для выбора.
+        :param count: Количество значений.
+        :return: Список выбранных значений.
+        """
+        return self.faker.random.choices(values, k=count)
+
+    def amounts(self, count: int, start: int = 1, end: int = 1000) -> list[float]:
+        """
+        Генерирует count денежных сумм с точностью до копеек за один вызов.
+
+        :param count: Количество сумм.
+        :param start: Начало диапазона (включительно).
+        :param end: Конец диапазона (включительно).
+        :return: Список сумм.
+        """
+        # Выбор из range через random.choices в несколько раз быстрее, чем randint на каждое значение
+        cents = self.faker.random.choices(range(start * 100, end * 100 + 1), k=count)
+        return [cent / 100 for cent in cents]
+
+    def categories(self, count: int) -> list[str]:
+        """
+        :param count: Количество категорий.
+        :return: Список случайных категорий покупок.
+        """
+        return self.choices(PURCHASE_CATEGORIES, count)
+
+    def enums(self, value: type[TEnum], count: int) -> list[TEnum]:
+        """
+        :param value: Enum-класс для генерации значений.
+        :param count: Количество значений.
+        :return: Список случайных значений перечисления.
+        """
+        return self.choices(list(value), count)
+
+    def proto_enums(self, value: EnumTypeWrapper, count: int) -> list[int]:
+        """
+        :param value: Proto enum-класс для генерации значений.
+        :param count: Количество значений.
+        :return: Список случайных значений перечисления.
+        """
+        return self.choices(value.values(), count)
+
+    def last_names(self, count: int) -> list[str]:
+        """
+        У Faker нет пакетной генерации имён, поэтому значения берутся из пулов (enable_pools)
+        или генерируются по одному.
+
+        :param count: Количество фамилий.
+        :return: Список фамилий.
+        """
+        return [self.last_name() for _ in range(count)]
+
+    def first_names(self, count: int) -> list[str]:
+        """
+        :param count: Количество имён.
+        :return: Список имён (см. last_names).
+        """
+        return [self.first_name() for _ in range(count)]
+
+    def emails(self, count: int) -> list[str]:
+        """
+        :param count: Количество email.
+        :return: Список уникальных email (см. last_names).
+        """
+        return [self.email() for _ in range(count)]
+
+    def phone_numbers(self, count: int) -> list[str]:
+        """
+        :param count: Количество номеров.
+        :return: Список номеров телефона (см. last_names).
+        """
+        return [self.phone_number() for _ in range(count)]
+
+    def get_pooled(self, name: str, factory: Callable[[], Any]) -> Any:
+        """
+        :param name: Имя пула.
+        :param factory: Генерация значения, если режим пулов не включён.
+        :return: Значение из пула (по курсору текущего потока данных) или сгенерированное напрямую.
+        """
+        pool = self.pools.get(name)
+        return pool.get(next(self.stream.pool_cursor)) if pool else factory()
 
     def enum(self, value: type[TEnum]) -> TEnum:
         """
@@ -23,7 +345,11 @@ class Fake:
         :param value: Enum-класс для генерации значения.
         :return: Случайное значение из перечисления.
         """
-        return self.faker.enum(value)
+        return self.get_buffered(
+            ("enum", value),
+            lambda count: self.enums(value, count),
+            lambda: self.faker.enum(value)
+        )
 
     def proto_enum(self, value: EnumTypeWrapper) -> int:
         """
@@ -32,7 +358,11 @@ class Fake:
         :param value: Proto enum-класс для генерации значения.
         :return: Случайное значение из перечисления.
         """
-        return self.faker.random_element(value.values())
+        return self.get_buffered(
+            ("proto_enum", value),
+            lambda count: self.proto_enums(value, count),
+            lambda: self.faker.random_element(value.values())
+        )
 
     def email(self) -> str:
         """
@@ -41,7 +371,10 @@ class Fake:
         Если не указан, будет использован случайный домен.
         :return: Случайный email.
         """
-        return f"{time.time()}.{self.faker.email()}"
+        stream = self.stream
+        # Значения пула повторяются по кругу, поэтому уникальность обеспечивают префикс и счётчик потока
+        email = self.get_pooled("email", stream.faker.email)
+        return f"{stream.email_prefix}.{next(stream.email_counter)}.{email}"
 
     def category(self) -> str:
         """
@@ -52,25 +385,11 @@ class Fake:
 
         :return: Случайная категория (например, 'gas', 'taxi', 'supermarkets' и т.д.).
         """
-        return self.faker.random_element([
-            "gas",
-            "taxi",
-            "tolls",
-            "water",
-            "beauty",
-            "mobile",
-            "travel",
-            "parking",
-            "catalog",
-            "internet",
-            "satellite",
-            "education",
-            "government",
-            "healthcare",
-            "restaurants",
-            "electricity",
-            "supermarkets",
-        ])
+        return self.get_pooled("category", lambda: self.get_buffered(
+            "category",
+            self.categories,
+            lambda: self.faker.random_element(PURCHASE_CATEGORIES)
+        ))
 
     def last_name(self) -> str:
         """
@@ -78,7 +397,7 @@ class Fake:
 
         :return: Случайная фамилия.
         """
-        return self.faker.last_name()
+        return self.get_pooled("last_name", self.faker.last_name)
 
     def first_name(self) -> str:
         """
@@ -86,7 +405,7 @@ class Fake:
 
         :return: Случайное имя.
         """
-        return self.faker.first_name()
+        return self.get_pooled("first_name", self.faker.first_name)
 
     def middle_name(self) -> str:
         """
@@ -94,7 +413,7 @@ class Fake:
 
         :return: Случайное отчество.
         """
-        return self.faker.first_name()
+        return self.get_pooled("first_name", self.faker.first_name)
 
     def phone_number(self) -> str:
         """
@@ -102,7 +421,7 @@ class Fake:
 
         :return: Случайный номер телефона.
         """
-        return self.faker.phone_number()
+        return self.get_pooled("phone_number", self.faker.phone_number)
 
     def float(self, start: int = 1, end: int = 100) -> float:
         """
@@ -120,7 +439,7 @@ class Fake:
 
         :return: Сумма от 1 до 1000.
         """
-        return self.float(1, 1000)
+        return self.get_pooled("amount", lambda: self.get_buffered("amount", self.amounts, lambda: self.float(1, 1000)))
 
     def uuid4(self):
         """
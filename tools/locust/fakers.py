@@ -0,0 +1,56 @@
+import itertools
+
+from locust import User, events
+from locust.env import Environment
+
+from config import settings
+from tools.fakers import fake, get_stream_seed
+from tools.logger import get_logger
+
+# Порядковый номер виртуального пользователя в процессе — ключ его потока данных
+user_counter = itertools.count()
+
+logger = get_logger("LOCUST_FAKERS")
+
+
+@events.init.add_listener
+def init_fakers(environment: Environment, **kwargs) -> None:
+    """
+    Хук Locust: настраивает генерацию тестовых данных.
+
+    - FAKERS.SEED: основной поток данных процесса (сидинг, хуки) становится детерминированным;
+    - FAKERS.BULK_SIZE: суммы, категории и статусы генерируются пакетами;
+    - FAKERS.POOL_ENABLED: заранее генерирует пулы тестовых данных, чтобы Faker не вызывался в задачах
+      виртуальных пользователей. При заданном seed пулы заполняются сразу, так как фоновое заполнение
+      делает содержимое пулов зависимым от планирования гринлетов.
+    """
+    if settings.fakers.seed is not None:
+        fake.seed(settings.fakers.seed, salt=settings.fakers.seed_salt)
+        logger.info(f"Deterministic fake data enabled: seed={settings.fakers.seed}, salt={settings.fakers.seed_salt}")
+
+    if settings.fakers.bulk_size > 1:
+        fake.enable_bulk(settings.fakers.bulk_size)
+
+    if not settings.fakers.pool_enabled:
+        return
+
+    background = settings.fakers.pool_background and settings.fakers.seed is None
+    fake.enable_pools(size=settings.fakers.pool_size, background=background)
+    logger.info(f"Fake data pools enabled: size={settings.fakers.pool_size}, background={background}")
+
+
+def init_user_fake_stream(user: User) -> None:
+    """
+    При FAKERS.SEED переключает гринлет виртуального пользователя на собственный поток данных,
+    выведенный из seed, номера воркера (worker_index, 0 для локального запуска) и порядкового номера пользователя.
+    При одинаковом распределении пользователей по воркерам запуск воспроизводит те же тела запросов
+    (кроме префикса email, если задана FAKERS.SEED_SALT).
+
+    :param user: Виртуальный пользователь Locust.
+    """
+    if settings.fakers.seed is None:
+        return
+
+    worker_index = max(getattr(user.environment.runner, "worker_index", 0), 0)
+    stream_seed = get_stream_seed(settings.fakers.seed, worker_index, next(user_counter))
+    fake.use_stream(stream_seed, salt=settings.fakers.seed_salt)
@@ -0,0 +1,247 @@
+import json
+import math
+import os
+
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from config import settings
+from tools.logger import get_logger
+
+# Ключ, под которым воркер прикладывает гистограммы к отчёту для мастера
+HISTOGRAMS_REPORT_KEY = "hdr_histograms"
+
+# Перцентили, которые выгружаются в итоговый отчёт
+REPORT_PERCENTILES = (50.0, 90.0, 95.0, 99.0, 99.9, 99.99)
+
+logger = get_logger("LOCUST_HISTOGRAM")
+
+
+class HDRHistogram:
+    """
+    Гистограмма задержек в духе HdrHistogram: лог-линейные корзины с фиксированной относительной погрешностью.
+
+    - значения хранятся в микросекундах, погрешность любого значения не больше 10^-significant_figures;
+    - память ограничена количеством корзин (~ half_count * log2(max / sub_bucket_count)) и не растёт с числом запросов;
+    - гистограммы с одинаковой точностью складываются без потерь (merge), поэтому их можно собирать с воркеров.
+    """
+
+    def __init__(self, significant_figures: int = 3):
+        """
+        :param significant_figures: Количество значащих цифр (1-5).
+        """
+        self.significant_figures = significant_figures
+        # Корзин в линейном участке должно хватать на 2 * 10^N различимых значений
+        self.sub_bucket_bits = math.ceil(math.log2(2 * 10 ** significant_figures))
+        self.sub_bucket_count = 1 << self.sub_bucket_bits
+        self.half_count = self.sub_bucket_count >> 1
+        self.counts: dict[int, int] = {}
+        self.total_count = 0
+        self.max_value = 0
+
+    def get_index(self, value: int) -> int:
+        """
+        :param value: Значение в микросекундах.
+        :return: Индекс корзины.
+        """
+        if value < self.sub_bucket_count:
+            return value
+
+        exponent = value.bit_length() - self.sub_bucket_bits
+        return self.sub_bucket_count + (exponent - 1) * self.half_count + (value >> exponent) - self.half_count
+
+    def get_highest_equivalent_value(self, index: int) -> int:
+        """
+        :param index: Индекс корзины.
+        :return: Наибольшее значение, попадающее в корзину.
+        """
+        if index < self.sub_bucket_count:
+            return index
+
+        exponent, offset = divmod(index - self.sub_bucket_count, self.half_count)
+        exponent += 1
+        return ((self.half_count + offset + 1) << exponent) - 1
+
+    def record(self, value: int, count: int = 1) -> None:
+        """
+        :param value: Значение в микросекундах.
+        :param count: Сколько раз значение встретилось.
+        """
+        value = max(value, 0)
+        index = self.get_index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total_count += count
+        self.max_value = max(self.max_value, value)
+
+    def merge(self, other: "HDRHistogram") -> None:
+        """
+        Прибавляет к гистограмме другую гистограмму той же точности.
+
+        :param other: Гистограмма для слияния.
+        """
+        if other.significant_figures != self.significant_figures:
+            raise ValueError("Cannot merge histograms with different significant figures")
+
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total_count += other.total_count
+        self.max_value = max(self.max_value, other.max_value)
+
+    def get_value_at_percentile(self, percentile: float) -> int:
+        """
+        :param percentile: Перцентиль (0-100).
+        :return: Значение в микросекундах (верхняя граница корзины, но не больше максимума).
+        """
+        if self.total_count == 0:
+            return 0
+
+        target = max(1, math.ceil(self.total_count * percentile / 100))
+        cumulative = 0
+        for index in sorted(self.counts):
+            cumulative += self.counts[index]
+            if cumulative >= target:
+                return min(self.get_highest_equivalent_value(index), self.max_value)
+
+        return self.max_value
+
+    def get_distribution(self) -> list[tuple[int, int]]:
+        """
+        :return: Полное распределение: пары (верхняя граница корзины в мкс, количество) по возрастанию.
+        """
+        return [(self.get_highest_equivalent_value(index), self.counts[index]) for index in sorted(self.counts)]
+
+    def to_dict(self) -> dict:
+        """
+        :return: Представление для передачи через сообщения Locust (ключи — строки, как требует msgpack-карта).
+        """
+        return {
+            "significant_figures": self.significant_figures,
+            "counts": {str(index): count for index, count in self.counts.items()},
+            "max_value": self.max_value
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HDRHistogram":
+        """
+        :param data: Результат to_dict().
+        :return: Восстановленная гистограмма.
+        """
+        histogram = cls(significant_figures=data["significant_figures"])
+        histogram.counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.total_count = sum(histogram.counts.values())
+        histogram.max_value = data["max_value"]
+        return histogram
+
+
+class LocustHistogramRecorder:
+    """
+    Записывает задержки из события Locust request в HDR-гистограммы по каждому эндпоинту
+    (ключ — "<request_type> <name>"), то есть всё, что отправляют HTTP-хуки и gRPC-интерцепторы.
+
+    В распределённом запуске воркер прикладывает накопленные с прошлого отчёта гистограммы к report_to_master
+    и очищает их, мастер складывает их в worker_report. Итоговый отчёт пишет мастер (или локальный раннер).
+    """
+
+    def __init__(self, environment: Environment, significant_figures: int, report_file: str):
+        """
+        :param environment: Окружение Locust.
+        :param significant_figures: Точность гистограмм.
+        :param report_file: Файл итогового отчёта.
+        """
+        self.environment = environment
+        self.significant_figures = significant_figures
+        self.report_file = report_file
+        self.histograms: dict[str, HDRHistogram] = {}
+
+    def get_histogram(self, key: str) -> HDRHistogram:
+        if key not in self.histograms:
+            self.histograms[key] = HDRHistogram(significant_figures=self.significant_figures)
+        return self.histograms[key]
+
+    def on_request(self, request_type: str, name: str, response_time: float, **kwargs) -> None:
+        self.get_histogram(f"{request_type} {name}").record(round(response_time * 1000))
+
+    def on_report_to_master(self, client_id: str, data: dict, **kwargs) -> None:
+        data[HISTOGRAMS_REPORT_KEY] = {key: histogram.to_dict() for key, histogram in self.histograms.items()}
+        self.histograms.clear()
+
+    def on_worker_report(self, client_id: str, data: dict, **kwargs) -> None:
+        for key, histogram in data.get(HISTOGRAMS_REPORT_KEY, {}).items():
+            self.get_histogram(key).merge(HDRHistogram.from_dict(histogram))
+
+    def on_quitting(self, **kwargs) -> None:
+        self.export()
+
+    def build_report(self) -> dict:
+        """
+        :return: Перцентили (в мс), максимум и полное распределение по каждому эндпоинту.
+        """
+        return {
+            key: {
+                "count": histogram.total_count,
+                "max": histogram.max_value / 1000,
+                "percentiles": {
+                    str(percentile): histogram.get_value_at_percentile(percentile) / 1000
+                    for percentile in REPORT_PERCENTILES
+                },
+                "distribution": [
+                    [value / 1000, count] for value, count in histogram.get_distribution()
+                ]
+            }
+            for key, histogram in sorted(self.histograms.items())
+        }
+
+    def export(self) -> None:
+        """
+        Выгружает итоговый отчёт в report_file и выводит перцентили в лог.
+        """
+        report = self.build_report()
+        if not report:
+            return
+
+        directory = os.path.dirname(self.report_file)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with open(self.report_file, 'w', encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+        for key, entry in report.items():
+            percentiles = ", ".join(f"p{percentile}={value:.3f}ms" for percentile, value in entry["percentiles"].items())
+            logger.info(f"{key}: count={entry['count']}, {percentiles}, max={entry['max']:.3f}ms")
+        logger.info(f"Latency histograms saved to file: {self.report_file}")
+
+    def attach(self) -> None:
+        """
+        Подписывает рекордер на события Locust в зависимости от роли процесса.
+        """
+        runner = self.environment.runner
+        events = self.environment.events
+
+        if isinstance(runner, MasterRunner):
+            events.worker_report.add_listener(self.on_worker_report)
+        else:
+            events.request.add_listener(self.on_request)
+
+        if isinstance(runner, WorkerRunner):
+            events.report_to_master.add_listener(self.on_report_to_master)
+        else:
+            events.quitting.add_listener(self.on_quitting)
+
+
+@events.init.add_listener
+def init_histogram_recorder(environment: Environment, **kwargs) -> None:
+    """
+    Хук Locust: при HISTOGRAM.ENABLED=true подключает запись HDR-гистограмм задержек.
+    """
+    if not settings.histogram.enabled:
+        return
+
+    recorder = LocustHistogramRecorder(
+        environment=environment,
+        significant_figures=settings.histogram.significant_figures,
+        report_file=settings.histogram.report_file
+    )
+    recorder.attach()
+    environment.histogram_recorder = recorder
@@ -0,0 +1,352 @@
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+
+from locust.stats import RequestStats, calculate_response_time_percentile
+from pydantic import BaseModel
+
+from config import settings
+from tools.config.shape import LoadShapeConfig
+from tools.locust.schedule import SCHEDULE_LAG_REQUEST_TYPE
+from tools.locust.service_stats import HTTP_PHASE_REQUEST_TYPE
+from tools.logger import get_logger
+
+# Служебные метрики (отставание от расписания, фазы HTTP-запроса), которые не являются эндпоинтами.
+# Они пишутся в tools.locust.service_stats, а фильтр защищает от их попадания в статистику Locust
+SERVICE_REQUEST_TYPES = (SCHEDULE_LAG_REQUEST_TYPE, HTTP_PHASE_REQUEST_TYPE)
+
+# Запас в секундах к run-time поиска точки насыщения, чтобы последняя ступень успела завершиться
+KNEE_RUN_TIME_MARGIN = 10
+
+logger = get_logger("LOCUST_KNEE")
+
+
+class KneeEndpointResult(BaseModel):
+    """
+    Показатели эндпоинта на одной ступени нагрузки.
+    """
+    rps: float
+    p95: float
+    fail_ratio: float
+
+
+class KneeStepResult(BaseModel):
+    """
+    Показатели ступени нагрузки: суммарные и по каждому эндпоинту ("<тип> <имя>").
+    """
+    users: int
+    rps: float
+    p95: float
+    fail_ratio: float
+    endpoints: dict[str, KneeEndpointResult]
+
+
+class KneeReport(BaseModel):
+    """
+    Итог поиска точки насыщения.
+
+    - knee_users / knee_reason: ступень, на которой найдено насыщение, и его причина
+      (throughput, latency, errors); None, если насыщение не достигнуто до users / run-time;
+    - max_sustainable_rps: максимальный RPS каждого эндпоинта на ступенях до точки насыщения.
+    """
+    knee_users: int | None = None
+    knee_reason: str | None = None
+    max_sustainable_rps: dict[str, float] = {}
+    steps: list[KneeStepResult] = []
+
+
+class StatsSnapshot:
+    """
+    Снимок накопленной статистики Locust по эндпоинтам, из разницы двух снимков считаются показатели ступени.
+    """
+
+    def __init__(self, stats: RequestStats):
+        self.time = time.monotonic()
+        self.entries: dict[str, tuple[int, int, dict[int, int]]] = {
+            f"{method} {name}": (entry.num_requests, entry.num_failures, dict(entry.response_times))
+            for (name, method), entry in stats.entries.items()
+            if method not in SERVICE_REQUEST_TYPES
+        }
+
+
+def build_endpoint_result(
+        start: tuple[int, int, dict[int, int]] | None,
+        end: tuple[int, int, dict[int, int]],
+        duration: float
+) -> KneeEndpointResult:
+    """
+    :param start: Накопленные (запросы с учётом ошибок, ошибки, распределение времени ответа) в начале окна.
+    :param end: То же в конце окна.
+    :param duration: Длительность окна в секундах.
+    :return: RPS, p95 и доля ошибок эндпоинта за окно.
+    """
+    start_requests, start_failures, start_times = start or (0, 0, {})
+    end_requests, end_failures, end_times = end
+
+    num_requests = end_requests - start_requests
+    num_failures = end_failures - start_failures
+    response_times = {
+        response_time: count - start_times.get(response_time, 0)
+        for response_time, count in end_times.items()
+        if count > start_times.get(response_time, 0)
+    }
+
+    return KneeEndpointResult(
+        rps=num_requests / duration,
+        p95=calculate_response_time_percentile(response_times, sum(response_times.values()), 0.95),
+        fail_ratio=num_failures / num_requests if num_requests else 0.0
+    )
+
+
+def build_step_result(start: StatsSnapshot, end: StatsSnapshot, users: int) -> KneeStepResult:
+    """
+    :param start: Снимок в начале окна измерения.
+    :param end: Снимок в конце окна измерения.
+    :param users: Количество пользователей на ступени.
+    :return: Показатели ступени.
+    """
+    duration = max(end.time - start.time, 1e-9)
+    endpoints = {
+        key: build_endpoint_result(start.entries.get(key), entry, duration)
+        for key, entry in sorted(end.entries.items())
+    }
+
+    rps = sum(endpoint.rps for endpoint in endpoints.values())
+    failures = sum(endpoint.rps * endpoint.fail_ratio for endpoint in endpoints.values())
+    # p95 ступени — худший p95 среди эндпоинтов: насыщение одного эндпоинта не должно теряться в среднем
+    return KneeStepResult(
+        users=users,
+        rps=rps,
+        p95=max((endpoint.p95 for endpoint in endpoints.values()), default=0),
+        fail_ratio=failures / rps if rps else 0.0,
+        endpoints=endpoints
+    )
+
+
+def get_knee_reason(steps: list[KneeStepResult], config: LoadShapeConfig) -> str | None:
+    """
+    Проверяет, является ли последняя ступень точкой насыщения.
+
+    :param steps: Измеренные ступени, последняя — текущая.
+    :param config: Параметры формы нагрузки.
+    :return: Причина насыщения (errors, latency, throughput) или None.
+    """
+    current = steps[-1]
+    if current.fail_ratio > config.max_fail_ratio:
+        return "errors"
+
+    baseline = steps[0]
+    if current.p95 > config.max_p95 or (baseline.p95 and current.p95 > baseline.p95 * config.knee_latency_factor):
+        return "latency"
+
+    if len(steps) > 1:
+        previous = steps[-2]
+        expected_gain = current.users / previous.users - 1
+        actual_gain = current.rps / previous.rps - 1 if previous.rps else expected_gain
+        if expected_gain > 0 and actual_gain < expected_gain * config.knee_efficiency:
+            return "throughput"
+
+    return None
+
+
+class KneeFinder:
+    """
+    Измеряет ступени нагрузки и ищет точку насыщения (knee).
+
+    Каждая ступень измеряется во второй половине, после того как пользователи запущены и нагрузка установилась:
+    start_step() вызывается в середине ступени, finish_step() — в конце.
+    """
+
+    def __init__(self, config: LoadShapeConfig):
+        self.config = config
+        self.report = KneeReport()
+        self.snapshot: StatsSnapshot | None = None
+        self.exported = False
+
+    def start_step(self, stats: RequestStats) -> None:
+        self.snapshot = StatsSnapshot(stats)
+
+    def finish_step(self, stats: RequestStats, users: int) -> bool:
+        """
+        :param stats: Статистика Locust.
+        :param users: Количество пользователей на завершившейся ступени.
+        :return: True, если ступень оказалась точкой насыщения.
+        """
+        if self.snapshot is None:
+            return False
+
+        step = build_step_result(self.snapshot, StatsSnapshot(stats), users)
+        self.snapshot = None
+        self.report.steps.append(step)
+        logger.info(
+            f"Step {users} users: {step.rps:.1f} RPS, p95={step.p95}ms, fail ratio={step.fail_ratio:.2%}"
+        )
+
+        reason = get_knee_reason(self.report.steps, self.config)
+        if reason is None:
+            return False
+
+        self.report.knee_users = users
+        self.report.knee_reason = reason
+        return True
+
+    def build_max_sustainable_rps(self) -> dict[str, float]:
+        """
+        :return: Максимальный RPS каждого эндпоинта на ступенях до точки насыщения.
+        """
+        steps = self.report.steps[:-1] if self.report.knee_users is not None else self.report.steps
+        max_rps: dict[str, float] = {}
+        for step in steps:
+            for key, endpoint in step.endpoints.items():
+                max_rps[key] = max(max_rps.get(key, 0.0), round(endpoint.rps, 2))
+        return max_rps
+
+    def export(self) -> KneeReport:
+        """
+        Выгружает отчёт в knee_report_file и выводит максимальный устойчивый RPS в лог.
+
+        :return: Итоговый отчёт.
+        """
+        self.report.max_sustainable_rps = self.build_max_sustainable_rps()
+        self.exported = True
+
+        directory = os.path.dirname(self.config.knee_report_file)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with open(self.config.knee_report_file, 'w', encoding="utf-8") as file:
+            file.write(self.report.model_dump_json(indent=2))
+
+        if self.report.knee_users is None:
+            logger.info("Knee not reached, load stopped by users / run-time limit")
+        else:
+            logger.info(f"Knee reached at {self.report.knee_users} users ({self.report.knee_reason})")
+        for key, rps in self.report.max_sustainable_rps.items():
+            logger.info(f"{key}: max sustainable {rps} RPS")
+        logger.info(f"Knee report saved to file: {self.config.knee_report_file}")
+        return self.report
+
+
+def read_locust_config(config_file: str | None) -> dict[str, str]:
+    """
+    Читает параметры из .conf сценария (строки вида "users = 150").
+
+    :param config_file: Путь к .conf или None.
+    :return: Параметры по имени без "--" (например, "users", "shape-step-duration").
+    """
+    options: dict[str, str] = {}
+    if config_file is None:
+        return options
+
+    with open(config_file, encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith(("#", ";", "[")) or "=" not in line:
+                continue
+
+            key, value = line.split("=", 1)
+            options[key.strip()] = value.strip()
+
+    return options
+
+
+def get_locust_option(
+        flags: tuple[str, ...],
+        locust_args: list[str],
+        config: dict[str, str]
+) -> str | None:
+    """
+    Значение параметра Locust: из командной строки (последнее вхождение), иначе из .conf.
+
+    :param flags: Варианты флага, первый — полное имя (например, ("--users", "-u")).
+    :param locust_args: Параметры Locust из командной строки.
+    :param config: Параметры из .conf сценария.
+    :return: Значение или None.
+    """
+    value = None
+    for index, argument in enumerate(locust_args):
+        for flag in flags:
+            if argument == flag and index + 1 < len(locust_args):
+                value = locust_args[index + 1]
+            elif argument.startswith(f"{flag}="):
+                value = argument.split("=", 1)[1]
+
+    if value is not None:
+        return value
+
+    return config.get(flags[0].removeprefix("--"))
+
+
+def run_knee_finder(locustfile: str, config_file: str | None, locust_args: list[str]) -> KneeReport:
+    """
+    Запускает сценарий Locust с формой нагрузки knee (headless) и возвращает отчёт о точке насыщения.
+
+    run-time из .conf сценария не подходит для поиска точки насыщения, поэтому он заменяется временем
+    прохода всех ступеней: ceil(users / step_users) * step_duration с небольшим запасом
+    (явный --run-time в locust_args важнее).
+
+    :param locustfile: Путь к scenario.py сценария.
+    :param config_file: .conf сценария (по умолчанию v1.0.conf рядом со сценарием, если есть).
+    :param locust_args: Дополнительные параметры Locust (например, --users 1000 --shape-step-users 20).
+    :return: Отчёт из knee_report_file.
+    :raises RuntimeError: Locust не записал отчёт (например, упал до конца первой ступени).
+    """
+    if config_file is None:
+        default_config_file = os.path.join(os.path.dirname(locustfile), "v1.0.conf")
+        config_file = default_config_file if os.path.exists(default_config_file) else None
+
+    config = read_locust_config(config_file)
+    users = get_locust_option(("--users", "-u"), locust_args, config)
+    if users is None:
+        raise ValueError("Knee finder requires users (--users or users in .conf)")
+
+    step_users = int(get_locust_option(("--shape-step-users",), locust_args, config) or settings.load_shape.step_users)
+    step_duration = int(
+        get_locust_option(("--shape-step-duration",), locust_args, config) or settings.load_shape.step_duration
+    )
+    # Запас, чтобы последняя ступень успела измериться до остановки по run-time
+    run_time = math.ceil(int(users) / step_users) * step_duration + KNEE_RUN_TIME_MARGIN
+    report_file = (
+        get_locust_option(("--shape-knee-report-file",), locust_args, config)
+        or settings.load_shape.knee_report_file
+    )
+
+    # Отчёт прошлого запуска удаляем, чтобы не вернуть его, если Locust упадёт
+    if os.path.exists(report_file):
+        os.remove(report_file)
+
+    command = [sys.executable, "-m", "locust", "-f", locustfile, "--headless", "--load-shape", "knee"]
+    if config_file:
+        command += ["--config", config_file]
+    command += ["--run-time", f"{run_time}s", *locust_args]
+
+    logger.info(f"Running knee finder: {' '.join(command)}")
+    process = subprocess.run(command, check=False)
+
+    if not os.path.exists(report_file):
+        raise RuntimeError(f"Knee report was not written, locust exited with code {process.returncode}")
+
+    with open(report_file, encoding="utf-8") as file:
+        return KneeReport.model_validate(json.load(file))
+
+
+if __name__ == '__main__':
+    """
+    Поиск точки насыщения для любого сценария:
+
+        python -m tools.locust.knee ./scenarios/grpc/gateway/existing_user_get_operations/scenario.py \
+            --users 1000 --shape-step-users 20 --shape-step-duration 60
+
+    Все параметры после сценария (и --config) передаются Locust.
+    """
+    parser = argparse.ArgumentParser(description="Поиск точки насыщения сценария Locust")
+    parser.add_argument("locustfile", help="Путь к scenario.py сценария")
+    parser.add_argument("--config", default=None, help=".conf сценария (по умолчанию v1.0.conf рядом со сценарием)")
+    arguments, extra_arguments = parser.parse_known_args()
+
+    knee_report = run_knee_finder(arguments.locustfile, arguments.config, extra_arguments)
+    print(json.dumps(knee_report.max_sustainable_rps, indent=2))
@@ -0,0 +1,71 @@
+import threading
+from time import perf_counter
+from typing import Callable
+
+from locust import User
+from locust.env import Environment
+
+from tools.locust.service_stats import record_service_metric
+
+# Под Locust threading патчится gevent, поэтому состояние локально для гринлета виртуального пользователя
+schedule_state = threading.local()
+
+# Тип и имя метрики отставания от расписания в служебной статистике (tools.locust.service_stats)
+SCHEDULE_LAG_REQUEST_TYPE = "SCHEDULE"
+SCHEDULE_LAG_NAME = "lag"
+
+
+def set_intended_start(intended_start: float | None) -> None:
+    """
+    Запоминает запланированное время начала следующей задачи текущего виртуального пользователя.
+
+    :param intended_start: Время по perf_counter или None.
+    """
+    schedule_state.intended_start = intended_start
+
+
+def pop_intended_start() -> float | None:
+    """
+    Забирает запланированное время начала задачи. Забирает его первый запрос задачи:
+    именно его задержка считается от запланированного, а не от фактического старта.
+
+    :return: Время по perf_counter или None (closed-модель или время уже забрано).
+    """
+    intended_start = getattr(schedule_state, "intended_start", None)
+    schedule_state.intended_start = None
+    return intended_start
+
+
+def constant_arrival_rate(arrival_rate: float) -> Callable[[User], float]:
+    """
+    wait_time для open-модели: задачи виртуального пользователя начинаются по фиксированному расписанию
+    (каждые 1 / arrival_rate секунд), а не через паузу после окончания предыдущей задачи.
+
+    Если шлюз замедлился и задача не успела начаться вовремя, ожидание равно 0 и расписание не сдвигается —
+    пользователь догоняет его, а отставание фиксируется (см. pop_intended_start), вместо того чтобы
+    незаметно снизить нагрузку (coordinated omission).
+
+    :param arrival_rate: Количество запусков задач в секунду на одного виртуального пользователя.
+    :return: Функция wait_time для Locust.
+    """
+    interval = 1 / arrival_rate
+
+    def wait_time_func(self: User) -> float:
+        now = perf_counter()
+        next_start = getattr(self, "_intended_next_start", now) + interval
+        self._intended_next_start = next_start
+        set_intended_start(next_start)
+        return max(0.0, next_start - now)
+
+    return wait_time_func
+
+
+def record_schedule_lag(environment: Environment, schedule_lag: float) -> None:
+    """
+    Записывает отставание задачи от расписания в служебную статистику ("SCHEDULE lag").
+    В статистику эндпоинтов Locust оно не попадает, чтобы не искажать RPS и перцентили "Aggregated".
+
+    :param environment: Окружение Locust.
+    :param schedule_lag: Отставание в миллисекундах.
+    """
+    record_service_metric(environment, SCHEDULE_LAG_REQUEST_TYPE, SCHEDULE_LAG_NAME, schedule_lag)
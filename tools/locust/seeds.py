@@ -0,0 +1,132 @@
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from config import settings
+from seeds.columnar import SeedsColumnarStore, SeedUserView
+from seeds.dumps import save_seeds_users, load_seeds_result
+from seeds.scenario import SeedsScenario
+from seeds.schema.result import SeedsResult, SeedUserResult
+from tools.config.seeds import SeedsDumpFormat, SeedsShardTransport
+from tools.logger import get_logger
+
+# Имя сообщения Locust, которым мастер отправляет воркеру его шард
+SEEDS_SHARD_MESSAGE = "seeds_shard"
+
+logger = get_logger("LOCUST_SEEDS")
+
+
+def get_seeds_shard_scenario(scenario: str, shard_index: int) -> str:
+    """
+    Возвращает имя дампа шарда: ./dumps/{scenario}_shard_{index}_seeds.ndjson
+
+    :param scenario: Название сценария сидинга.
+    :param shard_index: Номер шарда (порядковый номер воркера).
+    :return: Имя сценария для функций из seeds.dumps.
+    """
+    return f"{scenario}_shard_{shard_index}"
+
+
+def build_seeds_shard(
+        seeds: SeedsResult | SeedsColumnarStore,
+        shard_index: int,
+        shard_count: int
+) -> list[SeedUserResult]:
+    """
+    Выбирает пользователей шарда: каждого shard_count-го, начиная с shard_index.
+    Шарды с разными индексами не пересекаются и вместе покрывают всех пользователей.
+
+    :param seeds: Загруженный результат сидинга.
+    :param shard_index: Номер шарда.
+    :param shard_count: Общее количество шардов.
+    :return: Пользователи шарда (представления колоночного хранилища материализуются).
+    """
+    users = seeds.users
+    shard = [users[index] for index in range(shard_index, len(users), shard_count)]
+    return [user.to_result() if isinstance(user, SeedUserView) else user for user in shard]
+
+
+def configure_seeds(seeds: SeedsResult | SeedsColumnarStore) -> SeedsResult | SeedsColumnarStore:
+    """
+    Настраивает раздатчик пользователей по SEEDS.EXHAUSTION_POLICY / SEEDS.EXHAUSTION_TIMEOUT.
+
+    :param seeds: Результат сидинга или шард.
+    :return: Тот же объект.
+    """
+    seeds.configure_dispenser(
+        policy=settings.seeds.exhaustion_policy,
+        timeout=settings.seeds.exhaustion_timeout
+    )
+    return seeds
+
+
+def send_seeds_shards(environment: Environment, seeds_scenario: SeedsScenario) -> None:
+    """
+    Рассылает подключённым воркерам непересекающиеся шарды пользователей.
+
+    При SEEDS.SHARD_TRANSPORT=message пользователи передаются в теле сообщения,
+    при SEEDS.SHARD_TRANSPORT=file мастер пишет шард в NDJSON-дамп и передаёт только его имя.
+
+    :param environment: Окружение Locust мастера.
+    :param seeds_scenario: Сценарий сидинга, данные которого раздаются.
+    """
+    runner: MasterRunner = environment.runner
+    workers = sorted(runner.clients.all, key=lambda worker: worker.id)
+
+    for shard_index, worker in enumerate(workers):
+        shard = build_seeds_shard(environment.seeds, shard_index=shard_index, shard_count=len(workers))
+
+        if settings.seeds.shard_transport == SeedsShardTransport.FILE:
+            shard_scenario = get_seeds_shard_scenario(seeds_scenario.scenario, shard_index)
+            save_seeds_users(shard, scenario=shard_scenario)
+            data = {"scenario": shard_scenario}
+        else:
+            data = {"users": [user.model_dump() for user in shard]}
+
+        runner.send_message(SEEDS_SHARD_MESSAGE, data, client_id=worker.id)
+        logger.info(f"[{seeds_scenario.scenario}] Sent seeding shard {shard_index} ({len(shard)} users) to {worker.id}")
+
+
+def receive_seeds_shard(environment: Environment, data: dict) -> None:
+    """
+    Принимает шард пользователей от мастера и делает его источником пользователей воркера.
+
+    :param environment: Окружение Locust воркера.
+    :param data: Пользователи шарда ("users") или имя его NDJSON-дампа ("scenario").
+    """
+    if "scenario" in data:
+        seeds = load_seeds_result(scenario=data["scenario"], dump_format=SeedsDumpFormat.NDJSON)
+    else:
+        seeds = SeedsResult.model_validate({"users": data["users"]})
+
+    environment.seeds = configure_seeds(seeds)
+    logger.info(f"Received seeding shard with {len(seeds.users)} users")
+
+
+def init_seeds(environment: Environment, seeds_scenario: SeedsScenario) -> None:
+    """
+    Подготавливает сидинговые данные с учётом режима запуска Locust.
+
+    - локальный запуск: сидинг и загрузка данных в текущем процессе, как раньше;
+    - мастер: сидинг выполняется один раз, а на test_start (до рассылки команды spawn)
+      каждому воркеру отправляется его шард;
+    - воркер: сидинг не выполняется, в environment.seeds попадает только шард от мастера.
+
+    Воркеры, подключившиеся после старта теста, шард не получат до следующего test_start.
+
+    :param environment: Окружение Locust, переданное в хук init.
+    :param seeds_scenario: Сценарий сидинга.
+    """
+    if isinstance(environment.runner, WorkerRunner):
+        environment.runner.register_message(
+            SEEDS_SHARD_MESSAGE,
+            lambda msg, **kwargs: receive_seeds_shard(environment, msg.data)
+        )
+        return
+
+    seeds_scenario.build()
+    environment.seeds = seeds_scenario.load()
+
+    if isinstance(environment.runner, MasterRunner):
+        environment.events.test_start.add_listener(
+            lambda **kwargs: send_seeds_shards(environment, seeds_scenario)
+        )
@@ -0,0 +1,138 @@
+import json
+import os
+
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+from locust.stats import RequestStats, StatsEntry
+
+from tools.logger import get_logger
+
+# Тип метрик длительности фаз HTTP-запроса (connect, tls, send, wait, receive)
+HTTP_PHASE_REQUEST_TYPE = "HTTP-phase"
+
+# Ключ, под которым воркер прикладывает служебные метрики к отчёту для мастера
+SERVICE_STATS_REPORT_KEY = "service_stats"
+
+# Файл итогового отчёта по служебным метрикам
+SERVICE_STATS_REPORT_FILE = "./dumps/service_stats.json"
+
+logger = get_logger("LOCUST_SERVICE_STATS")
+
+
+class LocustServiceStats:
+    """
+    Служебные метрики (отставание от расписания, фазы HTTP-запроса), которые не являются запросами к эндпоинтам.
+
+    Они пишутся в отдельный RequestStats, а не в событие Locust request, поэтому не попадают в "Aggregated",
+    HTML/CSV-отчёты Locust и runner.stats.total, по которому работают формы нагрузки.
+
+    В распределённом запуске воркер прикладывает накопленные с прошлого отчёта метрики к report_to_master,
+    мастер складывает их в worker_report. Итоговый отчёт пишет мастер (или локальный раннер).
+    """
+
+    def __init__(self, environment: Environment, report_file: str):
+        """
+        :param environment: Окружение Locust.
+        :param report_file: Файл итогового отчёта.
+        """
+        self.environment = environment
+        self.report_file = report_file
+        self.stats = RequestStats()
+
+    def record(self, request_type: str, name: str, response_time: float) -> None:
+        """
+        :param request_type: Тип метрики (например, SCHEDULE или HTTP-phase).
+        :param name: Имя метрики.
+        :param response_time: Значение в миллисекундах.
+        """
+        self.stats.log_request(request_type, name, response_time, 0)
+
+    def on_report_to_master(self, client_id: str, data: dict, **kwargs) -> None:
+        data[SERVICE_STATS_REPORT_KEY] = [entry.get_stripped_report() for entry in self.stats.entries.values()]
+
+    def on_worker_report(self, client_id: str, data: dict, **kwargs) -> None:
+        for entry_data in data.get(SERVICE_STATS_REPORT_KEY, []):
+            entry = StatsEntry.unserialize(entry_data, self.stats)
+            self.stats.entries[(entry.name, entry.method)].extend(entry)
+
+    def on_quitting(self, **kwargs) -> None:
+        self.export()
+
+    def build_report(self) -> dict:
+        """
+        :return: Количество, среднее, перцентили и максимум (в мс) по каждой метрике.
+        """
+        return {
+            f"{entry.method} {entry.name}": {
+                "count": entry.num_requests,
+                "avg": round(entry.avg_response_time, 3),
+                "p50": entry.get_response_time_percentile(0.5),
+                "p95": entry.get_response_time_percentile(0.95),
+                "p99": entry.get_response_time_percentile(0.99),
+                "max": entry.max_response_time
+            }
+            for entry in sorted(self.stats.entries.values(), key=lambda entry: (entry.method, entry.name))
+            if entry.num_requests
+        }
+
+    def export(self) -> None:
+        """
+        Выгружает итоговый отчёт в report_file и выводит его в лог.
+        """
+        report = self.build_report()
+        if not report:
+            return
+
+        directory = os.path.dirname(self.report_file)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with open(self.report_file, 'w', encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+        for key, entry in report.items():
+            logger.info(
+                f"{key}: count={entry['count']}, avg={entry['avg']}ms, p50={entry['p50']}ms, "
+                f"p95={entry['p95']}ms, p99={entry['p99']}ms, max={entry['max']}ms"
+            )
+        logger.info(f"Service stats saved to file: {self.report_file}")
+
+    def attach(self) -> None:
+        """
+        Подписывает сборщик на события Locust в зависимости от роли процесса.
+        """
+        runner = self.environment.runner
+        events = self.environment.events
+
+        if isinstance(runner, MasterRunner):
+            events.worker_report.add_listener(self.on_worker_report)
+
+        if isinstance(runner, WorkerRunner):
+            events.report_to_master.add_listener(self.on_report_to_master)
+        else:
+            events.quitting.add_listener(self.on_quitting)
+
+
+def record_service_metric(environment: Environment, request_type: str, name: str, response_time: float) -> None:
+    """
+    Записывает служебную метрику в environment.service_stats (мимо статистики эндпоинтов Locust).
+
+    :param environment: Окружение Locust.
+    :param request_type: Тип метрики.
+    :param name: Имя метрики.
+    :param response_time: Значение в миллисекундах.
+    """
+    service_stats: LocustServiceStats | None = getattr(environment, "service_stats", None)
+    if service_stats is not None:
+        service_stats.record(request_type, name, response_time)
+
+
+@events.init.add_listener
+def init_service_stats(environment: Environment, **kwargs) -> None:
+    """
+    Хук Locust: подключает сбор служебных метрик.
+    """
+    service_stats = LocustServiceStats(environment=environment, report_file=SERVICE_STATS_REPORT_FILE)
+    service_stats.attach()
+    environment.service_stats = service_stats
@@ -0,0 +1,341 @@
+import math
+
+from locust import LoadTestShape, events
+from locust.argument_parser import LocustArgumentParser
+from locust.env import Environment
+
+from config import settings
+from tools.config.shape import LoadShapeConfig, LoadShapeKind
+from tools.locust.knee import KneeFinder, StatsSnapshot, build_step_result
+from tools.logger import get_logger
+
+# Общие параметры Locust (users, spawn-rate, run-time) и поля LoadShapeConfig, которые они задают
+COMMON_SHAPE_OPTIONS = {
+    "num_users": "users",
+    "spawn_rate": "spawn_rate",
+    "run_time": "run_time",
+}
+
+# Поля LoadShapeConfig, которые задаются параметрами --shape-<поле> в командной строке или .conf сценария
+SHAPE_OPTIONS = (
+    "step_users",
+    "step_duration",
+    "spike_multiplier",
+    "spike_start",
+    "spike_duration",
+    "ramp_duration",
+    "max_fail_ratio",
+    "max_p95",
+    "diurnal_profile",
+    "diurnal_period",
+    "knee_efficiency",
+    "knee_latency_factor",
+    "knee_report_file",
+)
+
+# Окно в секундах, за которое ramp оценивает долю ошибок и p95
+RAMP_WINDOW = 10
+
+logger = get_logger("LOCUST_SHAPE")
+
+
+@events.init_command_line_parser.add_listener
+def init_shape_arguments(parser: LocustArgumentParser) -> None:
+    """
+    Хук Locust: регистрирует параметры формы нагрузки, чтобы их можно было задать в .conf сценария
+    (например, load-shape = step, shape-step-users = 20). Незаданные параметры берутся из Settings (LOAD_SHAPE.*).
+    """
+    group = parser.add_argument_group("Load shape", "Форма нагрузки для ConfiguredLoadShape (tools.locust.shapes)")
+    group.add_argument(
+        "--load-shape",
+        choices=[kind.value for kind in LoadShapeKind],
+        default=None,
+        help=f"Форма нагрузки (по умолчанию LOAD_SHAPE.KIND={settings.load_shape.kind})"
+    )
+    for option in SHAPE_OPTIONS:
+        group.add_argument(
+            f"--shape-{option.replace('_', '-')}",
+            dest=f"shape_{option}",
+            default=None,
+            help=f"По умолчанию LOAD_SHAPE.{option.upper()}={getattr(settings.load_shape, option)}"
+        )
+
+
+def build_load_shape_config(environment: Environment | None) -> LoadShapeConfig:
+    """
+    Собирает параметры формы нагрузки: Settings (LOAD_SHAPE.*), поверх них users / spawn-rate / run-time
+    и --load-shape / --shape-* из командной строки или .conf сценария.
+
+    :param environment: Окружение Locust (может быть None или без parsed_options — тогда только Settings).
+    :return: Итоговая конфигурация формы нагрузки.
+    """
+    data = settings.load_shape.model_dump()
+    options = getattr(environment, "parsed_options", None)
+    if options is None:
+        return LoadShapeConfig.model_validate(data)
+
+    for option, field in COMMON_SHAPE_OPTIONS.items():
+        value = getattr(options, option, None)
+        if value:
+            data[field] = value
+
+    if getattr(options, "load_shape", None):
+        data["kind"] = options.load_shape
+
+    for option in SHAPE_OPTIONS:
+        value = getattr(options, f"shape_{option}", None)
+        if value is None:
+            continue
+        data[option] = value.split(",") if option == "diurnal_profile" else value
+
+    return LoadShapeConfig.model_validate(data)
+
+
+class BaseLoadShape(LoadTestShape):
+    """
+    Базовая форма нагрузки, параметризуемая через LoadShapeConfig.
+
+    Наследники описывают только целевую нагрузку в момент времени (get_target), а общая часть
+    (загрузка параметров, остановка по run-time) реализована здесь. Параметры читаются при первом tick,
+    когда у формы уже есть runner и разобранные параметры запуска.
+    """
+    abstract = True
+    # users / spawn-rate / run-time из .conf используются формой нагрузки, а не игнорируются Locust
+    use_common_options = True
+
+    def __init__(self):
+        super().__init__()
+        self.config: LoadShapeConfig | None = None
+
+    def get_config(self) -> LoadShapeConfig:
+        if self.config is None:
+            environment = self.runner.environment if self.runner else None
+            config = build_load_shape_config(environment)
+            if config.kind is not None and (config.users is None or config.spawn_rate is None):
+                raise ValueError(f"Load shape {config.kind} requires users and spawn-rate")
+
+            self.config = config
+            logger.info(f"Load shape: {self.config.model_dump_json()}")
+        return self.config
+
+    def get_target(self, run_time: float, config: LoadShapeConfig) -> tuple[int, float] | None:
+        """
+        :param run_time: Время с начала теста в секундах.
+        :param config: Параметры формы нагрузки.
+        :return: (количество пользователей, скорость запуска) или None, чтобы остановить тест.
+        """
+        raise NotImplementedError
+
+    def on_stop(self) -> None:
+        """
+        Вызывается, когда тест останавливается по run-time.
+        """
+
+    def tick(self) -> tuple[int, float] | None:
+        config = self.get_config()
+        run_time = self.get_run_time()
+        if config.run_time is not None and run_time >= config.run_time:
+            self.on_stop()
+            return None
+
+        return self.get_target(run_time, config)
+
+
+class FlatLoadShape(BaseLoadShape):
+    """
+    Разгон до users со скоростью spawn-rate и удержание до run-time — то же, что запуск без формы нагрузки.
+    """
+
+    def get_target(self, run_time: float, config: LoadShapeConfig) -> tuple[int, float] | None:
+        return config.users, config.spawn_rate
+
+
+class StepLoadShape(BaseLoadShape):
+    """
+    Ступенчатая нагрузка: каждые step_duration секунд добавляется step_users пользователей, но не больше users.
+    """
+
+    def get_target(self, run_time: float, config: LoadShapeConfig) -> tuple[int, float] | None:
+        step = int(run_time // config.step_duration) + 1
+        return min(step * config.step_users, config.users), config.spawn_rate
+
+
+class SpikeLoadShape(BaseLoadShape):
+    """
+    Базовая нагрузка users, с spike_start по spike_start + spike_duration — всплеск до users * spike_multiplier.
+    """
+
+    def get_target(self, run_time: float, config: LoadShapeConfig) -> tuple[int, float] | None:
+        if config.spike_start <= run_time < config.spike_start + config.spike_duration:
+            spike_users = math.ceil(config.users * config.spike_multiplier)
+            # Всплеск должен наступить сразу, поэтому пользователи запускаются за одну секунду
+            return spike_users, max(config.spawn_rate, spike_users - config.users)
+
+        return config.users, config.spawn_rate
+
+
+class SoakLoadShape(BaseLoadShape):
+    """
+    Длительная нагрузка: плавный разгон до users за ramp_duration секунд и удержание до run-time.
+    """
+
+    def get_target(self, run_time: float, config: LoadShapeConfig) -> tuple[int, float] | None:
+        if run_time < config.ramp_duration:
+            users = max(1, math.ceil(config.users * run_time / config.ramp_duration))
+            return users, config.users / config.ramp_duration
+
+        return config.users, config.spawn_rate
+
+
+class RampLoadShape(BaseLoadShape):
+    """
+    Рост нагрузки до точки отказа: ступени по step_users пользователей каждые step_duration секунд до users.
+
+    Тест останавливается, как только за очередное окно RAMP_WINDOW секунд доля ошибок превысила max_fail_ratio
+    или p95 какого-либо эндпоинта превысил max_p95 мс. Окна считаются по StatsSnapshot, как ступени knee,
+    поэтому служебные метрики в оценку не попадают. Количество пользователей в этот момент пишется в лог
+    и сохраняется в breaking_users. Первая ступень не проверяется, чтобы не остановиться на прогреве.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.breaking_users: int | None = None
+        self.snapshot: StatsSnapshot | None = None
+
+    def is_saturated(self, config: LoadShapeConfig) -> bool:
+        snapshot = StatsSnapshot(self.runner.stats)
+        if self.snapshot is None:
+            self.snapshot = snapshot
+            return False
+
+        if snapshot.time - self.snapshot.time < RAMP_WINDOW:
+            return False
+
+        window = build_step_result(self.snapshot, snapshot, users=self.get_current_user_count())
+        self.snapshot = snapshot
+        return window.fail_ratio > config.max_fail_ratio or window.p95 > config.max_p95
+
+    def get_target(self, run_time: float, config: LoadShapeConfig) -> tuple[int, float] | None:
+        if run_time >= config.step_duration and self.is_saturated(config):
+            self.breaking_users = self.get_current_user_count()
+            logger.info(f"Breaking point reached at {self.breaking_users} users after {run_time:.0f}s")
+            return None
+
+        step = int(run_time // config.step_duration) + 1
+        return min(step * config.step_users, config.users), config.spawn_rate
+
+
+class DiurnalLoadShape(BaseLoadShape):
+    """
+    Воспроизведение суточного профиля: diurnal_profile — доли от users по равным интервалам периода
+    diurnal_period секунд. Между точками нагрузка меняется линейно, после периода профиль повторяется.
+    """
+
+    def get_target(self, run_time: float, config: LoadShapeConfig) -> tuple[int, float] | None:
+        profile = config.diurnal_profile
+        position = (run_time % config.diurnal_period) / config.diurnal_period * len(profile)
+        index = int(position)
+        current, following = profile[index], profile[(index + 1) % len(profile)]
+        ratio = current + (following - current) * (position - index)
+        return max(1, round(config.users * ratio)), config.spawn_rate
+
+
+class KneeLoadShape(BaseLoadShape):
+    """
+    Поиск точки насыщения: ступени по step_users пользователей каждые step_duration секунд до users.
+
+    Во второй половине каждой ступени измеряются RPS, p95 и доля ошибок по эндпоинтам (см. KneeFinder).
+    Тест останавливается на ступени, где рост RPS отстал от роста пользователей, задержки резко выросли
+    или превышены max_fail_ratio / max_p95. Максимальный устойчивый RPS по эндпоинтам пишется в knee_report_file.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.finder: KneeFinder | None = None
+        self.step = 0
+
+    def get_step_users(self, step: int, config: LoadShapeConfig) -> int:
+        return min((step + 1) * config.step_users, config.users)
+
+    def get_target(self, run_time: float, config: LoadShapeConfig) -> tuple[int, float] | None:
+        if self.finder is None:
+            self.finder = KneeFinder(config)
+
+        step = int(run_time // config.step_duration)
+        if step > self.step:
+            finished_users = self.get_step_users(self.step, config)
+            self.step = step
+            if self.finder.finish_step(self.runner.stats, finished_users) or finished_users >= config.users:
+                self.finder.export()
+                return None
+        elif self.finder.snapshot is None and run_time % config.step_duration >= config.step_duration / 2:
+            self.finder.start_step(self.runner.stats)
+
+        return self.get_step_users(step, config), config.spawn_rate
+
+    def on_stop(self) -> None:
+        # Тест остановлен по run-time до точки насыщения — отчёт всё равно нужен
+        if self.finder is not None and not self.finder.exported:
+            self.finder.export()
+
+
+# Реализации форм нагрузки по значению LOAD_SHAPE.KIND / --load-shape
+LOAD_SHAPES: dict[LoadShapeKind, type[BaseLoadShape]] = {
+    LoadShapeKind.FLAT: FlatLoadShape,
+    LoadShapeKind.STEP: StepLoadShape,
+    LoadShapeKind.SPIKE: SpikeLoadShape,
+    LoadShapeKind.SOAK: SoakLoadShape,
+    LoadShapeKind.RAMP: RampLoadShape,
+    LoadShapeKind.DIURNAL: DiurnalLoadShape,
+    LoadShapeKind.KNEE: KneeLoadShape,
+}
+
+
+class ConfiguredLoadShape(BaseLoadShape):
+    """
+    Форма нагрузки, выбираемая параметром --load-shape в .conf сценария или LOAD_SHAPE.KIND.
+
+    Locust использует одну форму нагрузки на locustfile, поэтому сценарий импортирует только этот класс:
+
+        from tools.locust.shapes import ConfiguredLoadShape  # noqa: F401
+
+    Форма нагрузки включается только явно. Если не заданы ни --load-shape, ни LOAD_SHAPE.KIND,
+    хук init отключает её (см. disable_unconfigured_load_shape) и Locust работает как без формы нагрузки:
+    с users / spawn-rate / run-time из .conf, командной строки или веб-интерфейса.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.shape: BaseLoadShape | None = None
+
+    def get_target(self, run_time: float, config: LoadShapeConfig) -> tuple[int, float] | None:
+        if config.kind is None:
+            # Форма нагрузки выбрана в веб-интерфейсе, но не настроена
+            logger.warning("Load shape is not configured: set load-shape in .conf or LOAD_SHAPE.KIND")
+            return None
+
+        if self.shape is None:
+            self.shape = LOAD_SHAPES[config.kind]()
+            self.shape.runner = self.runner
+            self.shape.config = config
+
+        return self.shape.get_target(run_time, config)
+
+    def on_stop(self) -> None:
+        if self.shape is not None:
+            self.shape.on_stop()
+
+
+@events.init.add_listener
+def disable_unconfigured_load_shape(environment: Environment, **kwargs) -> None:
+    """
+    Хук Locust: отключает ConfiguredLoadShape, если форма нагрузки не задана ни в --load-shape, ни в LOAD_SHAPE.KIND.
+
+    Locust включает форму нагрузки, как только она импортирована в locustfile, поэтому без этого хука
+    каждый сценарий игнорировал бы users / spawn-rate из веб-интерфейса.
+    """
+    if not isinstance(environment.shape_class, ConfiguredLoadShape):
+        return
+
+    if build_load_shape_config(environment).kind is None:
+        environment.shape_class = None
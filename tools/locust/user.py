@@ -1,6 +1,10 @@
 from locust import User, between
 
 from config import settings  # ← импорт глобального объекта настроек
+from tools.config.locust import LocustLoadModel
+from tools.locust import histogram  # noqa: F401 — регистрирует хук HDR-гистограмм (HISTOGRAM.ENABLED)
+from tools.locust.fakers import init_user_fake_stream
+from tools.locust.schedule import constant_arrival_rate
 
 
 class LocustBaseUser(User):
@@ -10,7 +14,16 @@ class LocustBaseUser(User):
     """
     host: str = "localhost"
     abstract = True
-    wait_time = between(
-        min_wait=settings.locust_user.wait_time_min,
-        max_wait=settings.locust_user.wait_time_max
+    # Closed-модель: пауза между задачами; open-модель (LOCUST_USER.LOAD_MODEL=open): фиксированное расписание
+    wait_time = (
+        constant_arrival_rate(settings.locust_user.arrival_rate)
+        if settings.locust_user.load_model == LocustLoadModel.OPEN
+        else between(
+            min_wait=settings.locust_user.wait_time_min,
+            max_wait=settings.locust_user.wait_time_max
+        )
     )
+
+    def on_start(self) -> None:
+        # При FAKERS.SEED у каждого виртуального пользователя свой детерминированный поток тестовых данных
+        init_user_fake_stream(self)